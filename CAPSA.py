@@ -30,88 +30,667 @@ CAPSA MVP 시스템 구조 설계 (Pythonic Pseudo-code & 시스템 다이어그
     └──> [Community Bulletin] <─── [Admin CMS] <─── [Admin]
 """
 
-from datetime import datetime
+import sys
+from array import array
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from heapq import merge
+
+# 데이터 모델 (간단 예시). id는 AdminCMS에 등록될 때 부여됨
+# __slots__로 레코드마다 속성 dict를 두지 않고, 값 종류가 적은 문자열은 intern해서 공유
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
 
-# 데이터 모델 (간단 예시)
 class JobPost:
+    __slots__ = ('id', 'title', 'company', 'location', 'apply_url', 'description', 'posted_at')
+
     def __init__(self, title, company, location, apply_url, description, posted_at):
+        self.id = None
         self.title = title
-        self.company = company
-        self.location = location
+        self.company = _intern(company)
+        self.location = _intern(location)
         self.apply_url = apply_url
         self.description = description
         self.posted_at = posted_at
 
 class StakeholderRequest:
+    __slots__ = ('id', 'name', 'email', 'company', 'role', 'help_type', 'description', 'submitted_at', 'status')
+
     def __init__(self, name, email, company, role, help_type, description, submitted_at, status="Pending"):
+        self.id = None
         self.name = name
         self.email = email
-        self.company = company
-        self.role = role
-        self.help_type = help_type
+        self.company = _intern(company)
+        self.role = _intern(role)
+        self.help_type = _intern(help_type)
         self.description = description
         self.submitted_at = submitted_at
-        self.status = status  # Pending, In Progress, Completed
+        self.status = _intern(status)  # Pending, In Progress, Completed
 
 class Announcement:
+    __slots__ = ('id', 'title', 'content', 'pinned', 'posted_at')
+
     def __init__(self, title, content, pinned=False, posted_at=None):
+        self.id = None
         self.title = title
         self.content = content
         self.pinned = pinned
         self.posted_at = posted_at
 
+
+# 열(column) 단위 저장소
+_EPOCH = datetime(1970, 1, 1)
+_NO_TIME = -(2 ** 63)  # datetime 열의 None
+
+
+class ColumnarTable:
+    """
+    레코드를 열별 배열로 저장하는 읽기 위주 테이블 (대량 스냅샷 보관용)
+
+    columns: {필드: 종류}
+    - 'str': 문자열 리스트
+    - 'interned': intern한 문자열 리스트 (location/company/status처럼 중복이 많은 값)
+    - 'bool': bytearray
+    - 'datetime': array('q') 마이크로초 (None 허용, ISO 문자열은 datetime으로 변환)
+    id는 array('q')에 오름차순으로 두고 이진 탐색으로 찾음 (id -> 행 dict 없음).
+    레코드에 id가 있으면 그대로 쓰고(AdminCMS 스냅샷), 없으면 마지막 id + 1.
+    삭제는 표시만 함. get()/iter는 model 객체를 새로 만들어 반환.
+    """
+
+    def __init__(self, model, columns):
+        self.model = model
+        self.kinds = dict(columns)
+        self._columns = {}
+        for field, kind in self.kinds.items():
+            if kind == 'bool':
+                self._columns[field] = bytearray()
+            elif kind == 'datetime':
+                self._columns[field] = array('q')
+            elif kind in ('str', 'interned'):
+                self._columns[field] = []
+            else:
+                raise ValueError(f"알 수 없는 열 종류: {kind}")
+        self._ids = array('q')
+        self._deleted = bytearray()
+        self._live = 0
+
+    @classmethod
+    def from_records(cls, model, columns, records):
+        table = cls(model, columns)
+        for record in records:
+            table.append(record)
+        return table
+
+    def __len__(self):
+        return self._live
+
+    @staticmethod
+    def _encode_datetime(value):
+        if value is None:
+            return _NO_TIME
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // timedelta(microseconds=1)
+
+    def _decode(self, field, row):
+        value = self._columns[field][row]
+        kind = self.kinds[field]
+        if kind == 'datetime':
+            return None if value == _NO_TIME else _EPOCH + timedelta(microseconds=value)
+        if kind == 'bool':
+            return bool(value)
+        return value
+
+    def append(self, record):
+        record_id = getattr(record, 'id', None)
+        last_id = self._ids[-1] if self._ids else 0
+        if record_id is None:
+            record_id = last_id + 1
+        elif record_id <= last_id:
+            raise ValueError(f"id는 오름차순으로 추가해야 함: {record_id}")
+        for field, kind in self.kinds.items():
+            value = getattr(record, field)
+            if kind == 'datetime':
+                value = self._encode_datetime(value)
+            elif kind == 'bool':
+                value = 1 if value else 0
+            elif kind == 'interned':
+                value = _intern(value)
+            self._columns[field].append(value)
+        self._ids.append(record_id)
+        self._deleted.append(0)
+        self._live += 1
+        return record_id
+
+    def _row(self, record_id):
+        row = bisect_left(self._ids, record_id)
+        if row == len(self._ids) or self._ids[row] != record_id or self._deleted[row]:
+            raise KeyError(f"존재하지 않는 id: {record_id}")
+        return row
+
+    def value(self, record_id, field):
+        return self._decode(field, self._row(record_id))
+
+    def _record(self, row):
+        record = self.model.__new__(self.model)
+        for field in self.kinds:
+            setattr(record, field, self._decode(field, row))
+        record.id = self._ids[row]
+        return record
+
+    def get(self, record_id):
+        return self._record(self._row(record_id))
+
+    def delete(self, record_id):
+        self._deleted[self._row(record_id)] = 1
+        self._live -= 1
+
+    def ids(self):
+        return (self._ids[row] for row, deleted in enumerate(self._deleted) if not deleted)
+
+    def __iter__(self):
+        return (self._record(row) for row, deleted in enumerate(self._deleted) if not deleted)
+
+    def column(self, field):
+        """열 원본 배열 (datetime은 마이크로초 정수, bool은 0/1, 삭제된 행 포함)"""
+        return self._columns[field]
+
+
+JOB_COLUMNS = {
+    'title': 'str', 'company': 'interned', 'location': 'interned',
+    'apply_url': 'str', 'description': 'str', 'posted_at': 'datetime',
+}
+REQUEST_COLUMNS = {
+    'name': 'str', 'email': 'str', 'company': 'interned', 'role': 'interned',
+    'help_type': 'interned', 'description': 'str', 'submitted_at': 'datetime', 'status': 'interned',
+}
+ANNOUNCEMENT_COLUMNS = {'title': 'str', 'content': 'str', 'pinned': 'bool', 'posted_at': 'datetime'}
+
+
+# 인덱스 저장소
+# 정렬 인덱스 대기 항목이 이보다 적으면 하나씩 끼워 넣고, 많으면 전체를 다시 정렬
+SORTED_MERGE_THRESHOLD = 64
+
+
+def _sort_key(value):
+    # None은 가장 오래된 값으로 취급 (서로 다른 타입과 비교하지 않도록 감쌈)
+    return (0,) if value is None else (1, value)
+
+
+class _BaseIds:
+    """기반 테이블의 정렬된 id 목록 (가려진 id 제외)"""
+
+    def __init__(self, ids, shadowed):
+        self.ids = ids
+        self.shadowed = shadowed
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, record_id):
+        if record_id in self.shadowed:
+            return False
+        pos = bisect_left(self.ids, record_id)
+        return pos < len(self.ids) and self.ids[pos] == record_id
+
+    def to_set(self):
+        ids = set(self.ids)
+        if self.shadowed:
+            ids -= self.shadowed
+        return ids
+
+
+class _Bucket:
+    """해시 인덱스 조회 결과 (overlay 집합과 기반 id 목록의 합집합, 필요할 때만 set으로)"""
+
+    def __init__(self, parts):
+        self.parts = parts
+
+    def __len__(self):
+        return sum(len(part) for part in self.parts)
+
+    def __contains__(self, record_id):
+        return any(record_id in part for part in self.parts)
+
+    def to_set(self):
+        ids = set()
+        for part in self.parts:
+            ids |= part.to_set() if isinstance(part, _BaseIds) else part
+        return ids
+
+
+class IndexedTable:
+    """
+    id -> 레코드 저장소 + 보조 인덱스
+
+    - id는 1부터 증가하며 삭제되어도 재사용하지 않음 (위치가 밀리지 않음)
+    - hash_fields: 값 -> id 집합 (동등/IN 조건)
+    - sorted_fields: (정렬 키, id) 정렬 리스트 (정렬/범위 순회). 등록은 대기 목록에
+      쌓아 두었다가 조회할 때 한 번에 반영 (대량 적재 시 삽입마다 리스트를 밀지 않음)
+    - query()는 해시 인덱스 교집합을 작은 집합부터 계산하고, 인덱스가 없는
+      조건만 후보에 대해 직접 비교
+
+    base: 읽기 전용 기반 테이블 (예: cms_store.SnapshotTable). 변경된 레코드만
+    이 테이블(overlay)로 옮기고 기반의 해당 id는 가림 처리. 기반 테이블은
+    get/value/ids/__len__/__contains__/next_id와 hash_ids(field, value)(id 오름차순),
+    sorted_ids(field, descending)를 제공해야 함.
+    """
+
+    def __init__(self, hash_fields=(), sorted_fields=(), base=None):
+        self._records = {}
+        self._next_id = 1
+        self._hash = {field: {} for field in hash_fields}
+        self._sorted = {field: [] for field in sorted_fields}
+        self._unsorted = {field: [] for field in sorted_fields}
+        # id -> 인덱스에 넣을 때의 (해시 값들, 정렬 키들). 호출한 쪽이 get()으로 받은 객체를
+        # 직접 고친 뒤 replace해도 넣었던 키로 지울 수 있게 함
+        self._keys = {}
+        self._base = None
+        self._shadowed = set()  # 삭제되었거나 overlay로 옮겨진 기반 id
+        if base is not None:
+            self.attach_base(base)
+
+    @property
+    def hash_fields(self):
+        return tuple(self._hash)
+
+    @property
+    def sorted_fields(self):
+        return tuple(self._sorted)
+
+    @property
+    def next_id(self):
+        return self._next_id
+
+    def attach_base(self, base):
+        """기반 테이블 연결 (overlay는 비움)"""
+        self._records.clear()
+        self._keys.clear()
+        for index in self._hash.values():
+            index.clear()
+        for field in self._sorted:
+            self._sorted[field].clear()
+            self._unsorted[field].clear()
+        self._base = base
+        self._shadowed = set()
+        self._next_id = max(1, base.next_id)
+
+    def _base_has(self, record_id):
+        return self._base is not None and record_id not in self._shadowed and record_id in self._base
+
+    def __len__(self):
+        base_count = len(self._base) - len(self._shadowed) if self._base is not None else 0
+        return len(self._records) + base_count
+
+    def _all_ids(self):
+        """모든 id (오름차순)"""
+        if self._base is None:
+            return sorted(self._records)
+        base_ids = (rid for rid in self._base.ids() if rid not in self._shadowed)
+        return merge(base_ids, sorted(self._records))
+
+    def __iter__(self):
+        # 등록(id) 순서
+        return (self.get(rid) for rid in list(self._all_ids()))
+
+    def __contains__(self, record_id):
+        return record_id in self._records or self._base_has(record_id)
+
+    def get(self, record_id):
+        record = self._records.get(record_id)
+        if record is not None:
+            return record
+        if self._base_has(record_id):
+            return self._base.get(record_id)
+        raise KeyError(f"존재하지 않는 id: {record_id}")
+
+    def _field_value(self, record_id, field):
+        """레코드 전체를 만들지 않고 필드 하나만 읽음 (기반 테이블 레코드)"""
+        record = self._records.get(record_id)
+        if record is not None:
+            return getattr(record, field, None)
+        if self._base_has(record_id):
+            return self._base.value(record_id, field)
+        raise KeyError(f"존재하지 않는 id: {record_id}")
+
+    def _add_to_indexes(self, record_id, record):
+        hash_values = tuple(getattr(record, field, None) for field in self._hash)
+        sort_keys = tuple(_sort_key(getattr(record, field, None)) for field in self._sorted)
+        for index, value in zip(self._hash.values(), hash_values):
+            index.setdefault(value, set()).add(record_id)
+        for pending, key in zip(self._unsorted.values(), sort_keys):
+            pending.append((key, record_id))
+        self._keys[record_id] = (hash_values, sort_keys)
+
+    def _sorted_index(self, field):
+        """대기 중인 항목을 반영한 정렬 인덱스"""
+        index = self._sorted[field]
+        pending = self._unsorted[field]
+        if pending:
+            if len(pending) < SORTED_MERGE_THRESHOLD:
+                for entry in pending:
+                    insort(index, entry)
+            else:
+                # 많이 쌓였으면 이어 붙여 정렬 (이미 정렬된 구간은 timsort가 병합만 함)
+                index.extend(pending)
+                index.sort()
+            pending.clear()
+        return index
+
+    def _remove_from_indexes(self, record_id):
+        hash_values, sort_keys = self._keys.pop(record_id)
+        for index, value in zip(self._hash.values(), hash_values):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.discard(record_id)
+                if not bucket:
+                    del index[value]
+        for field, key in zip(self._sorted, sort_keys):
+            index = self._sorted_index(field)
+            entry = (key, record_id)
+            pos = bisect_left(index, entry)
+            if pos < len(index) and index[pos] == entry:
+                del index[pos]
+
+    def _detach(self, record_id):
+        """변경할 레코드를 overlay에서 빼거나 기반에서 가림. 기존 레코드 반환"""
+        record = self._records.pop(record_id, None)
+        if record is not None:
+            self._remove_from_indexes(record_id)
+            return record
+        if self._base_has(record_id):
+            self._shadowed.add(record_id)
+            return self._base.get(record_id)
+        raise KeyError(f"존재하지 않는 id: {record_id}")
+
+    def _attach(self, record_id, record):
+        record.id = record_id
+        self._records[record_id] = record
+        self._add_to_indexes(record_id, record)
+
+    def insert(self, record):
+        record_id = self._next_id
+        self._next_id += 1
+        self._attach(record_id, record)
+        return record_id
+
+    def replace(self, record_id, record):
+        self._detach(record_id)
+        self._attach(record_id, record)
+
+    def set_field(self, record_id, field, value):
+        """인덱스를 유지하면서 필드 하나만 변경"""
+        record = self._detach(record_id)
+        setattr(record, field, value)
+        self._attach(record_id, record)
+
+    def delete(self, record_id):
+        return self._detach(record_id)
+
+    def _bucket(self, field, values):
+        parts = []
+        for value in values:
+            overlay = self._hash[field].get(value)
+            if overlay:
+                parts.append(overlay)
+            if self._base is not None:
+                base_ids = self._base.hash_ids(field, value)
+                if base_ids:
+                    parts.append(_BaseIds(base_ids, self._shadowed))
+        return _Bucket(parts)
+
+    def _candidate_ids(self, filters):
+        """해시 인덱스로 걸러낸 id 집합 (인덱스 조건이 없으면 None)과 나머지 조건"""
+        buckets = []
+        residual = {}
+        for field, value in filters.items():
+            if field not in self._hash:
+                residual[field] = value
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                # IN 조건: 값별 id 집합의 합집합
+                buckets.append(self._bucket(field, value))
+            else:
+                buckets.append(self._bucket(field, (value,)))
+        if not buckets:
+            return None, residual
+        buckets.sort(key=len)
+        candidates = buckets[0].to_set()
+        for bucket in buckets[1:]:
+            if len(bucket) > len(candidates) * 8:
+                # 큰 집합은 만들지 않고 후보마다 포함 여부만 확인
+                candidates = {rid for rid in candidates if rid in bucket}
+            else:
+                candidates &= bucket.to_set()
+        return candidates, residual
+
+    @staticmethod
+    def _matches(record, residual):
+        for field, value in residual.items():
+            actual = getattr(record, field, None)
+            if isinstance(value, (list, tuple, set, frozenset)):
+                if actual not in value:
+                    return False
+            elif actual != value:
+                return False
+        return True
+
+    def _sorted_entries(self, field, descending):
+        """(정렬 키, id)를 정렬 순서대로 (overlay와 기반을 병합)"""
+        index = self._sorted_index(field)
+        overlay = reversed(index) if descending else iter(index)
+        if self._base is None:
+            return overlay
+        shadowed = self._shadowed
+        base = ((_sort_key(value), rid) for value, rid in self._base.sorted_ids(field, descending)
+                if rid not in shadowed)
+        return merge(base, overlay, reverse=descending)
+
+    def query(self, filters=None, order_by=None, descending=False, limit=None, offset=0):
+        """
+        filters: {필드: 값 또는 값 목록}
+        order_by: 정렬 필드 (sorted_fields면 인덱스 순회, 아니면 후보만 정렬)
+        """
+        candidates, residual = self._candidate_ids(filters or {})
+        get = self.get
+
+        def sort_key(rid):
+            return _sort_key(self._field_value(rid, order_by)), rid
+
+        if order_by in self._sorted:
+            # 인덱스 순회로 찾을 때 예상 단계 수 (후보 비율의 역수 x 필요한 건수)
+            walk_steps = None
+            if candidates is not None and limit is not None and not residual:
+                walk_steps = (offset + limit) * len(self) / max(len(candidates), 1)
+            if candidates is not None and (walk_steps is None or walk_steps > len(candidates)) \
+                    and len(candidates) * 4 < len(self):
+                # 후보가 적으면 후보만 정렬
+                ordered = sorted(candidates, key=sort_key, reverse=descending)
+            else:
+                entries = self._sorted_entries(order_by, descending)
+                ordered = (rid for _, rid in entries if candidates is None or rid in candidates)
+        elif order_by is not None:
+            ordered = sorted(self._all_ids() if candidates is None else candidates,
+                             key=sort_key, reverse=descending)
+        elif candidates is None:
+            ordered = self._all_ids()
+        else:
+            ordered = sorted(candidates)
+
+        result = []
+        skipped = 0
+        for rid in ordered:
+            record = get(rid)
+            if residual and not self._matches(record, residual):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            result.append(record)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def count(self, filters=None):
+        candidates, residual = self._candidate_ids(filters or {})
+        if not residual:
+            return len(self) if candidates is None else len(candidates)
+        ids = self._all_ids() if candidates is None else candidates
+        return sum(1 for rid in ids if self._matches(self.get(rid), residual))
+
+
+class BulletinFeed:
+    """
+    커뮤니티 공지 피드 순서 (고정 글 먼저, 그 안에서 최신순)를 항상 정렬된 상태로 유지
+
+    고정/일반 그룹마다 (_sort_key(posted_at), id) 오름차순 목록을 두고 등록/수정/고정
+    변경 시 그 자리에 끼워 넣음. 페이지 조회는 커서 위치를 이분 탐색한 뒤 뒤에서부터
+    limit개만 읽음 (전체 정렬 없음). 레코드는 table에서 id로 꺼냄.
+
+    커서는 마지막으로 본 글의 (pinned, posted_at, id).
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self._groups = {True: [], False: []}
+        self._keys = {}  # id -> (pinned, 정렬 키)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def rebuild(self):
+        """table 전체로 다시 만듦 (로그 재생처럼 table을 직접 바꾼 뒤)"""
+        self._groups = {True: [], False: []}
+        self._keys = {}
+        for record_id in self.table._all_ids():
+            pinned = bool(self.table._field_value(record_id, 'pinned'))
+            key = (_sort_key(self.table._field_value(record_id, 'posted_at')), record_id)
+            self._groups[pinned].append(key)
+            self._keys[record_id] = (pinned, key)
+        for entries in self._groups.values():
+            entries.sort()
+
+    def add(self, record_id):
+        record = self.table.get(record_id)
+        pinned = bool(record.pinned)
+        key = (_sort_key(record.posted_at), record_id)
+        insort(self._groups[pinned], key)
+        self._keys[record_id] = (pinned, key)
+
+    def remove(self, record_id):
+        pinned, key = self._keys.pop(record_id)
+        entries = self._groups[pinned]
+        del entries[bisect_left(entries, key)]
+
+    def page(self, limit, cursor=None):
+        """커서 다음 limit개와 다음 커서 반환 (더 없으면 None)"""
+        picked = []
+        for pinned in (True, False):
+            entries = self._groups[pinned]
+            end = len(entries)
+            if cursor is not None:
+                cursor_pinned, posted_at, cursor_id = cursor
+                if pinned and not cursor_pinned:
+                    continue  # 고정 글은 이미 다 봤음
+                if pinned == bool(cursor_pinned):
+                    end = bisect_left(entries, (_sort_key(posted_at), cursor_id))
+            for index in range(end - 1, -1, -1):
+                if len(picked) > limit:
+                    break
+                picked.append(entries[index][1])
+        items = [self.table.get(record_id) for record_id in picked[:limit]]
+        next_cursor = None
+        if len(picked) > limit and items:
+            last = items[-1]
+            next_cursor = (bool(last.pinned), last.posted_at, last.id)
+        return items, next_cursor
+
+    def top(self, limit=None):
+        """첫 페이지 (limit이 None이면 전체)"""
+        return self.page(len(self) if limit is None else limit)[0]
+
+    def __iter__(self):
+        return iter(self.top())
+
+
 # 관리자 CMS (수동 큐레이션)
 class AdminCMS:
-    def __init__(self):
-        self.job_posts = []
-        self.announcements = []
-        self.stakeholder_requests = []
+    def __init__(self, notifier=None):
+        self.job_posts = IndexedTable(hash_fields=('location', 'company'), sorted_fields=('posted_at',))
+        self.announcements = IndexedTable(hash_fields=('pinned',), sorted_fields=('posted_at',))
+        self.bulletin = BulletinFeed(self.announcements)
+        self.stakeholder_requests = IndexedTable(hash_fields=('help_type', 'status', 'company'),
+                                                 sorted_fields=('submitted_at',))
+        # notifier: 요청을 받아 비동기 발송 큐에 넣는 콜러블 (예: app.py의 outbox 적재)
+        self.notifier = notifier
 
-    # Job CRUD
+    # Job CRUD (id는 등록 시 부여되고 삭제되어도 바뀌지 않음)
     def create_job(self, job_post):
-        self.job_posts.append(job_post)
-    def update_job(self, idx, job_post):
-        self.job_posts[idx] = job_post
-    def delete_job(self, idx):
-        del self.job_posts[idx]
+        return self.job_posts.insert(job_post)
+    def update_job(self, job_id, job_post):
+        self.job_posts.replace(job_id, job_post)
+    def delete_job(self, job_id):
+        self.job_posts.delete(job_id)
+    def find_jobs(self, filters=None, limit=None, offset=0):
+        """필터에 맞는 채용공고 (최신순)"""
+        return self.job_posts.query(filters, order_by='posted_at', descending=True, limit=limit, offset=offset)
 
-    # Announcement CRUD
+    def job_snapshot(self):
+        """현재 채용공고 전체를 열 단위 테이블로 복사 (id 유지, 메모리 절약용 읽기 전용 사본)"""
+        return ColumnarTable.from_records(JobPost, JOB_COLUMNS, self.job_posts)
+
+    # Announcement CRUD (피드 순서도 함께 갱신)
     def create_announcement(self, announcement):
-        self.announcements.append(announcement)
-    def update_announcement(self, idx, announcement):
-        self.announcements[idx] = announcement
-    def delete_announcement(self, idx):
-        del self.announcements[idx]
-    def pin_announcement(self, idx, pinned=True):
-        self.announcements[idx].pinned = pinned
+        announcement_id = self.announcements.insert(announcement)
+        self.bulletin.add(announcement_id)
+        return announcement_id
+    def update_announcement(self, announcement_id, announcement):
+        self.bulletin.remove(announcement_id)
+        self.announcements.replace(announcement_id, announcement)
+        self.bulletin.add(announcement_id)
+    def delete_announcement(self, announcement_id):
+        self.bulletin.remove(announcement_id)
+        self.announcements.delete(announcement_id)
+    def pin_announcement(self, announcement_id, pinned=True):
+        self.bulletin.remove(announcement_id)
+        self.announcements.set_field(announcement_id, 'pinned', pinned)
+        self.bulletin.add(announcement_id)
 
     # Stakeholder Request 관리
     def receive_stakeholder_request(self, request):
-        self.stakeholder_requests.append(request)
+        request_id = self.stakeholder_requests.insert(request)
         self.notify_admin(request)
+        return request_id
 
     def notify_admin(self, request):
-        # 실제 구현에서는 이메일 발송
+        # 실제 발송은 큐에 위임해서 요청 처리를 막지 않음
+        if self.notifier is not None:
+            self.notifier(request)
+            return
         print(f"[알림] 새로운 Stakeholder 요청: {request.name}, {request.email}")
 
-    def update_request_status(self, idx, status):
-        self.stakeholder_requests[idx].status = status
+    def update_request_status(self, request_id, status):
+        self.stakeholder_requests.set_field(request_id, 'status', status)
+
+    def find_requests(self, filters=None, limit=None, offset=0):
+        """필터에 맞는 요청 (최근 접수순)"""
+        return self.stakeholder_requests.query(filters, order_by='submitted_at', descending=True,
+                                               limit=limit, offset=offset)
 
 # 공개 Job Board (필터/검색 포함)
 def public_job_board(job_posts, filters=None):
-    # filters: {'location': 'US', 'role': 'PM'}
-    filtered = []
-    for job in job_posts:
-        match = True
-        if filters:
-            for k, v in filters.items():
-                if getattr(job, k, None) != v:
-                    match = False
-        if match:
-            filtered.append(job)
+    # filters: {'location': 'US', 'company': 'TechCorp'}
+    if isinstance(job_posts, IndexedTable):
+        # 인덱스 교집합으로 조회 (전체 순회 없음)
+        filtered = job_posts.query(filters)
+    else:
+        filtered = [job for job in job_posts
+                    if all(getattr(job, k, None) == v for k, v in (filters or {}).items())]
     # 카드 형태로 출력 (실제 구현은 프론트엔드)
     for job in filtered:
         print(f"{job.title} @ {job.company} ({job.location}) - [Apply]({job.apply_url})")
+    return filtered
 
 # Stakeholder Hub (Request Intro 폼)
 def stakeholder_hub_submit(cms, name, email, company, role, help_type, description):
@@ -122,12 +701,17 @@ def stakeholder_hub_submit(cms, name, email, company, role, help_type, descripti
     print("요청이 접수되었습니다. 확인 이메일을 곧 받게 됩니다.")
 
 # Community Bulletin (공지/이벤트)
-def public_bulletin(announcements):
+def public_bulletin(announcements, limit=None):
     # 핀된 글 먼저, 그 다음 최신순
-    pinned = [a for a in announcements if a.pinned]
-    others = sorted([a for a in announcements if not a.pinned], key=lambda x: x.posted_at, reverse=True)
-    for a in pinned + others:
+    if isinstance(announcements, BulletinFeed):
+        # 이미 정렬된 피드에서 앞부분만 읽음
+        ordered = announcements.top(limit)
+    else:
+        ordered = sorted(announcements, key=lambda x: (bool(x.pinned), _sort_key(x.posted_at), x.id or 0),
+                         reverse=True)[:limit]
+    for a in ordered:
         print(f"{'[PINNED] ' if a.pinned else ''}{a.title} - {a.posted_at}")
+    return ordered
 
 # ============================================================================
 # 실행 가능한 데모 코드
@@ -163,7 +747,7 @@ if __name__ == "__main__":
     req1 = StakeholderRequest("김멘토", "mentor@example.com", "대기업", "Senior Manager", "Career Advice", "커리어 전환에 대한 조언이 필요합니다", datetime.now())
     req2 = StakeholderRequest("박엔젤", "angel@example.com", "벤처캐피탈", "Partner", "Investment", "스타트업 투자에 관심이 있습니다", datetime.now())
     
-    cms.receive_stakeholder_request(req1)
+    req1_id = cms.receive_stakeholder_request(req1)
     cms.receive_stakeholder_request(req2)
     
     print("✅ 샘플 데이터 생성 완료!")
@@ -185,18 +769,18 @@ if __name__ == "__main__":
     print("\n" + "=" * 50)
     print("📢 3. Community Bulletin")
     print("=" * 50)
-    public_bulletin(cms.announcements)
+    public_bulletin(cms.bulletin)
     
     print("\n" + "=" * 50)
     print("👥 4. Stakeholder Requests 현황")
     print("=" * 50)
-    for i, req in enumerate(cms.stakeholder_requests):
-        print(f"[{i+1}] {req.name} ({req.company}) - {req.help_type}: {req.status}")
+    for req in cms.stakeholder_requests:
+        print(f"[{req.id}] {req.name} ({req.company}) - {req.help_type}: {req.status}")
     
     print("\n" + "=" * 50)
     print("🔄 5. Request 상태 업데이트")
     print("=" * 50)
-    cms.update_request_status(0, "In Progress")
+    cms.update_request_status(req1_id, "In Progress")
     print("김멘토의 요청 상태를 'In Progress'로 업데이트했습니다.")
     
     print("\n" + "=" * 50)
@@ -1,14 +1,76 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+from flask import Flask, Response, current_app, render_template, request, redirect, url_for, flash, session, \
+    jsonify, make_response, stream_with_context
+from flask.cli import with_appcontext
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from sqlalchemy import event, func, text, tuple_
+from sqlalchemy.orm import joinedload, selectinload, validates
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+from datetime import datetime, timedelta
+import base64
+import binascii
+import csv
+import hashlib
+import hmac
+import io
+import json
 import os
+import threading
+import weakref
 
-app = Flask(__name__)
-app.config['SECRET_KEY'] = 'capsa-secret-key-2024'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///capsa.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+import click
 
-db = SQLAlchemy(app)
+import job_search
+from metrics import RequestMetrics
+from lazy_loads import LazyLoadDetector
+from expert_match import MAX_TOP_K as EXPERT_MATCH_MAX_K, ExpertMatching, split_help_types
+from job_recommend import JobRecommender
+from job_import import FORMATS as JOB_IMPORT_FORMATS, JobImporter, detect_format, text_stream
+from notifications import NotificationQueue, stakeholder_request_message
+from assets import StaticAssets
+from db_profile import DatabaseProfile
+from page_cache import PageCache
+from rate_limit import LoginRateLimiter
+
+# 확장은 앱 없이 만들어 두고 create_app()에서 연결
+database_profile = DatabaseProfile()
+db = SQLAlchemy()
+page_cache = PageCache()
+static_assets = StaticAssets()
+login_limiter = LoginRateLimiter()
+request_metrics = RequestMetrics()
+lazy_loads = LazyLoadDetector()
+
+# 모델/인덱스/기본 데이터가 바뀌면 올림 (ensure_schema가 DB마다 한 번 반영)
+SCHEMA_VERSION = 3
+
+JOBS_PER_PAGE = 20
+ANNOUNCEMENTS_PER_PAGE = 10
+ADMIN_PER_PAGE = 20
+ADMIN_MAX_PER_PAGE = 100
+REQUEST_STATUSES = ('Pending', 'In Progress', 'Completed')
+# 도움 유형 (stakeholder_hub.html 선택지와 같은 값). 전문가는 여러 개를 고를 수 있음
+HELP_TYPES = (
+    ('Mentoring', '멘토링/커리어 조언'),
+    ('Investment', '투자/자금 조달'),
+    ('Consulting', '컨설팅/전략 수립'),
+    ('Networking', '네트워킹/연결'),
+    ('Technical', '기술적 도움'),
+    ('Business', '비즈니스 모델 검토'),
+    ('Other', '기타'),
+)
+API_PER_PAGE = 20
+API_MAX_PER_PAGE = 100
+# 비슷한 공고/추천 공고 기본 개수 (최대는 JOB_RECOMMEND_K)
+RECOMMEND_PER_PAGE = 6
+EXPORT_CHUNK_SIZE = 500
+EXPORT_FORMATS = {'csv': 'text/csv; charset=utf-8', 'jsonl': 'application/x-ndjson; charset=utf-8'}
+
+def normalize_location(location):
+    """위치 문자열을 지역 비교용 키로 정규화 (예: 'Seoul, Korea' -> 'seoul')"""
+    if not location:
+        return ''
+    head = location.split(',')[0]
+    return ' '.join(head.split()).lower()
 
 # 데이터베이스 모델
 class JobPost(db.Model):
@@ -16,10 +78,52 @@ class JobPost(db.Model):
     title = db.Column(db.String(100), nullable=False)
     company = db.Column(db.String(100), nullable=False)
     location = db.Column(db.String(100), nullable=False)
+    # 정규화한 위치 (추천 색인의 같은 지역 비교용. 목록 필터는 job_search.location_condition)
+    location_key = db.Column(db.String(100), nullable=False, default='')
     apply_url = db.Column(db.String(500), nullable=False)
     description = db.Column(db.Text, nullable=False)
     posted_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # 공개 API에서 선택할 수 있는 필드
+    API_FIELDS = ('id', 'title', 'company', 'location', 'apply_url', 'description', 'posted_at')
+    # 화면별로 함께 읽을 관계 (list_query/list_select). 예: {'jobs': ('company_profile', 'tags')}
+    EAGER_LOADS = {}
+
+    __table_args__ = (
+        db.Index('ix_job_post_posted_at_id', 'posted_at', 'id'),
+        db.Index('ix_job_post_location_key_posted_at_id', 'location_key', 'posted_at', 'id'),
+        # 일괄 등록 중복 확인 (company, title, apply_url)
+        db.Index('ix_job_post_apply_url_company_title', 'apply_url', 'company', 'title'),
+    )
+
+    @validates('location')
+    def _sync_location_key(self, key, value):
+        self.location_key = normalize_location(value)
+        return value
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'company': self.company,
+            'location': self.location,
+            'apply_url': self.apply_url,
+            'description': self.description,
+            'posted_at': self.posted_at.isoformat() if self.posted_at else None,
+        }
+
+# 채용공고 변경 시 전문 검색 색인을 같은 트랜잭션에서 갱신
+@event.listens_for(JobPost, 'after_insert')
+@event.listens_for(JobPost, 'after_update')
+def _index_job(mapper, connection, target):
+    if job_search.is_supported(connection):
+        job_search.index_job(connection, target)
+
+@event.listens_for(JobPost, 'after_delete')
+def _unindex_job(mapper, connection, target):
+    if job_search.is_supported(connection):
+        job_search.remove_job(connection, target.id)
+
 class Announcement(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
@@ -27,6 +131,23 @@ class Announcement(db.Model):
     pinned = db.Column(db.Boolean, default=False)
     posted_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    API_FIELDS = ('id', 'title', 'content', 'pinned', 'posted_at')
+    EAGER_LOADS = {}
+
+    # 커뮤니티 피드 순서 (고정 글 먼저, 최신순) 키셋 조회용
+    __table_args__ = (
+        db.Index('ix_announcement_pinned_posted_at_id', 'pinned', 'posted_at', 'id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'content': self.content,
+            'pinned': bool(self.pinned),
+            'posted_at': self.posted_at.isoformat() if self.posted_at else None,
+        }
+
 class StakeholderRequest(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -36,40 +157,347 @@ class StakeholderRequest(db.Model):
     help_type = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
-    status = db.Column(db.String(50), default='Pending')
+    status = db.Column(db.String(50), default='Pending', index=True)
+
+    # 내보내기: 기간/상태 조건으로 접수순 키셋 순회
+    __table_args__ = (
+        db.Index('ix_stakeholder_request_submitted_at_id', 'submitted_at', 'id'),
+        db.Index('ix_stakeholder_request_status_submitted_at_id', 'status', 'submitted_at', 'id'),
+    )
+
+    # 내보내기 컬럼 순서
+    EXPORT_FIELDS = ('id', 'name', 'email', 'company', 'role', 'help_type', 'description',
+                     'submitted_at', 'status')
+    # 예: {'admin': ('assigned_admin',), 'export': ('assigned_admin',)}
+    EAGER_LOADS = {}
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email,
+            'company': self.company,
+            'role': self.role,
+            'help_type': self.help_type,
+            'description': self.description,
+            'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
+            'status': self.status,
+        }
+
+class Expert(db.Model):
+    """전문가 명단 (요청 추천 대상, expert_match.py)"""
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(100), nullable=False)
+    company = db.Column(db.String(100), nullable=False, default='')
+    role = db.Column(db.String(100), nullable=False)
+    # 전문 분야, 경력, 기술 스택 소개 (추천 점수의 본문)
+    expertise = db.Column(db.Text, nullable=False)
+    # 가능한 도움 유형 코드 (쉼표 구분, HELP_TYPES)
+    help_types = db.Column(db.String(200), nullable=False, default='')
+    active = db.Column(db.Boolean, nullable=False, default=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    EAGER_LOADS = {}
+
+    # 추천 색인 동기화: updated_at 워터마크 근처 이후 바뀐 전문가만 읽음
+    __table_args__ = (
+        db.Index('ix_expert_updated_at_id', 'updated_at', 'id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email,
+            'company': self.company,
+            'role': self.role,
+            'expertise': self.expertise,
+            'help_types': split_help_types(self.help_types),
+            'active': bool(self.active),
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+# werkzeug 해시 형식 ('방법$솔트$해시')의 방법 부분 접두사
+PASSWORD_HASH_PREFIXES = ('pbkdf2:', 'scrypt:')
+
+def is_password_hash(value):
+    return '$' in (value or '') and value.split('$', 1)[0].startswith(PASSWORD_HASH_PREFIXES)
+
+def password_hash_params(method):
+    """
+    werkzeug 해시 방법 문자열을 기본값까지 채운 튜플로 ('scrypt' -> ('scrypt', 32768, 8, 1))
+    저장된 해시는 항상 매개변수를 모두 적지만 설정값은 생략할 수 있으므로 비교 전에 맞춤
+    알 수 없는 형식이면 None
+    """
+    name, *args = (method or '').split(':')
+    try:
+        if name == 'scrypt' and not args:
+            return 'scrypt', 2 ** 15, 8, 1
+        if name == 'scrypt' and len(args) == 3:
+            return ('scrypt', *map(int, args))
+        if name == 'pbkdf2' and len(args) <= 2:
+            hash_name = args[0] if args else 'sha256'
+            iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+            return 'pbkdf2', hash_name, iterations
+    except ValueError:
+        pass
+    return None
 
 class Admin(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
-    password = db.Column(db.String(120), nullable=False)
+    # 비밀번호 해시 (PASSWORD_HASH_METHOD, 평문 저장 안 함)
+    password = db.Column(db.String(255), nullable=False)
+
+    def set_password(self, password):
+        self.password = generate_password_hash(password, method=current_app.config['PASSWORD_HASH_METHOD'])
+
+    def check_password(self, password):
+        return is_password_hash(self.password) and check_password_hash(self.password, password)
+
+    def needs_rehash(self):
+        """작업량 설정(PASSWORD_HASH_METHOD)이 바뀌었으면 True"""
+        stored = password_hash_params(self.password.split('$', 1)[0])
+        return stored is None or stored != password_hash_params(current_app.config['PASSWORD_HASH_METHOD'])
+
+# 발송 대기 알림 (요청 트랜잭션에 함께 저장, 백그라운드 워커가 발송)
+class NotificationOutbox(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String(200), nullable=False)
+    subject = db.Column(db.String(200), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.Index('ix_notification_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
+
+# 적용된 스키마 버전 기록
+class SchemaVersion(db.Model):
+    __tablename__ = 'capsa_schema_version'
+    version = db.Column(db.Integer, primary_key=True)
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+notifications = NotificationQueue(db, NotificationOutbox)
+expert_matching = ExpertMatching(db, Expert, StakeholderRequest)
+job_recommender = JobRecommender(db, JobPost)
+
+def upgrade_schema():
+    """기존 DB에 새 컬럼/인덱스 반영 (create_all은 이미 있는 테이블을 변경하지 않음)"""
+    columns = {c['name'] for c in db.inspect(db.engine).get_columns('job_post')}
+    if 'location_key' not in columns:
+        with db.engine.begin() as conn:
+            conn.execute(text("ALTER TABLE job_post ADD COLUMN location_key VARCHAR(100) NOT NULL DEFAULT ''"))
+            rows = conn.execute(text('SELECT id, location FROM job_post')).all()
+            if rows:
+                conn.execute(
+                    text('UPDATE job_post SET location_key = :key WHERE id = :id'),
+                    [{'id': row.id, 'key': normalize_location(row.location)} for row in rows]
+                )
+    for model in (JobPost, Announcement, StakeholderRequest):
+        for index in model.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+    with db.engine.begin() as conn:
+        job_search.ensure_index(conn)
 
-# 데이터베이스 생성
-with app.app_context():
+    # 평문으로 저장된 관리자 비밀번호를 해시로 교체 (SQLite는 VARCHAR 길이를 검사하지 않음)
+    if db.engine.dialect.name == 'postgresql':
+        with db.engine.begin() as conn:
+            conn.execute(text('ALTER TABLE admin ALTER COLUMN password TYPE VARCHAR(255)'))
+    for admin in Admin.query.all():
+        if not is_password_hash(admin.password):
+            admin.set_password(admin.password)
+
+# 화면별 조회: 템플릿/직렬화에서 읽는 관계를 목록과 함께 로딩 (N+1 방지, lazy_loads.py가 감지)
+def eager_options(model, view):
+    """
+    model.EAGER_LOADS[view]의 관계 경로('company', 'company.owner') -> 로더 옵션 목록
+    단일 객체 관계는 joinedload (행 수가 늘지 않음), 컬렉션은 selectinload
+    (JOIN으로 행이 불어나지 않고 LIMIT 페이지와 함께 써도 안전)
+    """
+    options = []
+    for path in model.EAGER_LOADS.get(view, ()):
+        option, entity = None, model
+        for name in path.split('.'):
+            attribute = getattr(entity, name)
+            relationship = attribute.property
+            loader = selectinload if relationship.uselist else joinedload
+            option = loader(attribute) if option is None else getattr(option, loader.__name__)(attribute)
+            entity = relationship.mapper.class_
+        options.append(option)
+    return options
+
+def list_query(model, view):
+    """화면용 Model.query (레거시 Query API)"""
+    return model.query.options(*eager_options(model, view))
+
+def list_select(model, view):
+    """화면용 select() (db.paginate 등)"""
+    return db.select(model).options(*eager_options(model, view))
+
+# 키셋 페이지네이션 커서: ([그룹,] 정렬 시각, id)를 URL-safe 토큰으로 인코딩
+def encode_cursor(sort_value, row_id, group=None):
+    raw = f'{sort_value.isoformat()}|{row_id}'
+    if group is not None:
+        raw = f'{int(group)}|{raw}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(token, grouped=False):
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode('utf-8')
+        if grouped:
+            group, sort_value, row_id = raw.split('|', 2)
+            return bool(int(group)), datetime.fromisoformat(sort_value), int(row_id)
+        sort_value, row_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
+
+def keyset_page(query, sort_column, id_column, cursor, per_page, group_column=None):
+    """
+    ([group_column,] sort_column, id) 내림차순 키셋 페이지 조회. (items, next_cursor) 반환
+
+    group_column: 정렬 앞에 두는 불리언 컬럼 (예: 고정 공지를 먼저)
+    """
+    columns = [sort_column, id_column]
+    if group_column is not None:
+        columns.insert(0, group_column)
+    position = decode_cursor(cursor, grouped=group_column is not None)
+    if position:
+        query = query.filter(tuple_(*columns) < tuple_(*position))
+    rows = query.order_by(*(column.desc() for column in columns)).limit(per_page + 1).all()
+    items = rows[:per_page]
+    next_cursor = None
+    if len(rows) > per_page:
+        last = items[-1]
+        group = bool(getattr(last, group_column.key)) if group_column is not None else None
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key), group)
+    return items, next_cursor
+
+# 데이터베이스 생성/갱신 (import 시점이 아니라 처음 필요할 때 한 번)
+_schema_lock = threading.Lock()
+
+def current_schema_version():
+    if not db.inspect(db.engine).has_table(SchemaVersion.__tablename__):
+        return 0
+    return db.session.query(func.max(SchemaVersion.version)).scalar() or 0
+
+def migrate_schema():
+    """테이블/인덱스 생성, 기존 DB 보정, 기본 데이터 입력 후 버전 기록"""
     db.create_all()
-    
+    upgrade_schema()
+
     # 기본 관리자 계정 생성 (없는 경우)
     if not Admin.query.filter_by(username='admin').first():
-        admin = Admin(username='admin', password='admin123')
+        admin = Admin(username='admin')
+        admin.set_password(current_app.config['ADMIN_INITIAL_PASSWORD'])
         db.session.add(admin)
-        db.session.commit()
+    db.session.add(SchemaVersion(version=SCHEMA_VERSION))
+    db.session.commit()
+
+def ensure_schema():
+    """
+    현재 앱의 DB가 SCHEMA_VERSION인지 확인하고 아니면 migrate_schema() 실행
+    프로세스마다 한 번만 DB를 확인하고, 이후 호출은 플래그만 봄
+    """
+    state = current_app.extensions['capsa_schema']
+    if state['ready']:
+        return
+    with _schema_lock:
+        if state['ready']:
+            return
+        if current_schema_version() < SCHEMA_VERSION:
+            try:
+                migrate_schema()
+            except Exception:
+                # 다른 워커가 동시에 반영한 경우 (인덱스/버전 중복). 다시 확인해서 반영됐으면 통과
+                db.session.rollback()
+                if current_schema_version() < SCHEMA_VERSION:
+                    raise
+        state['ready'] = True
+
+# 라우트/CLI 명령 (create_app()에서 등록)
+class DeferredRoutes:
+    """
+    모듈 수준에서 라우트와 CLI 명령을 모아 두었다가 init_app에서 앱에 등록
+    Blueprint와 달리 엔드포인트 이름에 접두사가 붙지 않아 템플릿의 url_for('jobs')를 그대로 씀
+    """
+
+    def __init__(self):
+        self._rules = []
+        self._commands = []
+
+    def route(self, rule, **options):
+        def decorator(view):
+            self._rules.append((rule, view, options))
+            return view
+        return decorator
 
-# 라우트
-@app.route('/')
+    def command(self, name):
+        def decorator(callback):
+            # 앱이 여러 개 만들어져도 같은 명령 객체를 재사용
+            self._commands.append(click.command(name)(with_appcontext(callback)))
+            return callback
+        return decorator
+
+    def init_app(self, app):
+        for rule, view, options in self._rules:
+            app.add_url_rule(rule, view.__name__, view, **options)
+        for command in self._commands:
+            app.cli.add_command(command)
+
+routes = DeferredRoutes()
+
+@routes.route('/')
+@page_cache.cached('jobs', 'announcements')
 def home():
-    jobs = JobPost.query.order_by(JobPost.posted_at.desc()).limit(6).all()
-    announcements = Announcement.query.filter_by(pinned=True).all()
+    jobs = list_query(JobPost, 'home').order_by(JobPost.posted_at.desc()).limit(6).all()
+    announcements = list_query(Announcement, 'home').filter_by(pinned=True).all()
     return render_template('home.html', jobs=jobs, announcements=announcements)
 
-@app.route('/jobs')
+@routes.route('/jobs')
+@page_cache.cached('jobs', params=('q', 'location', 'cursor', 'page'))
 def jobs():
+    q = request.args.get('q', '').strip()
     location = request.args.get('location', '')
-    if location:
-        jobs = JobPost.query.filter(JobPost.location.contains(location)).order_by(JobPost.posted_at.desc()).all()
+    cursor = request.args.get('cursor', '')
+    page = request.args.get('page', 1, type=int) or 1
+    filters = {'q': q or None, 'location': location or None}
+
+    if q:
+        # 검색어가 있으면 관련도 순위이므로 커서 대신 페이지 번호 사용
+        page = max(page, 1)
+        ids = job_search.search_job_ids(db.session.connection(), q, location,
+                                        limit=JOBS_PER_PAGE + 1, offset=(page - 1) * JOBS_PER_PAGE)
+        by_id = {job.id: job for job in
+                 list_query(JobPost, 'jobs').filter(JobPost.id.in_(ids[:JOBS_PER_PAGE]))}
+        jobs = [by_id[job_id] for job_id in ids[:JOBS_PER_PAGE] if job_id in by_id]
+        is_first_page = page == 1
+        next_url = url_for('jobs', page=page + 1, **filters) if len(ids) > JOBS_PER_PAGE else None
     else:
-        jobs = JobPost.query.order_by(JobPost.posted_at.desc()).all()
-    return render_template('jobs.html', jobs=jobs, location=location)
+        query = list_query(JobPost, 'jobs')
+        # 위치에 검색어 단어가 들어 있는 공고 ('Korea' -> 'Seoul, Korea')
+        condition = job_search.location_condition(db.session.connection(), JobPost.id, JobPost.location, location)
+        if condition is not None:
+            query = query.filter(condition)
+        jobs, next_cursor = keyset_page(query, JobPost.posted_at, JobPost.id, cursor, JOBS_PER_PAGE)
+        is_first_page = not cursor
+        next_url = url_for('jobs', cursor=next_cursor, **filters) if next_cursor else None
+
+    first_url = None if is_first_page else url_for('jobs', **filters)
+    return render_template('jobs.html', jobs=jobs, q=q, location=location,
+                           first_url=first_url, next_url=next_url)
 
-@app.route('/stakeholder-hub', methods=['GET', 'POST'])
+@routes.route('/stakeholder-hub', methods=['GET', 'POST'])
 def stakeholder_hub():
     if request.method == 'POST':
         name = request.form['name']
@@ -84,46 +512,436 @@ def stakeholder_hub():
             role=role, help_type=help_type, description=description
         )
         db.session.add(request_obj)
+        # 메일은 보내지 않고 outbox에만 적재 -> 제출 응답 시간이 메일 서버와 무관
+        notifications.notify_admin(*stakeholder_request_message(request_obj))
         db.session.commit()
+        notifications.wake()
         
         flash('요청이 성공적으로 제출되었습니다!', 'success')
         return redirect(url_for('stakeholder_hub'))
     
     return render_template('stakeholder_hub.html')
 
-@app.route('/community')
+@routes.route('/community')
+@page_cache.cached('announcements', params=('cursor',))
 def community():
-    announcements = Announcement.query.order_by(Announcement.pinned.desc(), Announcement.posted_at.desc()).all()
-    return render_template('community.html', announcements=announcements)
+    # 고정 글 먼저, 최신순. (pinned, posted_at, id) 인덱스로 키셋 페이지 조회
+    cursor = request.args.get('cursor', '')
+    announcements, next_cursor = keyset_page(
+        list_query(Announcement, 'community'), Announcement.posted_at, Announcement.id, cursor,
+        ANNOUNCEMENTS_PER_PAGE, group_column=Announcement.pinned
+    )
+    return render_template('community.html', announcements=announcements,
+                           first_url=url_for('community') if cursor else None,
+                           next_url=url_for('community', cursor=next_cursor) if next_cursor else None)
+
+# 공개 읽기 전용 JSON API (모바일 앱/파트너 사이트용)
+def api_fields(model):
+    """?fields=id,title 파싱. 모르는 필드는 ValueError, 없으면 전체 필드"""
+    allowed = model.API_FIELDS
+    value = request.args.get('fields', '').strip()
+    if not value:
+        return allowed
+    fields = tuple(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError('unknown fields: ' + ', '.join(unknown))
+    return fields
+
+def api_etag(query, model):
+    """
+    목록 버전 ETag: (최신 posted_at, 최대 id, 건수) + 요청 인자
+    행을 읽기 전에 집계 한 번으로 계산해서, 변경이 없으면 304로 바로 응답
+    """
+    latest, max_id, total = query.with_entities(
+        func.max(model.posted_at), func.max(model.id), func.count(model.id)
+    ).one()
+    version = f"{latest.isoformat() if latest else ''}|{max_id}|{total}|{PageCache.make_key()}"
+    return hashlib.sha1(version.encode('utf-8')).hexdigest()
+
+def api_list(model, query, group_column=None):
+    """필드 선택 + 키셋 페이지 + 조건부 GET 공통 처리"""
+    try:
+        fields = api_fields(model)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    limit = min(max(request.args.get('limit', API_PER_PAGE, type=int), 1), API_MAX_PER_PAGE)
+    cursor = request.args.get('cursor', '')
+    if cursor and decode_cursor(cursor, grouped=group_column is not None) is None:
+        return jsonify(error='invalid cursor'), 400
+
+    etag = api_etag(query, model)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        # 요청한 필드와 커서에 필요한 컬럼만 조회 (ORM 객체 생성 없음)
+        key_columns = ['id', 'posted_at'] + ([group_column.key] if group_column is not None else [])
+        columns = [getattr(model, name) for name in dict.fromkeys(list(fields) + key_columns)]
+        rows, next_cursor = keyset_page(query.with_entities(*columns), model.posted_at, model.id,
+                                        cursor, limit, group_column=group_column)
+        items = []
+        for row in rows:
+            item = {}
+            for field in fields:
+                value = getattr(row, field)
+                item[field] = value.isoformat() if isinstance(value, datetime) else value
+            items.append(item)
+        # 한글을 \uXXXX로 풀지 않고 UTF-8 그대로, 필드는 요청한 순서대로
+        body = json.dumps({'items': items, 'next_cursor': next_cursor},
+                          ensure_ascii=False, separators=(',', ':'))
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # 매번 재검증 (폴링 클라이언트는 If-None-Match로 304만 받음)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@routes.route('/api/jobs')
+def api_jobs():
+    """채용공고 목록 (최신순). ?fields=&limit=&cursor=&location="""
+    query = JobPost.query
+    condition = job_search.location_condition(db.session.connection(), JobPost.id, JobPost.location,
+                                              request.args.get('location', ''))
+    if condition is not None:
+        query = query.filter(condition)
+    return api_list(JobPost, query)
+
+@routes.route('/api/announcements')
+def api_announcements():
+    """공지 목록 (고정 글 먼저, 최신순). ?fields=&limit=&cursor="""
+    return api_list(Announcement, Announcement.query, group_column=Announcement.pinned)
+
+def recommend_limit():
+    limit = request.args.get('limit', RECOMMEND_PER_PAGE, type=int)
+    return min(max(limit, 1), current_app.config['JOB_RECOMMEND_K'])
+
+def recommendation_response(matches):
+    items = [dict(job.to_dict(), score=round(score, 4)) for job, score in matches]
+    body = json.dumps({'items': items}, ensure_ascii=False, separators=(',', ':'))
+    response = Response(body, mimetype='application/json')
+    # 배치/증분 반영 전까지 결과가 같으므로 짧게 캐시
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
+
+@routes.route('/api/jobs/<int:job_id>/similar')
+def api_similar_jobs(job_id):
+    """비슷한 채용공고 (유사도 순, 색인이 없으면 빈 목록). ?limit="""
+    if not job_recommender.available:
+        return jsonify(error='job recommendations require numpy'), 503
+    return recommendation_response(job_recommender.similar(job_id, recommend_limit()))
+
+@routes.route('/api/jobs/recommended')
+def api_recommended_jobs():
+    """본/저장한 공고 기반 추천. ?seen=3,17,42&limit= (seen은 최근 것이 뒤)"""
+    if not job_recommender.available:
+        return jsonify(error='job recommendations require numpy'), 503
+    try:
+        seen = [int(value) for value in request.args.get('seen', '').split(',') if value.strip()]
+    except ValueError:
+        return jsonify(error='seen must be comma-separated job ids'), 400
+    return recommendation_response(job_recommender.recommend(seen, recommend_limit()))
+
+# 없는 사용자 이름에도 해시 비교 시간을 같게 하기 위한 더미 해시 (해시 방법별로 한 번 계산)
+_dummy_password_hashes = {}
+
+def _dummy_password_hash():
+    method = current_app.config['PASSWORD_HASH_METHOD']
+    if method not in _dummy_password_hashes:
+        _dummy_password_hashes[method] = generate_password_hash('dummy-password', method=method)
+    return _dummy_password_hashes[method]
 
-@app.route('/admin/login', methods=['GET', 'POST'])
+@routes.route('/admin/login', methods=['GET', 'POST'])
 def admin_login():
     if request.method == 'POST':
         username = request.form['username']
         password = request.form['password']
-        
-        admin = Admin.query.filter_by(username=username, password=password).first()
-        if admin:
+        ip = request.remote_addr or ''
+
+        # 시도 제한은 DB 조회/해시 계산 전에 메모리에서 판단
+        retry_after = login_limiter.check(ip, username)
+        if retry_after:
+            flash(f'로그인 시도가 너무 많습니다. {int(retry_after) + 1}초 후에 다시 시도하세요.', 'error')
+            response = make_response(render_template('admin_login.html'), 429)
+            response.headers['Retry-After'] = str(int(retry_after) + 1)
+            return response
+
+        admin = Admin.query.filter_by(username=username).first()
+        if admin is not None and admin.check_password(password):
+            login_limiter.record_success(ip, username)
+            if admin.needs_rehash():
+                admin.set_password(password)
+                db.session.commit()
             session['admin'] = True
             flash('관리자로 로그인되었습니다.', 'success')
             return redirect(url_for('admin_dashboard'))
-        else:
-            flash('잘못된 로그인 정보입니다.', 'error')
+        if admin is None:
+            check_password_hash(_dummy_password_hash(), password)
+        login_limiter.record_failure(ip, username)
+        flash('잘못된 로그인 정보입니다.', 'error')
     
     return render_template('admin_login.html')
 
-@app.route('/admin/dashboard')
+@routes.route('/metrics')
+def prometheus_metrics():
+    """Prometheus 수집용 텍스트 (관리자 세션 또는 METRICS_TOKEN Bearer 토큰)"""
+    token = current_app.config['METRICS_TOKEN']
+    authorized = session.get('admin') or (
+        token and hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}')
+    )
+    if not authorized:
+        return Response('unauthorized\n', status=401, mimetype='text/plain')
+    if not request_metrics.enabled:
+        return Response('metrics disabled\n', status=404, mimetype='text/plain')
+    return Response(request_metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+@routes.route('/admin/metrics')
+def admin_metrics():
+    if not session.get('admin'):
+        return redirect(url_for('admin_login'))
+    return render_template('admin_metrics.html', enabled=request_metrics.enabled,
+                           routes=request_metrics.route_summary(),
+                           slow_requests=request_metrics.recent_slow_requests(),
+                           slow_request_ms=current_app.config['SLOW_REQUEST_MS'],
+                           login=login_limiter.snapshot())
+
+def login_metric_families():
+    """로그인 시도 지표를 /metrics에 함께 출력"""
+    login = login_limiter.snapshot()
+    return [
+        ('capsa_login_attempts_total', 'counter', '관리자 로그인 시도 결과별 수', [
+            ({'result': result}, login[result])
+            for result in ('succeeded', 'failed', 'rejected_ip', 'rejected_user')
+        ]),
+        ('capsa_login_tracked_keys', 'gauge', '시도 제한 중인 키 수', [
+            ({'kind': 'ip'}, login['tracked_ips']), ({'kind': 'user'}, login['tracked_users']),
+        ]),
+    ]
+
+request_metrics.add_collector(login_metric_families)
+
+@routes.route('/admin/dashboard')
 def admin_dashboard():
     if not session.get('admin'):
         return redirect(url_for('admin_login'))
-    
-    jobs = JobPost.query.order_by(JobPost.posted_at.desc()).all()
-    announcements = Announcement.query.order_by(Announcement.posted_at.desc()).all()
-    requests = StakeholderRequest.query.order_by(StakeholderRequest.submitted_at.desc()).all()
-    
-    return render_template('admin_dashboard.html', jobs=jobs, announcements=announcements, requests=requests)
 
-@app.route('/admin/job/add', methods=['GET', 'POST'])
+    # 목록은 탭별 JSON API로 필요할 때 불러오고, 여기서는 집계값만 계산
+    return render_template('admin_dashboard.html', summary=dashboard_summary(),
+                           statuses=REQUEST_STATUSES)
+
+def dashboard_summary():
+    """대시보드 통계 (집계 SQL만 사용)"""
+    status_counts = dict(
+        db.session.query(StakeholderRequest.status, func.count(StakeholderRequest.id))
+        .group_by(StakeholderRequest.status).all()
+    )
+    return {
+        'jobs': db.session.query(func.count(JobPost.id)).scalar(),
+        'announcements': db.session.query(func.count(Announcement.id)).scalar(),
+        'pinned_announcements': db.session.query(func.count(Announcement.id))
+                                .filter(Announcement.pinned.is_(True)).scalar(),
+        'requests': sum(status_counts.values()),
+        'requests_by_status': status_counts,
+    }
+
+def admin_list(model, query, sort_columns, default_sort):
+    """관리자 목록 API 공통 처리: 정렬, 페이지네이션, JSON 직렬화"""
+    sort = request.args.get('sort', default_sort)
+    if sort not in sort_columns:
+        sort = default_sort
+    column = sort_columns[sort]
+    order = request.args.get('order', 'desc')
+    if order == 'asc':
+        query = query.order_by(column.asc(), model.id.asc())
+    else:
+        order = 'desc'
+        query = query.order_by(column.desc(), model.id.desc())
+
+    per_page = min(max(request.args.get('per_page', ADMIN_PER_PAGE, type=int), 1), ADMIN_MAX_PER_PAGE)
+    page = db.paginate(query, page=request.args.get('page', 1, type=int),
+                       per_page=per_page, error_out=False)
+    return jsonify({
+        'items': [item.to_dict() for item in page.items],
+        'page': page.page,
+        'per_page': page.per_page,
+        'pages': page.pages,
+        'total': page.total,
+        'sort': sort,
+        'order': order,
+    })
+
+@routes.route('/admin/api/summary')
+def admin_api_summary():
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    return jsonify(dict(dashboard_summary(), login=login_limiter.snapshot()))
+
+@routes.route('/admin/api/jobs')
+def admin_api_jobs():
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    return admin_list(
+        JobPost, list_select(JobPost, 'admin'),
+        {'posted_at': JobPost.posted_at, 'title': JobPost.title,
+         'company': JobPost.company, 'location': JobPost.location},
+        'posted_at'
+    )
+
+@routes.route('/admin/api/announcements')
+def admin_api_announcements():
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    return admin_list(
+        Announcement, list_select(Announcement, 'admin'),
+        {'posted_at': Announcement.posted_at, 'title': Announcement.title,
+         'pinned': Announcement.pinned},
+        'posted_at'
+    )
+
+@routes.route('/admin/api/requests')
+def admin_api_requests():
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    query = list_select(StakeholderRequest, 'admin')
+    status = request.args.get('status', '')
+    if status:
+        query = query.filter(StakeholderRequest.status == status)
+    return admin_list(
+        StakeholderRequest, query,
+        {'submitted_at': StakeholderRequest.submitted_at, 'name': StakeholderRequest.name,
+         'company': StakeholderRequest.company, 'help_type': StakeholderRequest.help_type,
+         'status': StakeholderRequest.status},
+        'submitted_at'
+    )
+
+@routes.route('/admin/api/experts')
+def admin_api_experts():
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    return admin_list(
+        Expert, list_select(Expert, 'admin'),
+        {'updated_at': Expert.updated_at, 'name': Expert.name, 'company': Expert.company,
+         'role': Expert.role, 'active': Expert.active},
+        'updated_at'
+    )
+
+@routes.route('/admin/api/requests/<int:request_id>/matches')
+def admin_api_request_matches(request_id):
+    """요청에 맞는 전문가 추천 (유사도 순). ?k="""
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    if not expert_matching.available:
+        return jsonify(error='expert matching requires numpy'), 503
+    if db.session.get(StakeholderRequest, request_id) is None:
+        return jsonify(error='not found'), 404
+    k = min(max(request.args.get('k', current_app.config['EXPERT_MATCH_TOP_K'], type=int), 1),
+            EXPERT_MATCH_MAX_K)
+    matches = expert_matching.candidates(request_id, k)
+    return jsonify(items=[dict(expert.to_dict(), score=round(score, 4)) for expert, score in matches])
+
+def parse_date_arg(name, end=False):
+    """
+    날짜/일시 쿼리 인자 파싱 ('2024-01-31' 또는 ISO 일시). 없으면 None, 형식 오류는 ValueError
+    end=True이고 날짜만 주어지면 그 날 전체를 포함하도록 다음 날 0시를 반환
+    """
+    value = request.args.get(name, '').strip()
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+def iter_keyset_chunks(query, sort_column, id_column, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    (sort_column, id) 오름차순으로 chunk_size개씩 조회한 목록을 차례로 생성
+
+    OFFSET 없이 마지막 행 위치에서 이어서 읽으므로 청크마다 비용이 같고,
+    한 번에 메모리에 있는 행은 한 청크뿐
+    """
+    position = None
+    while True:
+        chunk_query = query
+        if position is not None:
+            chunk_query = chunk_query.filter(tuple_(sort_column, id_column) > tuple_(*position))
+        rows = chunk_query.order_by(sort_column.asc(), id_column.asc()).limit(chunk_size).all()
+        if not rows:
+            return
+        yield rows
+        last = rows[-1]
+        position = (getattr(last, sort_column.key), getattr(last, id_column.key))
+        # 다음 청크 조회 전에 세션이 들고 있는 객체 해제
+        db.session.expunge_all()
+        if len(rows) < chunk_size:
+            return
+
+def _csv_cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat()
+    value = str(value)
+    # 스프레드시트에서 수식으로 실행되지 않도록 (CSV injection)
+    if value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        return "'" + value
+    return value
+
+def stream_export(chunks, fields, fmt):
+    """모델 청크 -> CSV/JSONL 텍스트 조각 생성기 (청크마다 한 번씩 내보냄)"""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # 엑셀에서 한글이 깨지지 않도록 BOM
+        yield '\ufeff'
+        writer.writerow(fields)
+        for rows in chunks:
+            for row in rows:
+                writer.writerow([_csv_cell(getattr(row, field)) for field in fields])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+    else:
+        for rows in chunks:
+            lines = []
+            for row in rows:
+                item = row.to_dict()
+                lines.append(json.dumps({field: item[field] for field in fields}, ensure_ascii=False))
+            yield '\n'.join(lines) + '\n'
+
+@routes.route('/admin/api/requests/export')
+def admin_api_export_requests():
+    """
+    전문가 요청 내보내기 (접수순 스트리밍)
+    ?format=csv|jsonl&status=...&since=YYYY-MM-DD&until=YYYY-MM-DD (until은 그 날 포함)
+    """
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify(error='format must be one of: ' + ', '.join(EXPORT_FORMATS)), 400
+    try:
+        since = parse_date_arg('since')
+        until = parse_date_arg('until', end=True)
+    except ValueError:
+        return jsonify(error='since/until must be ISO dates (YYYY-MM-DD)'), 400
+
+    query = list_query(StakeholderRequest, 'export')
+    status = request.args.get('status', '')
+    if status:
+        query = query.filter(StakeholderRequest.status == status)
+    if since:
+        query = query.filter(StakeholderRequest.submitted_at >= since)
+    if until:
+        query = query.filter(StakeholderRequest.submitted_at < until)
+
+    chunks = iter_keyset_chunks(query, StakeholderRequest.submitted_at, StakeholderRequest.id)
+    body = stream_export(chunks, StakeholderRequest.EXPORT_FIELDS, fmt)
+    filename = f"stakeholder-requests-{datetime.utcnow():%Y%m%d}.{fmt}"
+    response = Response(stream_with_context(body), content_type=EXPORT_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+@routes.route('/admin/job/add', methods=['GET', 'POST'])
 def add_job():
     if not session.get('admin'):
         return redirect(url_for('admin_login'))
@@ -138,12 +956,48 @@ def add_job():
         )
         db.session.add(job)
         db.session.commit()
+        page_cache.invalidate('jobs')
+        # 이 워커의 추천 색인에 바로 반영 (다른 워커는 JOB_RECOMMEND_SYNC_SECONDS 안에 반영)
+        job_recommender.add(job)
         flash('채용공고가 추가되었습니다.', 'success')
         return redirect(url_for('admin_dashboard'))
     
     return render_template('add_job.html')
 
-@app.route('/admin/announcement/add', methods=['GET', 'POST'])
+def import_jobs(stream, fmt, batch_size=None):
+    """CSV/JSONL 텍스트 스트림의 채용공고를 일괄 등록하고 보고서 반환"""
+    importer = JobImporter(db.engine, JobPost.__table__, normalize_location)
+    if batch_size:
+        importer.batch_size = batch_size
+    report = importer.run(stream, fmt)
+    if report['inserted']:
+        page_cache.invalidate('jobs')
+    return report
+
+@routes.route('/admin/api/jobs/import', methods=['POST'])
+def admin_api_import_jobs():
+    """
+    채용공고 일괄 등록. multipart 'file' 업로드 또는 요청 본문 스트림
+    형식은 ?format=csv|jsonl, 없으면 파일 이름/Content-Type으로 판단
+    """
+    if not session.get('admin'):
+        return jsonify(error='unauthorized'), 401
+    upload = request.files.get('file')
+    if upload is not None:
+        binary = upload.stream
+        fmt = request.args.get('format') or detect_format(upload.filename, upload.mimetype)
+    else:
+        binary = request.stream
+        fmt = request.args.get('format') or detect_format(content_type=request.mimetype)
+    if fmt not in JOB_IMPORT_FORMATS:
+        return jsonify(error='format must be one of: ' + ', '.join(JOB_IMPORT_FORMATS)), 400
+    report = import_jobs(text_stream(binary), fmt)
+    if 'aborted' in report:
+        # 앞 배치는 이미 등록됨: 등록 건수와 실패한 줄을 함께 돌려줌
+        return jsonify(dict(report, error='body must be UTF-8')), 400
+    return jsonify(report)
+
+@routes.route('/admin/announcement/add', methods=['GET', 'POST'])
 def add_announcement():
     if not session.get('admin'):
         return redirect(url_for('admin_login'))
@@ -156,12 +1010,47 @@ def add_announcement():
         )
         db.session.add(announcement)
         db.session.commit()
+        page_cache.invalidate('announcements')
         flash('공지사항이 추가되었습니다.', 'success')
         return redirect(url_for('admin_dashboard'))
     
     return render_template('add_announcement.html')
 
-@app.route('/admin/request/<int:request_id>/update', methods=['POST'])
+@routes.route('/admin/expert/add', methods=['GET', 'POST'])
+def add_expert():
+    if not session.get('admin'):
+        return redirect(url_for('admin_login'))
+
+    if request.method == 'POST':
+        known = {code for code, _ in HELP_TYPES}
+        expert = Expert(
+            name=request.form['name'],
+            email=request.form['email'],
+            company=request.form.get('company', ''),
+            role=request.form['role'],
+            expertise=request.form['expertise'],
+            help_types=','.join(code for code in request.form.getlist('help_types') if code in known)
+        )
+        db.session.add(expert)
+        db.session.commit()
+        # 추천 색인에는 다음 추천 조회 때 반영됨 (expert_matching.sync)
+        flash('전문가가 등록되었습니다.', 'success')
+        return redirect(url_for('admin_dashboard'))
+
+    return render_template('add_expert.html', help_types=HELP_TYPES)
+
+@routes.route('/admin/expert/<int:expert_id>/active', methods=['POST'])
+def set_expert_active(expert_id):
+    if not session.get('admin'):
+        return redirect(url_for('admin_login'))
+
+    expert = Expert.query.get_or_404(expert_id)
+    expert.active = request.form.get('active') == '1'
+    db.session.commit()
+    flash('전문가 상태가 변경되었습니다.', 'success')
+    return redirect(url_for('admin_dashboard'))
+
+@routes.route('/admin/request/<int:request_id>/update', methods=['POST'])
 def update_request_status(request_id):
     if not session.get('admin'):
         return redirect(url_for('admin_login'))
@@ -169,14 +1058,168 @@ def update_request_status(request_id):
     request_obj = StakeholderRequest.query.get_or_404(request_id)
     request_obj.status = request.form['status']
     db.session.commit()
+    # 요청 상태는 공개 페이지에 노출되지 않으므로 캐시 무효화 대상 없음
     flash('요청 상태가 업데이트되었습니다.', 'success')
     return redirect(url_for('admin_dashboard'))
 
-@app.route('/admin/logout')
+@routes.route('/admin/logout')
 def admin_logout():
     session.pop('admin', None)
     flash('로그아웃되었습니다.', 'info')
     return redirect(url_for('home'))
 
+@routes.command('notifications-worker')
+def notifications_worker_command():
+    """알림 발송 워커를 포그라운드에서 실행 (NOTIFY_WORKER=off일 때 사용)"""
+    ensure_schema()
+    notifications.run_forever()
+
+@routes.command('notifications-drain')
+def notifications_drain_command():
+    """발송 가능한 알림을 모두 처리하고 종료"""
+    ensure_schema()
+    print(f'{notifications.drain()}건 처리')
+
+@routes.command('compress-static')
+def compress_static_command():
+    """static 폴더 CSS/JS의 .gz/.br 사전 압축본 생성 (배포 전에 실행)"""
+    written = static_assets.precompress()
+    print(f'{len(written)}개 파일 생성')
+
+@routes.command('import-jobs')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(JOB_IMPORT_FORMATS), help='기본값: 파일 확장자로 판단')
+@click.option('--batch-size', type=int, default=None, help='트랜잭션당 행 수')
+def import_jobs_command(path, fmt, batch_size):
+    """
+    CSV/JSONL 파일의 채용공고 일괄 등록 (company, title, apply_url 중복은 건너뜀)
+    실행 중인 서버의 페이지 캐시는 같은 PAGE_CACHE_DIR(disk 백엔드)을 쓸 때만 바로 무효화됨
+    """
+    fmt = fmt or detect_format(path)
+    if fmt is None:
+        raise click.UsageError('--format을 지정하세요 (csv 또는 jsonl)')
+    ensure_schema()
+    with open(path, 'rb') as f:
+        report = import_jobs(text_stream(f), fmt, batch_size)
+    print(f"{report['read']}행 읽음, {report['inserted']}건 등록, 중복 {report['duplicates']}건, "
+          f"오류 {report['invalid']}건 ({report['seconds']}초, {report['rows_per_sec']}행/초)")
+    for error in report['errors']:
+        print(f"  {error['line']}행: {error['error']}")
+    if 'aborted' in report:
+        print(f"{report['aborted']['line']}행에서 중단: {report['aborted']['error']}")
+    config = current_app.config
+    if report['inserted'] and config['PAGE_CACHE_ENABLED']:
+        if config['PAGE_CACHE_BACKEND'] == 'disk':
+            print(f"페이지 캐시 무효화: {config['PAGE_CACHE_DIR']} (같은 디렉터리를 쓰는 서버에 반영)")
+        else:
+            print(f"페이지 캐시가 memory 백엔드라 실행 중인 서버는 최대 {config['PAGE_CACHE_MAX_AGE']}초 뒤 "
+                  '반영됩니다 (바로 반영하려면 서버 재시작)')
+
+@routes.command('build-recommendations')
+@click.option('--k', type=int, default=None, help='공고당 저장할 비슷한 공고 수 (기본값: JOB_RECOMMEND_K)')
+def build_recommendations_command(k):
+    """비슷한 공고 색인 생성 (cron 등으로 주기 실행. 실행 중인 워커는 새 색인을 자동으로 읽음)"""
+    if not job_recommender.available:
+        raise click.ClickException('채용공고 추천에는 numpy가 필요합니다 (pip install numpy)')
+    ensure_schema()
+    meta = job_recommender.build(k)
+    print(f"공고 {meta['jobs']}개, 이웃 {meta['k']}개씩, 용어 {len(meta['vocabulary'])}개 "
+          f"({meta['seconds']}초) -> {current_app.config['JOB_RECOMMEND_PATH']}/{meta['version']}")
+
+@routes.command('init-db')
+def init_db_command():
+    """스키마/기본 데이터 반영 (배포 시 한 번 실행하면 워커는 DB 확인만 함)"""
+    ensure_schema()
+    print(f'스키마 버전 {current_schema_version()}')
+
+# 앱 팩토리
+def load_config(app):
+    """CAPSA_* 환경 변수 설정"""
+    app.config['SECRET_KEY'] = os.environ.get('CAPSA_SECRET_KEY', 'capsa-secret-key-2024')
+    # 기본은 SQLite 파일. 운영에서는 CAPSA_DATABASE_URL로 PostgreSQL 등 지정 (db_profile.py)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('CAPSA_DATABASE_URL', 'sqlite:///capsa.db')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # 알림 메일 설정 (SMTP_HOST가 없으면 로그로만 남김)
+    app.config['NOTIFY_ADMIN_EMAIL'] = os.environ.get('CAPSA_ADMIN_EMAIL', 'admin@capsa.local')
+    app.config['SMTP_HOST'] = os.environ.get('CAPSA_SMTP_HOST')
+    app.config['SMTP_PORT'] = int(os.environ.get('CAPSA_SMTP_PORT', 587))
+    app.config['SMTP_USERNAME'] = os.environ.get('CAPSA_SMTP_USERNAME')
+    app.config['SMTP_PASSWORD'] = os.environ.get('CAPSA_SMTP_PASSWORD')
+    app.config['MAIL_SENDER'] = os.environ.get('CAPSA_MAIL_SENDER', 'noreply@capsa.local')
+    app.config['NOTIFY_WORKER'] = os.environ.get('CAPSA_NOTIFY_WORKER', 'thread')
+    # 연결 풀 / SQLite 튜닝
+    app.config['DB_POOL_SIZE'] = int(os.environ.get('CAPSA_DB_POOL_SIZE', 5))
+    app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('CAPSA_DB_MAX_OVERFLOW', 10))
+    app.config['DB_SQLITE_TUNING'] = os.environ.get('CAPSA_SQLITE_TUNING', 'on') != 'off'
+    # 관리자 비밀번호 해시 방법/작업량 (werkzeug 형식, 예: 'scrypt:32768:8:1')
+    # 바꾸면 다음 로그인 때 새 방법으로 다시 해시
+    app.config['PASSWORD_HASH_METHOD'] = os.environ.get('CAPSA_PASSWORD_HASH_METHOD', 'pbkdf2:sha256:600000')
+    # 기본 관리자 계정을 처음 만들 때만 사용
+    app.config['ADMIN_INITIAL_PASSWORD'] = os.environ.get('CAPSA_ADMIN_PASSWORD', 'admin123')
+    # 요청 계측 (off면 훅을 등록하지 않음)
+    app.config['METRICS_ENABLED'] = os.environ.get('CAPSA_METRICS', 'on') != 'off'
+    app.config['METRICS_TOKEN'] = os.environ.get('CAPSA_METRICS_TOKEN')
+    app.config['SLOW_REQUEST_MS'] = int(os.environ.get('CAPSA_SLOW_REQUEST_MS', 500))
+    # N+1 감지 (lazy_loads.py). 지정하지 않으면 디버그/테스트 모드에서만
+    if os.environ.get('CAPSA_LAZY_LOAD_DETECTOR'):
+        app.config['LAZY_LOAD_DETECTOR'] = os.environ['CAPSA_LAZY_LOAD_DETECTOR'] != 'off'
+    # 비슷한 공고 색인 위치 (flask build-recommendations 결과, 워커들이 mmap으로 공유)
+    app.config['JOB_RECOMMEND_PATH'] = os.environ.get('CAPSA_RECOMMEND_PATH', 'job_recommendations')
+    # off: 요청 처리 중 스키마를 반영하지 않음 (배포 때 flask init-db 실행)
+    app.config['AUTO_MIGRATE'] = os.environ.get('CAPSA_AUTO_MIGRATE', 'on') != 'off'
+
+# gunicorn --preload 등으로 fork된 워커가 부모 프로세스의 DB 연결(SQLite 핸들)을
+# 함께 쓰지 않도록 풀을 비움. close=False: 부모 쪽 연결은 닫지 않음
+# 훅은 프로세스에 한 번만 등록하고, 앱이 사라지면 엔진도 목록에서 빠짐
+_fork_engines = weakref.WeakSet()
+
+def _dispose_engines_after_fork():
+    for engine in list(_fork_engines):
+        engine.dispose(close=False)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_dispose_engines_after_fork)
+
+def create_app(config=None):
+    """
+    앱 생성. DB에는 연결하지 않음 (스키마 반영은 첫 요청 또는 flask init-db)
+    config: 환경 변수 설정 위에 덮어쓸 값 (테스트 등)
+    """
+    app = Flask(__name__)
+    load_config(app)
+    app.config.update(config or {})
+
+    # 계측 훅을 먼저 등록해서 스키마 확인 등 다른 before_request 시간도 포함
+    request_metrics.init_app(app)
+    database_profile.init_app(app)
+    db.init_app(app)
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        database_profile.attach(engine, app)
+        request_metrics.attach(engine, app)
+        _fork_engines.add(engine)
+    lazy_loads.init_app(app)
+    lazy_loads.attach(db.session.session_factory, app)
+    page_cache.init_app(app)
+    static_assets.init_app(app)
+    # 스키마 확인은 알림 워커 시작(notifications의 before_request)보다 먼저
+    app.extensions['capsa_schema'] = {'ready': False}
+    if app.config['AUTO_MIGRATE']:
+        app.before_request(ensure_schema)
+    notifications.init_app(app)
+    expert_matching.init_app(app)
+    job_recommender.init_app(app)
+    login_limiter.init_app(app)
+    routes.init_app(app)
+    return app
+
+def __getattr__(name):
+    # 'from app import app', 'gunicorn app:app', 'flask --app app' 호환: 처음 접근할 때 생성
+    if name == 'app':
+        globals()['app'] = create_app()
+        return globals()['app']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8000)
+    create_app().run(debug=True, host='0.0.0.0', port=8000)
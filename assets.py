@@ -0,0 +1,181 @@
+"""
+정적 자산(CSS/JS) 파이프라인
+
+- 빌드(build_static.py): 최소화 -> 내용 해시가 들어간 파일명(style.<hash>.css)
+  -> .gz/.br 사전 압축본 생성, 생성된 HTML의 참조 경로를 해시 파일명으로 교체
+- Flask(app.py): url_for('static', ...)에 ?v=<해시>를 붙이고, 버전이 붙은 요청은
+  1년 캐시(immutable). 클라이언트가 지원하면 .br/.gz 사전 압축본을 그대로 전송
+- brotli 패키지가 없으면 .br은 만들지 않음 (gzip만 사용)
+- JS 최소화는 rjsmin 사용 (정규식/템플릿 리터럴을 제대로 구분). 없으면 최소화하지 않고
+  해시 파일명/압축만 적용
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+from flask import current_app, request, send_from_directory
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+FAR_FUTURE_MAX_AGE = 365 * 24 * 3600
+HASH_LENGTH = 10
+MINIFIABLE = ('.css', '.js')
+# 사전 압축본 우선순위 (Accept-Encoding 토큰, 파일 접미사)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+_FINGERPRINT_RE = re.compile(r'\.[0-9a-f]{%d}\.(css|js)$' % HASH_LENGTH)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{}:;,>])\s*')
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def fingerprint_name(relpath, digest):
+    """'static/css/style.css' -> 'static/css/style.<hash>.css'"""
+    base, ext = os.path.splitext(relpath)
+    return f'{base}.{digest}{ext}'
+
+
+def minify_css(text):
+    text = _CSS_COMMENT_RE.sub('', text)
+    text = _CSS_SPACE_RE.sub(' ', text)
+    text = _CSS_PUNCT_RE.sub(r'\1', text)
+    return text.replace(';}', '}').strip()
+
+
+def minify_js(text):
+    """rjsmin으로 주석/공백 제거 (없으면 원문 그대로)"""
+    if rjsmin is None:
+        return text
+    return rjsmin.jsmin(text)
+
+
+def minify(relpath, data):
+    ext = os.path.splitext(relpath)[1]
+    if ext == '.css':
+        return minify_css(data.decode('utf-8')).encode('utf-8')
+    if ext == '.js':
+        return minify_js(data.decode('utf-8')).encode('utf-8')
+    return data
+
+
+def compressed_variants(data):
+    """{'.gz': bytes, '.br': bytes} (gzip은 mtime=0으로 고정해서 빌드마다 동일)"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+
+_ASSET_REF_RE = re.compile(r'(href|src)="([^"]*?)(static/[^"?#]+)"')
+
+
+def rewrite_asset_urls(html, asset_map):
+    """생성된 HTML의 static/ 참조를 해시 파일명으로 교체 (상대 경로 접두사는 유지)"""
+    if not asset_map:
+        return html
+
+    def replace(match):
+        attr, prefix, path = match.groups()
+        return f'{attr}="{prefix}{asset_map.get(path, path)}"'
+    return _ASSET_REF_RE.sub(replace, html)
+
+
+# Flask 정적 파일 서빙
+class StaticAssets:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.url_defaults(self._add_version)
+        app.view_functions['static'] = self.serve
+        # 앱마다 static 폴더가 다를 수 있으므로 해시 캐시도 앱별
+        app.extensions['static_assets'] = {'hashes': {}}
+
+    def file_hash(self, filename):
+        """static 파일 내용 해시 (mtime이 바뀌었을 때만 다시 계산)"""
+        path = os.path.join(current_app.static_folder, filename)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        hashes = current_app.extensions['static_assets']['hashes']
+        cached = hashes.get(filename)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(path, 'rb') as f:
+            digest = content_hash(f.read())
+        hashes[filename] = (mtime, digest)
+        return digest
+
+    def _add_version(self, endpoint, values):
+        if endpoint == 'static' and 'v' not in values and values.get('filename'):
+            digest = self.file_hash(values['filename'])
+            if digest:
+                values['v'] = digest
+
+    def serve(self, filename):
+        static_folder = current_app.static_folder
+        # ?v=는 현재 내용 해시와 같을 때만 영구 캐시 (오래되거나 잘못된 URL이 고정되지 않게)
+        version = request.args.get('v')
+        versioned = bool(_FINGERPRINT_RE.search(filename)) or bool(version) and version == self.file_hash(filename)
+        source = os.path.join(static_folder, filename)
+        accepted = request.accept_encodings
+
+        served = None
+        encoding = None
+        if os.path.isfile(source):
+            source_mtime = os.stat(source).st_mtime_ns
+            for token, suffix in ENCODINGS:
+                candidate = source + suffix
+                # 원본보다 오래된(갱신 안 된) 압축본은 사용하지 않음
+                if accepted[token] and os.path.isfile(candidate) \
+                        and os.stat(candidate).st_mtime_ns >= source_mtime:
+                    served, encoding = filename + suffix, token
+                    break
+
+        if served is None:
+            response = send_from_directory(static_folder, filename)
+        else:
+            response = send_from_directory(static_folder, served)
+            response.headers['Content-Encoding'] = encoding
+            response.mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        response.vary.add('Accept-Encoding')
+        if versioned:
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = FAR_FUTURE_MAX_AGE
+            response.cache_control.immutable = True
+        return response
+
+    def precompress(self):
+        """static 폴더의 CSS/JS에 .gz/.br 압축본 생성 (flask compress-static)"""
+        written = []
+        static_folder = current_app.static_folder
+        for root, dirs, files in os.walk(static_folder):
+            for file in files:
+                if not file.endswith(MINIFIABLE):
+                    continue
+                path = os.path.join(root, file)
+                with open(path, 'rb') as f:
+                    data = f.read()
+                for suffix, compressed in compressed_variants(data).items():
+                    with open(path + suffix, 'wb') as f:
+                        f.write(compressed)
+                    written.append(os.path.relpath(path + suffix, static_folder))
+        return written
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+PersistentCMS(cms_store.py) 스냅샷 쓰기/열기 시간 측정
+
+1) 채용공고 N개를 적재하고 compact()로 스냅샷 생성
+2) 새 프로세스 상태에서 열기(mmap + 로그 재생) 시간 측정
+3) 연 직후 필터/정렬 조회 시간 측정
+
+사용법: python benchmarks/cms_snapshot.py [--count 1000000] [--dir /tmp/capsa-cms]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from CAPSA import JobPost  # noqa: E402
+from cms_store import PersistentCMS  # noqa: E402
+
+LOCATIONS = ['Seoul', 'Busan', 'Remote', 'San Francisco', 'New York', 'Pangyo']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CMS 스냅샷 쓰기/열기 시간 측정')
+    parser.add_argument('--count', type=int, default=1000000)
+    parser.add_argument('--dir', default='/tmp/capsa-cms-bench')
+    args = parser.parse_args()
+
+    shutil.rmtree(args.dir, ignore_errors=True)
+    rng = random.Random(0)
+    base = datetime(2024, 1, 1)
+
+    started = time.perf_counter()
+    cms = PersistentCMS(args.dir, compact_every=0)
+    # 적재는 로그를 거치지 않고 테이블에 직접 (측정 대상은 스냅샷)
+    for i in range(args.count):
+        cms.job_posts.insert(JobPost(
+            f'Engineer {i}', f'Company {rng.randrange(2000)}', rng.choice(LOCATIONS),
+            f'https://example.com/jobs/{i}', f'Job description {i}',
+            base + timedelta(minutes=rng.randrange(10 ** 6)),
+        ))
+    loaded = time.perf_counter()
+    cms.compact()
+    compacted = time.perf_counter()
+    for i in range(1000):
+        cms.update_job(i + 1, JobPost(f'Updated {i}', 'Company 1', 'Seoul', 'u', 'd', base))
+    cms.close()
+    size = os.path.getsize(os.path.join(args.dir, 'snapshot.bin'))
+    print(f'적재 {loaded - started:.2f}s, 스냅샷 {compacted - loaded:.2f}s ({size / 2 ** 20:.1f} MB)')
+
+    started = time.perf_counter()
+    cms = PersistentCMS(args.dir, compact_every=0)
+    opened = time.perf_counter()
+    print(f'열기 (레코드 {len(cms.job_posts):,}개 + 로그 1,000건): {(opened - started) * 1000:.1f}ms')
+
+    for label, filters in (('location+company', {'location': 'Seoul', 'company': 'Company 7'}),
+                           ('location', {'location': 'Busan'}),
+                           ('없음', None)):
+        started = time.perf_counter()
+        jobs = cms.find_jobs(filters, limit=20)
+        print(f'  최신 20건 ({label}): {(time.perf_counter() - started) * 1000:.1f}ms, {len(jobs)}건')
+    cms.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+SQLite 동시 읽기/쓰기 부하 테스트 (db_profile.py 튜닝 전후 비교)
+
+프로세스 여러 개가 같은 DB 파일에 동시에 접근 (gunicorn 워커 여러 개와 같은 상황)
+- 읽기 워커: GET /api/jobs (페이지 + ETag 집계 쿼리)
+- 쓰기 워커: POST /stakeholder-hub (요청 + 알림 outbox 적재)
+프로필마다 새 DB 파일을 만들어 채용공고 N개를 넣은 뒤 정해진 시간 동안 실행하고
+초당 처리량, 지연 시간 p50/p95, 실패(잠금 대기 초과 등) 건수를 출력
+
+사용법: python benchmarks/db_load.py [--readers 4] [--writers 2] [--seconds 10] [--jobs 20000]
+        (--profile default|tuned 로 하나만 실행)
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# default: SQLite 기본값 (rollback journal, synchronous=FULL), tuned: db_profile 기본 튜닝
+PROFILES = ('default', 'tuned')
+
+
+def _load_app(db_path, profile):
+    os.environ['CAPSA_DATABASE_URL'] = f'sqlite:///{db_path}'
+    os.environ['CAPSA_SQLITE_TUNING'] = 'on' if profile == 'tuned' else 'off'
+    os.environ['CAPSA_NOTIFY_WORKER'] = 'off'
+    os.chdir(ROOT)
+    import app as capsa
+    # 측정 대상은 DB이므로 페이지 캐시는 끔
+    capsa.app = capsa.create_app({'PAGE_CACHE_ENABLED': False})
+    return capsa
+
+
+def _seed(db_path, profile, jobs):
+    capsa = _load_app(db_path, profile)
+    lines = io.StringIO(''.join(
+        json.dumps({'title': f'Engineer {i}', 'company': f'Company {i % 500}',
+                    'location': ('Seoul', 'New York', 'Remote')[i % 3],
+                    'apply_url': f'https://example.com/jobs/{i}', 'description': f'Job description {i}'}) + '\n'
+        for i in range(jobs)
+    ))
+    with capsa.app.app_context():
+        capsa.ensure_schema()
+        capsa.import_jobs(lines, 'jsonl')
+
+
+def _worker(db_path, profile, kind, start_at, seconds, results):
+    capsa = _load_app(db_path, profile)
+    client = capsa.app.test_client()
+    latencies = []
+    errors = 0
+    while time.time() < start_at:
+        time.sleep(0.001)
+    deadline = start_at + seconds
+    n = 0
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            if kind == 'read':
+                response = client.get(f'/api/jobs?limit=20&location={("seoul", "remote", "")[n % 3]}')
+                ok = response.status_code == 200
+            else:
+                response = client.post('/stakeholder-hub', data={
+                    'name': f'부하 {os.getpid()}-{n}', 'email': 'load@example.com', 'company': 'LoadTest',
+                    'role': 'Tester', 'help_type': 'Mentoring', 'description': '부하 테스트',
+                })
+                ok = response.status_code in (200, 302)
+        except Exception:
+            ok = False
+        elapsed = time.perf_counter() - started
+        if ok:
+            latencies.append(elapsed)
+        else:
+            errors += 1
+        n += 1
+    results.put((kind, latencies, errors))
+
+
+def run_profile(profile, readers, writers, seconds, jobs):
+    directory = tempfile.mkdtemp(prefix=f'capsa-load-{profile}-')
+    db_path = os.path.join(directory, 'capsa.db')
+    ctx = multiprocessing.get_context('spawn')
+    try:
+        seeder = ctx.Process(target=_seed, args=(db_path, profile, jobs))
+        seeder.start()
+        seeder.join()
+
+        results = ctx.Queue()
+        # 워커가 모두 앱을 불러온 뒤 동시에 시작하도록 시작 시각을 넉넉히 잡음
+        start_at = time.time() + 3
+        processes = [ctx.Process(target=_worker, args=(db_path, profile, kind, start_at, seconds, results))
+                     for kind in ['read'] * readers + ['write'] * writers]
+        for process in processes:
+            process.start()
+        collected = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    summary = {}
+    for kind in ('read', 'write'):
+        latencies = sorted(l for k, ls, _ in collected if k == kind for l in ls)
+        errors = sum(e for k, _, e in collected if k == kind)
+        if not latencies:
+            summary[kind] = (0.0, None, None, errors)
+            continue
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        summary[kind] = (len(latencies) / seconds, statistics.median(latencies), p95, errors)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 동시 읽기/쓰기 부하 테스트')
+    parser.add_argument('--profile', choices=PROFILES)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--jobs', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f'읽기 {args.readers}, 쓰기 {args.writers} 프로세스, {args.seconds:g}초, 채용공고 {args.jobs:,}개')
+    print(f"{'프로필':<8} {'종류':<6} {'처리량/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'실패':>5}")
+    for profile in ([args.profile] if args.profile else PROFILES):
+        summary = run_profile(profile, args.readers, args.writers, args.seconds, args.jobs)
+        for kind, (rate, p50, p95, errors) in summary.items():
+            p50_text = f'{p50 * 1000:.1f}' if p50 is not None else '-'
+            p95_text = f'{p95 * 1000:.1f}' if p95 is not None else '-'
+            print(f'{profile:<8} {kind:<6} {rate:>9.1f} {p50_text:>8} {p95_text:>8} {errors:>5}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+전문가 추천 색인(expert_match.MatchIndex) 적재/조회 시간 측정
+
+전문가 N명, 요청 M건을 넣은 뒤
+- 첫 조회 (IDF/노름 계산 포함)
+- 이후 조회 p50/p99 (top-k)
+- 새 요청 추가 직후 조회 (증분 반영 비용)
+를 출력
+
+사용법: python benchmarks/expert_match.py [--experts 10000] [--requests 50000] [--k 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from expert_match import MatchIndex, expert_document, request_document  # noqa: E402
+
+WORDS = ['머신러닝', '추천', '시스템', '투자', '유치', '마케팅', '채용', '디자인', '데이터', '플랫폼',
+         'backend', 'python', 'react', 'growth', 'fundraising', 'legal', 'finance', 'product',
+         'strategy', 'kubernetes']
+HELP_TYPES = ['Mentoring', 'Investment', 'Consulting', 'Networking', 'Technical', 'Business']
+ROLES = ['CTO', 'Product Lead', 'Investor', 'Designer', 'Marketing Director']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전문가 추천 색인 조회 시간 측정')
+    parser.add_argument('--experts', type=int, default=10000)
+    parser.add_argument('--requests', type=int, default=50000)
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--queries', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    index = MatchIndex()
+    started = time.perf_counter()
+    for i in range(args.experts):
+        index.add_expert(i, expert_document(SimpleNamespace(
+            expertise=' '.join(rng.choices(WORDS, k=40)) + f' 경력 {i % 30}년',
+            help_types=','.join(rng.sample(HELP_TYPES, 2)), role=rng.choice(ROLES),
+        )))
+    for i in range(args.requests):
+        index.add_request(i, request_document(SimpleNamespace(
+            description=' '.join(rng.choices(WORDS, k=30)), help_type=rng.choice(HELP_TYPES),
+            role=rng.choice(ROLES),
+        )))
+    print(f'적재 (전문가 {args.experts:,}명, 요청 {args.requests:,}건): {time.perf_counter() - started:.2f}s')
+
+    started = time.perf_counter()
+    index.top_experts(0, k=args.k)
+    print(f'첫 조회 (IDF/노름 계산 포함): {(time.perf_counter() - started) * 1000:.1f}ms')
+
+    latencies = []
+    for _ in range(args.queries):
+        request_id = rng.randrange(args.requests)
+        started = time.perf_counter()
+        index.top_experts(request_id, k=args.k)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f'조회 top-{args.k} {args.queries}회: p50 {p50:.2f}ms, p99 {p99:.2f}ms')
+
+    started = time.perf_counter()
+    index.add_request(args.requests, request_document(SimpleNamespace(
+        description='머신러닝 추천 시스템 도입', help_type='Technical', role='CTO')))
+    index.top_experts(args.requests, k=args.k)
+    print(f'새 요청 추가 + 조회: {(time.perf_counter() - started) * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+비슷한 공고 색인(job_recommend) 배치/조회 시간 측정
+
+공고 N개로
+- 배치 (TF-IDF + 공고별 top-k 이웃 계산) 및 저장 시간, 파일 크기
+- 색인 열기 (mmap)
+- 비슷한 공고 / 추천 조회 p50/p99
+- 배치 이후 공고 증분 추가 시간
+을 출력
+
+사용법: python benchmarks/job_recommend.py [--jobs 50000] [--k 20] [--vocabulary 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from job_recommend import RecommendationIndex, build, current_version, save  # noqa: E402
+
+WORDS = ['backend', 'frontend', 'python', 'react', 'kubernetes', 'data', 'engineer', 'designer',
+         'product', 'manager', 'marketing', 'growth', 'sales', 'finance', 'legal', 'mobile',
+         '백엔드', '프론트엔드', '데이터', '디자이너', '마케팅', '개발자', '인턴', '신입', '경력']
+LOCATIONS = ['seoul', 'busan', 'remote', 'san francisco', 'new york', 'tokyo']
+
+
+def percentile(latencies, q):
+    return latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000
+
+
+def measure(fn, rng, queries, count):
+    latencies = []
+    for _ in range(queries):
+        job_id = rng.randrange(1, count + 1)
+        started = time.perf_counter()
+        fn(job_id)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return percentile(latencies, 0.5), percentile(latencies, 0.99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='비슷한 공고 색인 배치/조회 시간 측정')
+    parser.add_argument('--jobs', type=int, default=50000)
+    parser.add_argument('--k', type=int, default=20)
+    parser.add_argument('--vocabulary', type=int, default=20000, help='흔한 단어 외 단어 수')
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument('--added', type=int, default=200, help='배치 이후 증분 추가할 공고 수')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    # 실제 공고처럼 흔한 단어 + 빈도가 지프 분포인 기술/도메인 단어
+    vocabulary = WORDS + [f'skill{i}' for i in range(args.vocabulary)]
+    weights = [50.0] * len(WORDS) + [1.0 / (i + 1) for i in range(args.vocabulary)]
+
+    def text(count):
+        return ' '.join(rng.choices(vocabulary, weights, k=count))
+
+    rows = [(i, text(4), text(80), rng.choice(LOCATIONS)) for i in range(1, args.jobs + 1)]
+
+    with tempfile.TemporaryDirectory() as path:
+        started = time.perf_counter()
+        arrays, meta = build(rows, args.k)
+        print(f'배치 (공고 {args.jobs:,}개, 용어 {len(meta["vocabulary"]):,}개): '
+              f'{time.perf_counter() - started:.2f}s')
+        started = time.perf_counter()
+        version = save(path, arrays, meta)
+        size = sum(entry.stat().st_size for entry in os.scandir(os.path.join(path, version)))
+        print(f'저장: {time.perf_counter() - started:.2f}s, {size / 1024 / 1024:.1f}MB')
+
+        started = time.perf_counter()
+        index = RecommendationIndex(os.path.join(path, current_version(path)))
+        print(f'열기 (mmap): {(time.perf_counter() - started) * 1000:.1f}ms')
+
+        p50, p99 = measure(lambda job_id: index.similar(job_id, 6), rng, args.queries, args.jobs)
+        print(f'비슷한 공고 {args.queries}회: p50 {p50:.3f}ms, p99 {p99:.3f}ms')
+        history = [rng.randrange(1, args.jobs + 1) for _ in range(19)]
+        p50, p99 = measure(lambda job_id: index.recommend(history + [job_id], 6), rng, args.queries, args.jobs)
+        print(f'추천 (본 공고 20개) {args.queries}회: p50 {p50:.3f}ms, p99 {p99:.3f}ms')
+
+        started = time.perf_counter()
+        for i in range(args.jobs + 1, args.jobs + 1 + args.added):
+            index.add_job(i, text(4), text(80), rng.choice(LOCATIONS))
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f'증분 추가 {args.added}개: 공고당 {elapsed / max(args.added, 1):.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
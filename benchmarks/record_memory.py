@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+CAPSA.py 레코드 표현별 메모리 사용량 비교
+
+- dict 기반 클래스 (__slots__ 도입 전 JobPost와 같은 구조)
+- __slots__ + intern (현재 JobPost)
+- ColumnarTable (열 단위 배열)
+
+사용법: python benchmarks/record_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from CAPSA import JOB_COLUMNS, ColumnarTable, JobPost  # noqa: E402
+
+LOCATIONS = ['Seoul', 'Busan', 'Remote', 'San Francisco', 'New York', 'Pangyo']
+
+
+class DictJobPost:
+    """비교용: 속성 dict를 가지는 기존 방식"""
+
+    def __init__(self, title, company, location, apply_url, description, posted_at):
+        self.id = None
+        self.title = title
+        self.company = company
+        self.location = location
+        self.apply_url = apply_url
+        self.description = description
+        self.posted_at = posted_at
+
+
+def _fresh(value):
+    # 같은 내용의 새 문자열 객체 (파일/DB에서 읽은 값은 레코드마다 별도 객체)
+    return (' ' + value)[1:]
+
+
+def job_rows(count, seed=0):
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    for i in range(count):
+        yield (
+            f'Engineer {i}',
+            f'Company {rng.randrange(500)}',
+            _fresh(rng.choice(LOCATIONS)),
+            f'https://example.com/jobs/{i}',
+            f'Job description {i}',
+            base + timedelta(minutes=rng.randrange(10 ** 6)),
+        )
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='레코드 표현별 메모리 비교')
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+    count = args.count
+
+    cases = [
+        ('dict 기반 클래스', lambda: [DictJobPost(*row) for row in job_rows(count)]),
+        ('__slots__ + intern', lambda: [JobPost(*row) for row in job_rows(count)]),
+        ('ColumnarTable', lambda: ColumnarTable.from_records(
+            JobPost, JOB_COLUMNS, (JobPost(*row) for row in job_rows(count)))),
+    ]
+    print(f'레코드 {count:,}개')
+    print(f"{'표현':22s} {'전체(MB)':>10s} {'레코드당(B)':>12s} {'최대(MB)':>10s}")
+    for name, build in cases:
+        size, peak = measure(build)
+        print(f'{name:22s} {size / 2 ** 20:10.1f} {size / count:12.0f} {peak / 2 ** 20:10.1f}')
+
+
+if __name__ == '__main__':
+    main()
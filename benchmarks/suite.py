@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+라우트/CAPSA.py 엔진 벤치마크 모음 (결과를 JSON으로 남기고 기준 결과와 비교)
+
+크기(채용공고 수)마다 임시 SQLite DB와 메모리 CMS를 같은 시드로 채운 뒤
+- route.*  : Flask 테스트 클라이언트로 /jobs, /community, /api/jobs, /admin/dashboard 요청
+             (페이지 캐시/요청 계측은 꺼서 매번 실제로 처리)
+- engine.* : AdminCMS.find_jobs, public_job_board, public_bulletin
+- static.* : build_static.create_static_site(from_db=True) (임시 폴더에 생성, 크기 상한 있음)
+를 실행해서 처리량(회/초), 지연 시간 p50/p99, 최대 메모리(tracemalloc)를 기록
+
+사용법: python benchmarks/suite.py [--sizes 1000,10000] [--output results.json]
+        [--baseline baseline.json] [--threshold 0.25] [--only route.jobs]
+        100k/1M은 --sizes 100000,1000000 으로 지정 (적재에 수 분 걸림)
+        기준과 비교해서 나빠진 항목이 있으면 종료 코드 1
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, ROOT)
+
+# 앱 모듈을 불러오기 전에 설정 (알림 워커 스레드를 띄우지 않음)
+os.environ.setdefault('CAPSA_NOTIFY_WORKER', 'off')
+
+import app as capsa  # noqa: E402
+import build_static  # noqa: E402
+from CAPSA import AdminCMS, Announcement, JobPost, public_bulletin, public_job_board  # noqa: E402
+
+SEED = 2024
+BASE_TIME = datetime(2024, 1, 1)
+TITLES = ['Backend Engineer', 'Frontend Engineer', 'Data Scientist', 'Product Manager',
+          '백엔드 개발자', '데이터 엔지니어', 'DevOps Engineer', 'UX Designer']
+LOCATIONS = ['Seoul', 'Busan', 'Remote', 'San Francisco', 'New York', 'Pangyo']
+HELP_TYPES = ['Mentoring', 'Referral', 'Interview Prep', 'Career Advice']
+STATUSES = ['Pending', 'In Progress', 'Completed']
+# 정적 사이트는 공고마다 파일을 쓰므로 이 크기까지만 측정 (--static-max로 변경)
+STATIC_MAX_SIZE = 10000
+# 비교 항목: (이름, 클수록 나쁨, 허용 비율 배수). p99는 반복 실행 간 편차가 커서 두 배까지 허용
+COMPARED = (('p50_ms', True, 1), ('p99_ms', True, 2), ('throughput', False, 1), ('peak_kb', True, 1))
+
+
+# 데이터
+def job_rows(size):
+    rng = random.Random(SEED + size)
+    for i in range(size):
+        yield {
+            'title': f'{rng.choice(TITLES)} {i}',
+            'company': f'Company {rng.randrange(max(size // 20, 10))}',
+            'location': rng.choice(LOCATIONS),
+            'apply_url': f'https://example.com/jobs/{i}',
+            'description': f'Job description {i} ' + ' '.join(rng.sample(TITLES, 3)),
+            'posted_at': (BASE_TIME + timedelta(minutes=rng.randrange(10 ** 6))).isoformat(),
+        }
+
+
+def announcement_rows(size):
+    rng = random.Random(SEED + size + 1)
+    for i in range(max(size // 100, 20)):
+        yield {
+            'title': f'공지 {i}',
+            'content': f'커뮤니티 공지 내용 {i}',
+            'pinned': rng.random() < 0.02,
+            'posted_at': BASE_TIME + timedelta(minutes=rng.randrange(10 ** 6)),
+        }
+
+
+def request_rows(size):
+    rng = random.Random(SEED + size + 2)
+    for i in range(max(size // 10, 20)):
+        yield {
+            'name': f'요청자 {i}', 'email': f'user{i}@example.com', 'company': f'Company {i % 100}',
+            'role': 'Engineer', 'help_type': rng.choice(HELP_TYPES), 'description': f'요청 내용 {i}',
+            'submitted_at': BASE_TIME + timedelta(minutes=rng.randrange(10 ** 6)),
+            'status': rng.choice(STATUSES),
+        }
+
+
+def _chunks(rows, size=5000):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def seed_database(size):
+    capsa.ensure_schema()
+    lines = (json.dumps(row, ensure_ascii=False) + '\n' for row in job_rows(size))
+    report = capsa.import_jobs(lines, 'jsonl')
+    if report['inserted'] != size:
+        raise RuntimeError(f'채용공고 적재 실패: {report}')
+    for model, rows in ((capsa.Announcement, announcement_rows(size)),
+                        (capsa.StakeholderRequest, request_rows(size))):
+        for chunk in _chunks(rows):
+            capsa.db.session.execute(capsa.db.insert(model), chunk)
+    capsa.db.session.commit()
+
+
+def seed_cms(size):
+    cms = AdminCMS()
+    for row in job_rows(size):
+        cms.create_job(JobPost(row['title'], row['company'], row['location'], row['apply_url'],
+                               row['description'], datetime.fromisoformat(row['posted_at'])))
+    for row in announcement_rows(size):
+        cms.create_announcement(Announcement(row['title'], row['content'], row['pinned'], row['posted_at']))
+    return cms
+
+
+# 측정
+def measure(fn, min_iterations, min_seconds, max_iterations, warmup=2):
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < max_iterations:
+        t0 = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t0)
+        if len(latencies) >= min_iterations and time.perf_counter() - started >= min_seconds:
+            break
+    latencies.sort()
+
+    # 메모리는 따로 한 번 더 실행 (tracemalloc이 켜져 있으면 느려지므로 시간 측정과 분리)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000
+
+    return {
+        'iterations': len(latencies),
+        'throughput': len(latencies) / sum(latencies),
+        'p50_ms': percentile(0.5),
+        'p99_ms': percentile(0.99),
+        'peak_kb': peak / 1024,
+    }
+
+
+def route_scenarios(flask_app, size):
+    client = flask_app.test_client()
+    admin_client = flask_app.test_client()
+    with admin_client.session_transaction() as session:
+        session['admin'] = True
+    with flask_app.app_context():
+        # 목록 중간 지점의 커서 (깊은 페이지도 첫 페이지와 같은 비용인지 확인)
+        middle = capsa.db.session.execute(
+            capsa.db.select(capsa.JobPost.posted_at, capsa.JobPost.id)
+            .order_by(capsa.JobPost.posted_at.desc(), capsa.JobPost.id.desc())
+            .offset(size // 2).limit(1)
+        ).one()
+        cursor = capsa.encode_cursor(middle.posted_at, middle.id)
+
+    def get(test_client, url):
+        def run():
+            response = test_client.get(url)
+            if response.status_code != 200:
+                raise RuntimeError(f'{url}: {response.status_code}')
+        return run
+
+    return [
+        ('route.jobs', get(client, '/jobs')),
+        ('route.jobs_cursor', get(client, f'/jobs?cursor={cursor}')),
+        ('route.jobs_location', get(client, '/jobs?location=seoul')),
+        ('route.jobs_search', get(client, '/jobs?q=engineer')),
+        ('route.community', get(client, '/community')),
+        ('route.api_jobs', get(client, '/api/jobs?limit=50')),
+        ('route.admin_dashboard', get(admin_client, '/admin/dashboard')),
+    ]
+
+
+def engine_scenarios(cms):
+    def quiet(fn, *args, **kwargs):
+        # 카드 출력(print)은 측정에서 버림
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                fn(*args, **kwargs)
+        return run
+
+    return [
+        ('engine.find_jobs', lambda: cms.find_jobs({'location': 'Seoul'}, limit=20)),
+        ('engine.public_job_board', quiet(public_job_board, cms.job_posts,
+                                          {'location': 'Seoul', 'company': 'Company 7'})),
+        ('engine.public_bulletin', quiet(public_bulletin, cms.bulletin, limit=20)),
+    ]
+
+
+def static_scenario(directory):
+    # create_static_site는 현재 폴더의 static/을 읽고 docs/에 씀 -> 임시 폴더에서 실행
+    site_dir = os.path.join(directory, 'site')
+    os.makedirs(site_dir, exist_ok=True)
+    link = os.path.join(site_dir, 'static')
+    if not os.path.exists(link):
+        os.symlink(os.path.join(ROOT, 'static'), link)
+
+    def build():
+        previous = os.getcwd()
+        os.chdir(site_dir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                build_static.create_static_site(incremental=False, from_db=True, workers=1)
+        finally:
+            os.chdir(previous)
+
+    return [('static.create_static_site', build)]
+
+
+def run_size(size, args, results):
+    directory = tempfile.mkdtemp(prefix=f'capsa-bench-{size}-')
+    try:
+        flask_app = capsa.create_app({
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.join(directory, "capsa.db")}',
+            'PAGE_CACHE_ENABLED': False,
+            'METRICS_ENABLED': False,
+            'NOTIFY_WORKER': 'off',
+        })
+        # build_static의 'from app import app'도 이 앱을 쓰도록
+        capsa.app = flask_app
+        started = time.perf_counter()
+        with flask_app.app_context():
+            seed_database(size)
+        cms = seed_cms(size)
+        print(f'[{size:,}] 데이터 적재 {time.perf_counter() - started:.1f}s')
+
+        scenarios = route_scenarios(flask_app, size) + engine_scenarios(cms)
+        if size <= args.static_max:
+            scenarios += static_scenario(directory)
+        for name, fn in scenarios:
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            if name.startswith('static.'):
+                result = measure(fn, min_iterations=3, min_seconds=0, max_iterations=3, warmup=1)
+            else:
+                result = measure(fn, args.min_iterations, args.min_seconds, args.max_iterations)
+            results[f'{name}@{size}'] = result
+            print(f'  {name:<28} {result["throughput"]:>10.1f}/s  p50 {result["p50_ms"]:>8.2f}ms  '
+                  f'p99 {result["p99_ms"]:>8.2f}ms  mem {result["peak_kb"]:>9.0f}KB')
+        with flask_app.app_context():
+            capsa.db.engine.dispose()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# 기록/비교
+def environment():
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': revision,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': SEED,
+    }
+
+
+def compare(results, baseline, threshold, memory_threshold):
+    """기준보다 나빠진 항목 목록 [(키, 지표, 기준값, 현재값)]. 한쪽에만 있는 키는 건너뜀"""
+    regressions = []
+    for key, current in sorted(results.items()):
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, higher_is_worse, factor in COMPARED:
+            limit = memory_threshold if metric == 'peak_kb' else threshold * factor
+            old, new = base.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            worse = new > old * (1 + limit) if higher_is_worse else new < old / (1 + limit)
+            if worse:
+                regressions.append((key, metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CAPSA 라우트/엔진 벤치마크')
+    parser.add_argument('--sizes', default='1000,10000', help='쉼표로 구분한 채용공고 수')
+    parser.add_argument('--output', default='benchmark-results.json')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.25, help='시간/처리량 허용 악화 비율')
+    parser.add_argument('--memory-threshold', type=float, default=0.10, help='메모리 허용 증가 비율')
+    parser.add_argument('--only', action='append', help='이 접두사로 시작하는 시나리오만 (여러 번 지정 가능)')
+    parser.add_argument('--min-iterations', type=int, default=30)
+    parser.add_argument('--min-seconds', type=float, default=1.0)
+    parser.add_argument('--max-iterations', type=int, default=2000)
+    parser.add_argument('--static-max', type=int, default=STATIC_MAX_SIZE)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = {}
+    for size in sizes:
+        run_size(size, args, results)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': dict(environment(), sizes=sizes), 'results': results}, f, ensure_ascii=False,
+                  indent=2)
+    print(f'결과: {args.output}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline['results'], args.threshold, args.memory_threshold)
+        for key, metric, old, new in regressions:
+            print(f'  악화 {key} {metric}: {old:.2f} -> {new:.2f}')
+        compared = sum(1 for key in results if key in baseline['results'])
+        print(f'기준 {args.baseline} 대비 {compared}개 비교: {"실패" if regressions else "통과"}')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,85 +2,231 @@
 """
 간단한 정적 사이트 생성기
 GitHub Pages 배포용
+
+기본은 증분 빌드: docs/.build-manifest.json에 출력 파일별 입력 해시를 기록하고
+입력이 바뀐 파일만 다시 쓴다. 바뀌지 않은 파일은 mtime도 그대로 유지되어
+GitHub Pages 배포/CDN 캐시가 유지된다. --full 옵션은 docs를 지우고 전체 재생성.
+
+CSS/JS는 최소화 후 내용 해시 파일명(static/css/style.<hash>.css)과 .gz/.br
+압축본으로도 출력하고, 생성 페이지의 참조를 해시 파일명으로 바꾼다. 원본
+경로의 파일도 그대로 복사해서 손으로 만든 페이지의 참조는 계속 동작한다.
+
+--from-db 옵션은 샘플 데이터 대신 app.py의 JobPost/Announcement 테이블을
+청크 단위로 스트리밍하면서 채용공고별 상세 페이지(docs/jobs/job-<id>.html)와
+페이지 단위 목록(jobs.html, jobs-2.html, ...)을 생성한다. 한 번에 메모리에
+올리는 것은 목록 한 페이지 분량뿐이다 (검색 색인용 요약은 예외).
+
+목록 페이지의 검색/필터는 search/ 아래 샤딩된 역색인(search_index.py)을
+필요할 때만 가져와서 동작하므로 전체 채용공고를 한 페이지에 넣지 않아도 된다.
 """
 
+import argparse
+import hashlib
+import html
+import json
 import os
 import shutil
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-def create_static_site():
-    """정적 사이트 생성"""
-    
-    # docs 폴더 생성 (GitHub Pages용)
-    docs_dir = 'docs'
-    if os.path.exists(docs_dir):
-        shutil.rmtree(docs_dir)
-    os.makedirs(docs_dir)
-    
-    # static 폴더 복사
-    if os.path.exists('static'):
-        shutil.copytree('static', os.path.join(docs_dir, 'static'))
-    
-    # 샘플 데이터
-    sample_jobs = [
-        {
-            'id': 1,
-            'title': '시니어 백엔드 개발자',
-            'company': '테크스타트업 A',
-            'location': '서울 강남구',
-            'job_type': '정규직',
-            'description': 'Python/Django 기반 백엔드 시스템 개발 및 운영을 담당합니다.',
-            'requirements': '• Python 5년 이상 경험\n• Django/Flask 프레임워크 숙련\n• AWS 클라우드 경험\n• 데이터베이스 설계 경험',
-            'created_at': '2024-08-31'
-        },
-        {
-            'id': 2,
-            'title': '프론트엔드 개발자',
-            'company': '디지털 에이전시 B',
-            'location': '서울 마포구',
-            'job_type': '계약직',
-            'description': 'React 기반 웹 애플리케이션 개발 및 UI/UX 구현을 담당합니다.',
-            'requirements': '• React 3년 이상 경험\n• TypeScript 숙련\n• 반응형 웹 개발 경험\n• Git 협업 경험',
-            'created_at': '2024-08-30'
-        },
-        {
-            'id': 3,
-            'title': '데이터 사이언티스트',
-            'company': '핀테크 스타트업 C',
-            'location': '서울 송파구',
-            'job_type': '정규직',
-            'description': '금융 데이터 분석 및 머신러닝 모델 개발을 담당합니다.',
-            'requirements': '• Python 데이터 분석 3년 이상\n• 머신러닝/딥러닝 경험\n• SQL 숙련\n• 금융 도메인 이해',
-            'created_at': '2024-08-29'
-        }
-    ]
-    
-    sample_announcements = [
-        {
-            'id': 1,
-            'title': 'CAPSA 플랫폼 오픈 베타 시작!',
-            'content': '안녕하세요! CAPSA 플랫폼의 오픈 베타가 시작되었습니다. 많은 관심과 참여 부탁드립니다.',
-            'author': 'CAPSA 운영팀',
-            'created_at': '2024-08-31'
-        },
-        {
-            'id': 2,
-            'title': '첫 번째 네트워킹 이벤트 개최',
-            'content': '9월 15일 강남에서 첫 번째 오프라인 네트워킹 이벤트를 개최합니다. 많은 참여 바랍니다!',
-            'author': '이벤트팀',
-            'created_at': '2024-08-30'
-        },
-        {
-            'id': 3,
-            'title': '전문가 멘토링 프로그램 런칭',
-            'content': '경력 개발을 위한 1:1 멘토링 프로그램이 시작됩니다. 신청은 전문가 연결 메뉴에서 가능합니다.',
-            'author': '서비스팀',
-            'created_at': '2024-08-29'
-        }
-    ]
-    
-    # 기본 HTML 템플릿
-    base_template = """<!DOCTYPE html>
+import assets
+from search_index import SearchIndexBuilder
+
+MANIFEST_NAME = '.build-manifest.json'
+MANIFEST_VERSION = 1
+JOBS_PER_LISTING_PAGE = 50
+DB_CHUNK_SIZE = 500
+# 워커 프로세스 하나에 한 번에 넘기는 페이지 수 (프로세스 간 통신 비용 분산)
+RENDER_BATCH_SIZE = 64
+COMMUNITY_ANNOUNCEMENTS = 50
+
+
+def hash_inputs(*parts):
+    """출력 하나를 만드는 입력들(템플릿, 데이터, 원본 파일)의 해시"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체 (빌드 중단 시 반쯤 쓰인 파일이 남지 않게)"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def file_stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def entry_is_fresh(entry, input_hash, path):
+    return entry is not None and entry['input'] == input_hash and entry['stat'] == file_stat(path)
+
+
+class BuildManifest:
+    """출력 파일별 입력 해시와 파일 상태(크기, mtime)를 기록"""
+
+    def __init__(self, docs_dir, files=None):
+        self.docs_dir = docs_dir
+        self.files = files or {}
+        self.produced = set()
+        self.written = []
+
+    @classmethod
+    def load(cls, docs_dir):
+        path = os.path.join(docs_dir, MANIFEST_NAME)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(docs_dir)
+        if data.get('version') != MANIFEST_VERSION:
+            return cls(docs_dir)
+        return cls(docs_dir, data.get('files', {}))
+
+    def is_fresh(self, relpath, input_hash):
+        """입력이 같고, 출력 파일이 마지막 빌드 이후 수정/삭제되지 않았으면 True"""
+        self.produced.add(relpath)
+        return entry_is_fresh(self.files.get(relpath), input_hash,
+                              os.path.join(self.docs_dir, relpath))
+
+    def record(self, relpath, input_hash, stat=None, written=True):
+        self.produced.add(relpath)
+        if stat is None:
+            stat = file_stat(os.path.join(self.docs_dir, relpath))
+        self.files[relpath] = {'input': input_hash, 'stat': stat}
+        if written:
+            self.written.append(relpath)
+
+    def write(self, relpath, input_hash, render):
+        """입력이 바뀌었을 때만 render()를 호출해 파일을 씀"""
+        if self.is_fresh(relpath, input_hash):
+            return False
+        write_atomic(os.path.join(self.docs_dir, relpath), render())
+        self.record(relpath, input_hash)
+        return True
+
+    def copy(self, src, relpath):
+        input_hash = hash_file(src)
+        if self.is_fresh(relpath, input_hash):
+            return False
+        dest = os.path.join(self.docs_dir, relpath)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copy2(src, dest)
+        self.record(relpath, input_hash)
+        return True
+
+    def prune(self):
+        """이전 빌드가 만들었지만 이번에는 만들지 않은 파일 삭제 (손으로 만든 파일은 건드리지 않음)"""
+        removed = []
+        for relpath in sorted(set(self.files) - self.produced):
+            try:
+                os.remove(os.path.join(self.docs_dir, relpath))
+            except FileNotFoundError:
+                pass
+            del self.files[relpath]
+            removed.append(relpath)
+        return removed
+
+    def save(self):
+        data = {'version': MANIFEST_VERSION, 'files': dict(sorted(self.files.items()))}
+        write_atomic(os.path.join(self.docs_dir, MANIFEST_NAME),
+                     json.dumps(data, ensure_ascii=False, indent=1))
+
+
+def copy_static(manifest, static_dir='static'):
+    """static 폴더를 docs/static으로 복사 (바뀐 파일만)"""
+    if not os.path.exists(static_dir):
+        return
+    for root, dirs, files in os.walk(static_dir):
+        dirs.sort()
+        for file in sorted(files):
+            src = os.path.join(root, file)
+            relpath = os.path.join('static', os.path.relpath(src, static_dir)).replace(os.sep, '/')
+            manifest.copy(src, relpath)
+
+
+SAMPLE_JOBS = [
+    {
+        'id': 1,
+        'title': '시니어 백엔드 개발자',
+        'company': '테크스타트업 A',
+        'location': '서울 강남구',
+        'job_type': '정규직',
+        'description': 'Python/Django 기반 백엔드 시스템 개발 및 운영을 담당합니다.',
+        'requirements': '• Python 5년 이상 경험\n• Django/Flask 프레임워크 숙련\n• AWS 클라우드 경험\n• 데이터베이스 설계 경험',
+        'created_at': '2024-08-31'
+    },
+    {
+        'id': 2,
+        'title': '프론트엔드 개발자',
+        'company': '디지털 에이전시 B',
+        'location': '서울 마포구',
+        'job_type': '계약직',
+        'description': 'React 기반 웹 애플리케이션 개발 및 UI/UX 구현을 담당합니다.',
+        'requirements': '• React 3년 이상 경험\n• TypeScript 숙련\n• 반응형 웹 개발 경험\n• Git 협업 경험',
+        'created_at': '2024-08-30'
+    },
+    {
+        'id': 3,
+        'title': '데이터 사이언티스트',
+        'company': '핀테크 스타트업 C',
+        'location': '서울 송파구',
+        'job_type': '정규직',
+        'description': '금융 데이터 분석 및 머신러닝 모델 개발을 담당합니다.',
+        'requirements': '• Python 데이터 분석 3년 이상\n• 머신러닝/딥러닝 경험\n• SQL 숙련\n• 금융 도메인 이해',
+        'created_at': '2024-08-29'
+    }
+]
+
+SAMPLE_ANNOUNCEMENTS = [
+    {
+        'id': 1,
+        'title': 'CAPSA 플랫폼 오픈 베타 시작!',
+        'content': '안녕하세요! CAPSA 플랫폼의 오픈 베타가 시작되었습니다. 많은 관심과 참여 부탁드립니다.',
+        'author': 'CAPSA 운영팀',
+        'created_at': '2024-08-31'
+    },
+    {
+        'id': 2,
+        'title': '첫 번째 네트워킹 이벤트 개최',
+        'content': '9월 15일 강남에서 첫 번째 오프라인 네트워킹 이벤트를 개최합니다. 많은 참여 바랍니다!',
+        'author': '이벤트팀',
+        'created_at': '2024-08-30'
+    },
+    {
+        'id': 3,
+        'title': '전문가 멘토링 프로그램 런칭',
+        'content': '경력 개발을 위한 1:1 멘토링 프로그램이 시작됩니다. 신청은 전문가 연결 메뉴에서 가능합니다.',
+        'author': '서비스팀',
+        'created_at': '2024-08-29'
+    }
+]
+
+# 기본 HTML 템플릿 ({root}: 페이지 위치에서 docs 루트까지의 상대 경로)
+BASE_TEMPLATE = """<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -88,13 +234,13 @@ def create_static_site():
     <title>{title}</title>
     <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <link href="./static/css/style.css" rel="stylesheet">
+    <link href="{root}static/css/style.css" rel="stylesheet">
 </head>
 <body>
     <!-- 네비게이션 바 -->
     <nav class="navbar navbar-expand-lg navbar-dark bg-primary">
         <div class="container">
-            <a class="navbar-brand fw-bold" href="./index.html">
+            <a class="navbar-brand fw-bold" href="{root}index.html">
                 <i class="fas fa-network-wired me-2"></i>CAPSA
             </a>
             <button class="navbar-toggler" type="button" data-bs-toggle="collapse" data-bs-target="#navbarNav">
@@ -103,16 +249,16 @@ def create_static_site():
             <div class="collapse navbar-collapse" id="navbarNav">
                 <ul class="navbar-nav me-auto">
                     <li class="nav-item">
-                        <a class="nav-link" href="./index.html">홈</a>
+                        <a class="nav-link" href="{root}index.html">홈</a>
                     </li>
                     <li class="nav-item">
-                        <a class="nav-link" href="./jobs.html">채용정보</a>
+                        <a class="nav-link" href="{root}jobs.html">채용정보</a>
                     </li>
                     <li class="nav-item">
-                        <a class="nav-link" href="./stakeholder-hub.html">전문가 연결</a>
+                        <a class="nav-link" href="{root}stakeholder-hub.html">전문가 연결</a>
                     </li>
                     <li class="nav-item">
-                        <a class="nav-link" href="./community.html">커뮤니티</a>
+                        <a class="nav-link" href="{root}community.html">커뮤니티</a>
                     </li>
                 </ul>
                 <ul class="navbar-nav">
@@ -148,12 +294,12 @@ def create_static_site():
     </footer>
 
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-    <script src="./static/js/main.js"></script>
+    <script src="{root}static/js/main.js"></script>
 </body>
 </html>"""
 
-    # 홈페이지 생성
-    home_content = """
+# 홈페이지
+HOME_CONTENT = """
     <div class="hero-section bg-primary text-white py-5">
         <div class="container">
             <div class="row align-items-center">
@@ -304,116 +450,9 @@ def create_static_site():
             </div>
         </section>
     </div>"""
-    
-    # 채용정보 페이지 콘텐츠
-    jobs_content = f"""
-    <div class="container">
-        <div class="row">
-            <div class="col-12">
-                <h1 class="mb-4">
-                    <i class="fas fa-briefcase text-primary me-2"></i>채용정보
-                </h1>
-                
-                <!-- 검색 및 필터 -->
-                <div class="card mb-4">
-                    <div class="card-body">
-                        <div class="row g-3">
-                            <div class="col-md-4">
-                                <input type="text" class="form-control" placeholder="제목, 회사명 검색..." id="searchInput">
-                            </div>
-                            <div class="col-md-3">
-                                <select class="form-select" id="locationFilter">
-                                    <option value="">전체 지역</option>
-                                    <option value="서울">서울</option>
-                                    <option value="경기">경기</option>
-                                    <option value="부산">부산</option>
-                                </select>
-                            </div>
-                            <div class="col-md-3">
-                                <select class="form-select" id="typeFilter">
-                                    <option value="">전체 고용형태</option>
-                                    <option value="정규직">정규직</option>
-                                    <option value="계약직">계약직</option>
-                                    <option value="프리랜서">프리랜서</option>
-                                </select>
-                            </div>
-                            <div class="col-md-2">
-                                <button class="btn btn-primary w-100" onclick="filterJobs()">
-                                    <i class="fas fa-search"></i> 검색
-                                </button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
 
-                <!-- 채용정보 목록 -->
-                <div class="row g-4" id="jobsList">
-                    {"".join([f'''
-                    <div class="col-md-6 job-item" data-location="{job['location']}" data-type="{job['job_type']}">
-                        <div class="job-card border rounded-3 p-4 shadow-sm h-100">
-                            <div class="d-flex justify-content-between align-items-start mb-3">
-                                <h5 class="mb-0">{job['title']}</h5>
-                                <span class="badge bg-{'success' if job['job_type'] == '정규직' else 'info'}">{job['job_type']}</span>
-                            </div>
-                            <p class="text-muted mb-3">
-                                <i class="fas fa-building me-1"></i>{job['company']}
-                                <span class="mx-2">•</span>
-                                <i class="fas fa-map-marker-alt me-1"></i>{job['location']}
-                            </p>
-                            <p class="mb-3">{job['description']}</p>
-                            <div class="mb-3">
-                                <h6>주요 요구사항:</h6>
-                                <small class="text-muted">{job['requirements'].replace(chr(10), '<br>')}</small>
-                            </div>
-                            <div class="d-flex justify-content-between align-items-center">
-                                <small class="text-muted">
-                                    <i class="fas fa-calendar me-1"></i>{job['created_at']}
-                                </small>
-                                <div class="btn-group" role="group">
-                                    <button class="btn btn-outline-primary btn-sm" onclick="alert('데모 사이트입니다.')">
-                                        <i class="fas fa-heart me-1"></i>저장
-                                    </button>
-                                    <button class="btn btn-outline-secondary btn-sm" onclick="alert('데모 사이트입니다.')">
-                                        <i class="fas fa-share me-1"></i>공유
-                                    </button>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                    ''' for job in sample_jobs])}
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        function filterJobs() {{
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const locationFilter = document.getElementById('locationFilter').value;
-            const typeFilter = document.getElementById('typeFilter').value;
-            const jobItems = document.querySelectorAll('.job-item');
-            
-            jobItems.forEach(item => {{
-                const title = item.querySelector('h5').textContent.toLowerCase();
-                const company = item.querySelector('.fa-building').parentNode.textContent.toLowerCase();
-                const location = item.dataset.location;
-                const type = item.dataset.type;
-                
-                const matchesSearch = title.includes(searchTerm) || company.includes(searchTerm);
-                const matchesLocation = !locationFilter || location.includes(locationFilter);
-                const matchesType = !typeFilter || type === typeFilter;
-                
-                if (matchesSearch && matchesLocation && matchesType) {{
-                    item.style.display = 'block';
-                }} else {{
-                    item.style.display = 'none';
-                }}
-            }});
-        }}
-    </script>"""
-
-    # 전문가 연결 페이지 콘텐츠
-    stakeholder_content = """
+# 전문가 연결 페이지 콘텐츠
+STAKEHOLDER_CONTENT = """
     <div class="container">
         <div class="row">
             <div class="col-lg-8 mx-auto">
@@ -527,44 +566,127 @@ def create_static_site():
         }}
     </script>"""
 
-    # 커뮤니티 페이지 콘텐츠
-    community_content = f"""
+
+def job_detail_path(job):
+    return f"jobs/job-{job['id']}.html"
+
+
+def render_job_card(job):
+    """채용정보 목록의 카드 하나"""
+    title = html.escape(job['title'])
+    company = html.escape(job['company'])
+    location = html.escape(job['location'])
+    job_type = html.escape(job.get('job_type') or '')
+    description = html.escape(job['description'])
+    badge = ''
+    if job_type:
+        badge = f"""<span class="badge bg-{'success' if job_type == '정규직' else 'info'}">{job_type}</span>"""
+    requirements = ''
+    if job.get('requirements'):
+        requirements = f"""<div class="mb-3">
+                                <h6>주요 요구사항:</h6>
+                                <small class="text-muted">{html.escape(job['requirements']).replace(chr(10), '<br>')}</small>
+                            </div>"""
+    return f'''
+                    <div class="col-md-6 job-item" data-location="{location}" data-type="{job_type}">
+                        <div class="job-card border rounded-3 p-4 shadow-sm h-100">
+                            <div class="d-flex justify-content-between align-items-start mb-3">
+                                <h5 class="mb-0"><a href="{job_detail_path(job)}" class="text-decoration-none text-dark">{title}</a></h5>
+                                {badge}
+                            </div>
+                            <p class="text-muted mb-3">
+                                <i class="fas fa-building me-1"></i>{company}
+                                <span class="mx-2">•</span>
+                                <i class="fas fa-map-marker-alt me-1"></i>{location}
+                            </p>
+                            <p class="mb-3">{description}</p>
+                            {requirements}
+                            <div class="d-flex justify-content-between align-items-center">
+                                <small class="text-muted">
+                                    <i class="fas fa-calendar me-1"></i>{job['created_at']}
+                                </small>
+                                <div class="btn-group" role="group">
+                                    <button class="btn btn-outline-primary btn-sm" onclick="alert('데모 사이트입니다.')">
+                                        <i class="fas fa-heart me-1"></i>저장
+                                    </button>
+                                    <button class="btn btn-outline-secondary btn-sm" onclick="alert('데모 사이트입니다.')">
+                                        <i class="fas fa-share me-1"></i>공유
+                                    </button>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                    '''
+
+
+def render_jobs_page(cards, pagination):
+    """채용정보 목록 페이지 (한 페이지 분량의 카드)"""
+    return f"""
     <div class="container">
         <div class="row">
             <div class="col-12">
                 <h1 class="mb-4">
-                    <i class="fas fa-users text-success me-2"></i>커뮤니티
+                    <i class="fas fa-briefcase text-primary me-2"></i>채용정보
                 </h1>
                 
-                <!-- 커뮤니티 가이드라인 -->
-                <div class="alert alert-primary mb-4">
-                    <h5><i class="fas fa-info-circle me-2"></i>커뮤니티 가이드라인</h5>
-                    <ul class="mb-0">
-                        <li>서로를 존중하며 건설적인 대화를 나누어주세요</li>
-                        <li>스팸이나 광고성 게시물은 금지됩니다</li>
-                        <li>개인정보 보호를 위해 민감한 정보 공유는 피해주세요</li>
-                        <li>질문이나 도움 요청은 언제든 환영합니다</li>
-                    </ul>
+                <!-- 검색 및 필터 (search/ 색인을 필요할 때 가져와서 검색) -->
+                <div class="card mb-4" id="jobSearch" data-index="./search/">
+                    <div class="card-body">
+                        <div class="row g-3">
+                            <div class="col-md-4">
+                                <input type="text" class="form-control" placeholder="제목, 회사명 검색..." id="searchInput">
+                            </div>
+                            <div class="col-md-3">
+                                <select class="form-select" id="locationFilter">
+                                    <option value="">전체 지역</option>
+                                </select>
+                            </div>
+                            <div class="col-md-3">
+                                <select class="form-select" id="typeFilter">
+                                    <option value="">전체 고용형태</option>
+                                </select>
+                            </div>
+                            <div class="col-md-2">
+                                <button class="btn btn-primary w-100" onclick="filterJobs()">
+                                    <i class="fas fa-search"></i> 검색
+                                </button>
+                            </div>
+                        </div>
+                    </div>
                 </div>
 
-                <!-- 공지사항 목록 -->
-                <div class="d-flex justify-content-between align-items-center mb-4">
-                    <h3><i class="fas fa-bullhorn text-warning me-2"></i>공지사항 및 소식</h3>
-                    <span class="badge bg-secondary">{len(sample_announcements)}개의 게시물</span>
+                <div class="alert alert-info d-none" id="jobsSearchStatus"></div>
+
+                <!-- 채용정보 목록 -->
+                <div class="row g-4" id="jobsList">
+                    {cards}
                 </div>
+                <div class="text-center mt-4">
+                    <button class="btn btn-outline-primary d-none" id="jobsMore">더 보기</button>
+                </div>
+                <div id="jobsPagination">{pagination}</div>
+            </div>
+        </div>
+    </div>
 
-                <div class="row g-4">
-                    {"".join([f'''
+    <script src="./static/js/job-search.js"></script>"""
+
+
+def render_announcement_card(announcement):
+    title = html.escape(announcement['title'])
+    content = html.escape(announcement['content'])
+    author = html.escape(announcement['author'])
+    return f'''
                     <div class="col-12">
                         <div class="announcement-card border rounded-3 p-4 shadow-sm">
                             <div class="d-flex justify-content-between align-items-start mb-3">
-                                <h5 class="mb-0">{announcement['title']}</h5>
+                                <h5 class="mb-0">{title}</h5>
                                 <small class="text-muted">{announcement['created_at']}</small>
                             </div>
-                            <p class="mb-3">{announcement['content']}</p>
+                            <p class="mb-3">{content}</p>
                             <div class="d-flex justify-content-between align-items-center">
                                 <small class="text-muted">
-                                    <i class="fas fa-user me-1"></i>작성자: {announcement['author']}
+                                    <i class="fas fa-user me-1"></i>작성자: {author}
                                 </small>
                                 <div class="btn-group" role="group">
                                     <button class="btn btn-outline-primary btn-sm" onclick="alert('데모 사이트입니다.')">
@@ -580,7 +702,38 @@ def create_static_site():
                             </div>
                         </div>
                     </div>
-                    ''' for announcement in sample_announcements])}
+                    '''
+
+
+def render_community_page(cards, count):
+    """커뮤니티 페이지"""
+    return f"""
+    <div class="container">
+        <div class="row">
+            <div class="col-12">
+                <h1 class="mb-4">
+                    <i class="fas fa-users text-success me-2"></i>커뮤니티
+                </h1>
+                
+                <!-- 커뮤니티 가이드라인 -->
+                <div class="alert alert-primary mb-4">
+                    <h5><i class="fas fa-info-circle me-2"></i>커뮤니티 가이드라인</h5>
+                    <ul class="mb-0">
+                        <li>서로를 존중하며 건설적인 대화를 나누어주세요</li>
+                        <li>스팸이나 광고성 게시물은 금지됩니다</li>
+                        <li>개인정보 보호를 위해 민감한 정보 공유는 피해주세요</li>
+                        <li>질문이나 도움 요청은 언제든 환영합니다</li>
+                    </ul>
+                </div>
+
+                <!-- 공지사항 목록 -->
+                <div class="d-flex justify-content-between align-items-center mb-4">
+                    <h3><i class="fas fa-bullhorn text-warning me-2"></i>공지사항 및 소식</h3>
+                    <span class="badge bg-secondary">{count}개의 게시물</span>
+                </div>
+
+                <div class="row g-4">
+                    {cards}
                 </div>
 
                 <!-- 이벤트 정보 -->
@@ -626,26 +779,382 @@ def create_static_site():
         }}
     </script>"""
 
-    # 페이지별 HTML 파일 생성
-    pages = {
-        'index.html': ('CAPSA - 커리어 & 네트워킹 플랫폼', home_content),
-        'jobs.html': ('채용정보 - CAPSA', jobs_content),
-        'stakeholder-hub.html': ('전문가 연결 - CAPSA', stakeholder_content),
-        'community.html': ('커뮤니티 - CAPSA', community_content),
+
+def render_job_detail(job):
+    """채용공고 상세 페이지 (docs/jobs/ 아래, 상대 경로는 ../)"""
+    title = html.escape(job['title'])
+    company = html.escape(job['company'])
+    location = html.escape(job['location'])
+    job_type = html.escape(job.get('job_type') or '')
+    paragraphs = ''.join(
+        f'<p>{html.escape(line)}</p>' for line in job['description'].splitlines() if line.strip()
+    )
+    requirements = ''
+    if job.get('requirements'):
+        items = ''.join(
+            f'<li>{html.escape(line.lstrip("• ").strip())}</li>'
+            for line in job['requirements'].splitlines() if line.strip()
+        )
+        requirements = f"""
+                <div class="job-section mb-5">
+                    <h2 class="section-title">주요 요구사항</h2>
+                    <div class="section-content">
+                        <ul class="qualification-list">{items}</ul>
+                    </div>
+                </div>"""
+    apply_button = ''
+    if job.get('apply_url'):
+        apply_button = f"""<a href="{html.escape(job['apply_url'])}" target="_blank" rel="noopener" class="btn btn-primary btn-lg w-100 mb-3">
+                                Apply Now
+                            </a>"""
+    posting = {
+        '@context': 'https://schema.org/',
+        '@type': 'JobPosting',
+        'title': job['title'],
+        'description': job['description'],
+        'identifier': {'@type': 'PropertyValue', 'name': 'CAPSA', 'value': str(job['id'])},
+        'datePosted': job['created_at'],
+        'hiringOrganization': {'@type': 'Organization', 'name': job['company']},
+        'jobLocation': {'@type': 'Place', 'address': {'@type': 'PostalAddress', 'addressLocality': job['location']}},
     }
+    json_ld = json.dumps(posting, ensure_ascii=False).replace('</', '<\\/')
+    return f"""
+    <script type="application/ld+json">{json_ld}</script>
+    <div class="container">
+        <div class="row mb-4">
+            <div class="col-12">
+                <nav aria-label="breadcrumb">
+                    <ol class="breadcrumb">
+                        <li class="breadcrumb-item"><a href="../jobs.html">채용정보</a></li>
+                        <li class="breadcrumb-item active" aria-current="page">{title}</li>
+                    </ol>
+                </nav>
+            </div>
+        </div>
+        <div class="row">
+            <div class="col-lg-8">
+                <div class="job-header mb-4">
+                    <h1 class="job-title">{title}</h1>
+                    <div class="job-meta mb-3">
+                        <span class="company-name">{company}</span>
+                        <span class="separator">•</span>
+                        <span class="location">{location}</span>
+                        {f'<span class="separator">•</span><span class="work-mode">{job_type}</span>' if job_type else ''}
+                    </div>
+                </div>
+                <div class="job-section mb-5">
+                    <h2 class="section-title">About the job</h2>
+                    <div class="section-content">{paragraphs}</div>
+                </div>{requirements}
+            </div>
+            <div class="col-lg-4">
+                <div class="card mb-3">
+                    <div class="card-body text-center">
+                        {apply_button}
+                        <small class="text-muted"><i class="fas fa-calendar me-1"></i>{html.escape(job['created_at'])}</small>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>"""
+
+
+def listing_path(page_number):
+    return 'jobs.html' if page_number == 1 else f'jobs-{page_number}.html'
+
+
+def render_pagination(page_number, has_next):
+    if page_number == 1 and not has_next:
+        return ''
+    prev_link = ''
+    if page_number > 1:
+        prev_link = f'<li class="page-item"><a class="page-link" href="./{listing_path(page_number - 1)}">&laquo; 이전</a></li>'
+    next_link = ''
+    if has_next:
+        next_link = f'<li class="page-item"><a class="page-link" href="./{listing_path(page_number + 1)}">다음 &raquo;</a></li>'
+    return f"""
+                <nav class="mt-4">
+                    <ul class="pagination justify-content-center">
+                        {prev_link}
+                        <li class="page-item active"><span class="page-link">{page_number}</span></li>
+                        {next_link}
+                    </ul>
+                </nav>"""
+
+
+# 페이지 종류별 렌더러: payload -> (title, content, root). 워커 프로세스에서 실행됨
+def _render_static_page(payload):
+    title, content = payload
+    return title, content, './'
+
+
+def _render_job_page(job):
+    return f"{job['title']} - {job['company']} | CAPSA", render_job_detail(job), '../'
+
+
+def _render_listing_page(payload):
+    page_number, jobs, has_next = payload
+    cards = ''.join(render_job_card(job) for job in jobs)
+    return '채용정보 - CAPSA', render_jobs_page(cards, render_pagination(page_number, has_next)), './'
+
+
+PAGE_RENDERERS = {
+    'page': _render_static_page,
+    'job': _render_job_page,
+    'listing': _render_listing_page,
+}
+
+
+def render_batch(docs_dir, tasks, asset_map):
+    """
+    페이지 묶음을 렌더링하고 입력이 바뀐 페이지만 기록 (워커 프로세스 진입점)
+
+    tasks: (kind, relpath, payload, 이전 manifest 항목) 목록
+    반환: (relpath, kind, input_hash, stat, written, elapsed) 목록
+    """
+    results = []
+    for kind, relpath, payload, previous in tasks:
+        started = time.perf_counter()
+        title, content, root = PAGE_RENDERERS[kind](payload)
+        input_hash = hash_inputs(BASE_TEMPLATE, root, title, content, json.dumps(asset_map, sort_keys=True))
+        path = os.path.join(docs_dir, relpath)
+        written = not entry_is_fresh(previous, input_hash, path)
+        if written:
+            page = BASE_TEMPLATE.format(title=title, content=content, root=root)
+            write_atomic(path, assets.rewrite_asset_urls(page, asset_map))
+        results.append((relpath, kind, input_hash, file_stat(path), written,
+                        time.perf_counter() - started))
+    return results
+
+
+class PageWriter:
+    """
+    페이지 렌더링/기록을 프로세스 풀에 분산
+
+    - 페이지를 RENDER_BATCH_SIZE개씩 묶어 워커에 전달
+    - 처리 중인 묶음 수를 제한해서 스트리밍 입력에도 메모리가 일정
+    - 결과는 제출 순서대로 manifest에 반영 (출력은 실행마다 동일)
+    """
+
+    def __init__(self, manifest, workers=None, batch_size=RENDER_BATCH_SIZE, asset_map=None):
+        self.manifest = manifest
+        self.asset_map = asset_map or {}
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.timings = []
+        self._batch = []
+        self._pending = deque()
+        self._pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+
+    def add(self, kind, relpath, payload):
+        self._batch.append((kind, relpath, payload, self.manifest.files.get(relpath)))
+        if len(self._batch) >= self.batch_size:
+            self._submit()
+
+    def _submit(self):
+        if not self._batch:
+            return
+        tasks, self._batch = self._batch, []
+        if self._pool is None:
+            self._collect(render_batch(self.manifest.docs_dir, tasks, self.asset_map))
+            return
+        self._pending.append(self._pool.submit(render_batch, self.manifest.docs_dir, tasks, self.asset_map))
+        while len(self._pending) > self.workers * 2:
+            self._collect(self._pending.popleft().result())
+
+    def _collect(self, results):
+        for relpath, kind, input_hash, stat, written, elapsed in results:
+            self.manifest.record(relpath, input_hash, stat, written)
+            self.timings.append((relpath, kind, elapsed, written))
+
+    def close(self):
+        self._submit()
+        while self._pending:
+            self._collect(self._pending.popleft().result())
+        if self._pool is not None:
+            self._pool.shutdown()
+
+
+def print_timing_report(writer, elapsed, report_path=None):
+    """페이지별 렌더링 시간 요약 (report_path가 있으면 전체 목록을 JSON으로 저장)"""
+    timings = writer.timings
+    total = sum(t[2] for t in timings)
+    print(f"⏱  페이지 {len(timings)}개, 워커 {writer.workers}개, "
+          f"경과 {elapsed:.2f}s ({len(timings) / elapsed if elapsed else 0:.0f} pages/s), "
+          f"렌더링 합계 {total:.2f}s")
+    by_kind = {}
+    for relpath, kind, seconds, written in timings:
+        count, kind_total = by_kind.get(kind, (0, 0.0))
+        by_kind[kind] = (count + 1, kind_total + seconds)
+    for kind, (count, kind_total) in sorted(by_kind.items()):
+        print(f"   {kind:8s} {count:7d}개  평균 {kind_total / count * 1000:.2f}ms")
+    for relpath, kind, seconds, written in sorted(timings, key=lambda t: -t[2])[:5]:
+        print(f"   느린 페이지: {relpath} {seconds * 1000:.2f}ms")
+    if report_path:
+        rows = [{'path': relpath, 'kind': kind, 'ms': round(seconds * 1000, 3), 'written': written}
+                for relpath, kind, seconds, written in sorted(timings)]
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump({'workers': writer.workers, 'elapsed': round(elapsed, 3), 'pages': rows},
+                      f, ensure_ascii=False, indent=1)
+
+
+def build_job_pages(writer, jobs, search_index):
+    """
+    채용공고 스트림에서 상세 페이지와 목록 페이지 생성 (목록 한 페이지 분량만 메모리에 유지)
+
+    검색 색인에는 목록 순서대로 추가 (색인의 문서 번호 = 목록에서의 위치)
+    """
+    page_number = 1
+    page_jobs = []
+    for job in jobs:
+        writer.add('job', job_detail_path(job), job)
+        search_index.add(job, job_detail_path(job))
+        if len(page_jobs) == JOBS_PER_LISTING_PAGE:
+            writer.add('listing', listing_path(page_number), (page_number, page_jobs, True))
+            page_number += 1
+            page_jobs = []
+        page_jobs.append(job)
+    writer.add('listing', listing_path(page_number), (page_number, page_jobs, False))
+
+
+# 데이터 소스
+def iter_db_jobs(chunk_size=DB_CHUNK_SIZE):
+    """JobPost를 최신순으로 청크 단위 스트리밍 (ORM 객체 대신 행 단위로 읽음)"""
+    from app import app, db, ensure_schema, JobPost
+
+    with app.app_context():
+        ensure_schema()
+        stmt = (
+            db.select(JobPost.id, JobPost.title, JobPost.company, JobPost.location,
+                      JobPost.apply_url, JobPost.description, JobPost.posted_at)
+            .order_by(JobPost.posted_at.desc(), JobPost.id.desc())
+            .execution_options(yield_per=chunk_size)
+        )
+        for row in db.session.execute(stmt):
+            yield {
+                'id': row.id,
+                'title': row.title,
+                'company': row.company,
+                'location': row.location,
+                'apply_url': row.apply_url,
+                'description': row.description,
+                'created_at': row.posted_at.strftime('%Y-%m-%d') if row.posted_at else '',
+            }
+
+
+def iter_db_announcements(limit=COMMUNITY_ANNOUNCEMENTS):
+    from app import app, db, ensure_schema, Announcement
+
+    with app.app_context():
+        ensure_schema()
+        stmt = (
+            db.select(Announcement.id, Announcement.title, Announcement.content, Announcement.posted_at)
+            .order_by(Announcement.pinned.desc(), Announcement.posted_at.desc())
+            .limit(limit)
+        )
+        for row in db.session.execute(stmt):
+            yield {
+                'id': row.id,
+                'title': row.title,
+                'content': row.content,
+                'author': 'CAPSA 운영팀',
+                'created_at': row.posted_at.strftime('%Y-%m-%d') if row.posted_at else '',
+            }
+
+
+def build_assets(manifest, static_dir='static'):
+    """
+    CSS/JS 최소화 + 해시 파일명 + 사전 압축본 생성
+
+    반환: {'static/css/style.css': 'static/css/style.<hash>.css', ...}
+    """
+    asset_map = {}
+    if not os.path.exists(static_dir):
+        return asset_map
+    for root, dirs, files in os.walk(static_dir):
+        dirs.sort()
+        for file in sorted(files):
+            if not file.endswith(assets.MINIFIABLE):
+                continue
+            src = os.path.join(root, file)
+            relpath = os.path.join('static', os.path.relpath(src, static_dir)).replace(os.sep, '/')
+            with open(src, 'rb') as f:
+                source = f.read()
+            minified = assets.minify(relpath, source)
+            hashed = assets.fingerprint_name(relpath, assets.content_hash(minified))
+            input_hash = hash_inputs(source, hashed)
+            manifest.write(hashed, input_hash, lambda: minified)
+            for suffix, compressed in assets.compressed_variants(minified).items():
+                manifest.write(hashed + suffix, input_hash, lambda: compressed)
+            asset_map[relpath] = hashed
+    return asset_map
+
+
+def write_search_index(manifest, search_index):
+    """search/ 색인 파일 기록 (meta.json 외에는 파일 이름에 내용 해시 포함)"""
+    def name_for(stem, data):
+        return f'{stem}.{assets.content_hash(data)}.json'
+
+    for relpath, data in search_index.files(name_for).items():
+        manifest.write(relpath, hash_inputs(data), lambda: data)
+
+
+def create_static_site(incremental=True, from_db=False, workers=None, timing_report=None):
+    """정적 사이트 생성"""
+    
+    started = time.perf_counter()
+    # docs 폴더 생성 (GitHub Pages용)
+    docs_dir = 'docs'
+    if not incremental and os.path.exists(docs_dir):
+        shutil.rmtree(docs_dir)
+    os.makedirs(docs_dir, exist_ok=True)
+    manifest = BuildManifest.load(docs_dir) if incremental else BuildManifest(docs_dir)
+    
+    # static 폴더 복사 + 최소화/해시/압축 자산 생성
+    copy_static(manifest)
+    asset_map = build_assets(manifest)
+    
+    if from_db:
+        jobs = iter_db_jobs()
+        announcements = iter_db_announcements()
+    else:
+        jobs = iter(SAMPLE_JOBS)
+        announcements = iter(SAMPLE_ANNOUNCEMENTS)
+    
+    # 페이지별 HTML 파일 생성 (프로세스 풀에서 병렬 렌더링)
+    writer = PageWriter(manifest, workers, asset_map=asset_map)
+    search_index = SearchIndexBuilder()
+    try:
+        writer.add('page', 'index.html', ('CAPSA - 커리어 & 네트워킹 플랫폼', HOME_CONTENT))
+        build_job_pages(writer, jobs, search_index)
+        writer.add('page', 'stakeholder-hub.html', ('전문가 연결 - CAPSA', STAKEHOLDER_CONTENT))
+        announcement_cards = [render_announcement_card(a) for a in announcements]
+        writer.add('page', 'community.html', ('커뮤니티 - CAPSA', render_community_page(
+            ''.join(announcement_cards), len(announcement_cards))))
+    finally:
+        writer.close()
+    write_search_index(manifest, search_index)
     
-    for filename, (title, content) in pages.items():
-        html_content = base_template.format(title=title, content=content)
-        
-        with open(os.path.join(docs_dir, filename), 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    removed = manifest.prune()
+    manifest.save()
     
     print(f"✅ 정적 사이트가 {docs_dir}/ 폴더에 생성되었습니다!")
-    print("📁 생성된 파일:")
-    for root, dirs, files in os.walk(docs_dir):
-        for file in files:
-            relative_path = os.path.relpath(os.path.join(root, file), docs_dir)
-            print(f"   - {relative_path}")
+    print(f"📁 변경된 파일 {len(manifest.written)}개 "
+          f"(유지 {len(manifest.produced) - len(manifest.written)}개, 삭제 {len(removed)}개):")
+    for relpath in manifest.written[:20]:
+        print(f"   - {relpath}")
+    if len(manifest.written) > 20:
+        print(f"   ... 외 {len(manifest.written) - 20}개")
+    for relpath in removed[:20]:
+        print(f"   - {relpath} (삭제)")
+    print_timing_report(writer, time.perf_counter() - started, timing_report)
 
 if __name__ == '__main__':
-    create_static_site()
+    parser = argparse.ArgumentParser(description='CAPSA 정적 사이트 생성')
+    parser.add_argument('--full', action='store_true', help='docs 폴더를 지우고 전체 재생성')
+    parser.add_argument('--from-db', action='store_true', help='샘플 데이터 대신 DB의 채용공고/공지사항 사용')
+    parser.add_argument('--workers', type=int, default=None, help='렌더링 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)')
+    parser.add_argument('--timing-report', metavar='PATH', help='페이지별 렌더링 시간을 JSON으로 저장')
+    args = parser.parse_args()
+    create_static_site(incremental=not args.full, from_db=args.from_db,
+                       workers=args.workers, timing_report=args.timing_report)
@@ -0,0 +1,559 @@
+"""
+AdminCMS(CAPSA.py) 영속화: 바이너리 스냅샷 + 추가 전용 작업 로그
+
+디렉터리 구성
+- snapshot.bin: 마지막으로 압축(compact)한 전체 상태. 열 단위 바이너리 형식
+- oplog-<세대>.jsonl: 그 스냅샷 이후의 변경 작업 (한 줄에 한 작업)
+
+열기(open)
+- 스냅샷은 mmap으로 매핑만 하고 레코드는 필요할 때 하나씩 만듦. 해시/정렬
+  인덱스도 스냅샷 안에 들어 있어서 여는 비용이 레코드 수와 무관함
+- 변경된 레코드만 IndexedTable의 overlay로 올라감 (CAPSA.IndexedTable base 참고)
+- 로그를 재생한 뒤 사용. 마지막 줄이 잘려 있으면(쓰는 도중 종료) 무시
+
+압축(compact)
+- 현재 상태 전체를 새 세대 스냅샷으로 임시 파일에 쓰고 교체한 뒤 새 로그로 전환
+- 교체 전 중단되면 이전 스냅샷 + 이전 로그가 그대로 남음
+
+스냅샷 형식 (리틀 엔디언, 각 구역은 8바이트 정렬)
+- MAGIC(8) + 테이블별 구역 + 메타데이터 JSON + 꼬리(메타 오프셋 u64, 길이 u64, MAGIC)
+- 테이블별 구역: ids(int64, 오름차순), 열 데이터, 해시 인덱스(값별 id 목록),
+  정렬 인덱스(정렬 순서의 행 번호)
+- 열 종류: str(오프셋 u64 + UTF-8), interned/해시 인덱스 필드(사전 코드 u32 + 메타의 값 사전),
+  bool(u8), datetime(int64 마이크로초, None은 최솟값)
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from CAPSA import (
+    ANNOUNCEMENT_COLUMNS, JOB_COLUMNS, REQUEST_COLUMNS, AdminCMS, Announcement,
+    JobPost, StakeholderRequest,
+)
+
+MAGIC = b'CAPSNAP1'
+_FOOTER = '<QQ'
+FORMAT_VERSION = 1
+SNAPSHOT_NAME = 'snapshot.bin'
+# 로그 작업이 이만큼 쌓이면 자동으로 압축 (0이면 자동 압축 안 함)
+COMPACT_EVERY = 100000
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_TIME = -(2 ** 63)
+
+# 테이블 이름 -> (AdminCMS 속성, 모델, 열 정의)
+TABLES = {
+    'jobs': ('job_posts', JobPost, JOB_COLUMNS),
+    'announcements': ('announcements', Announcement, ANNOUNCEMENT_COLUMNS),
+    'requests': ('stakeholder_requests', StakeholderRequest, REQUEST_COLUMNS),
+}
+
+if sys.byteorder != 'little':
+    raise ImportError('cms_store 스냅샷은 리틀 엔디언 환경만 지원')
+
+
+def _encode_datetime(value):
+    if value is None:
+        return _NO_TIME
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _decode_datetime(value):
+    return None if value == _NO_TIME else _EPOCH + timedelta(microseconds=value)
+
+
+def _coerce_datetimes(record, columns):
+    """ISO 문자열로 들어온 datetime 필드를 datetime으로 (스냅샷/정렬 키 타입을 통일)"""
+    for field, kind in columns.items():
+        value = getattr(record, field)
+        if kind == 'datetime' and isinstance(value, str):
+            setattr(record, field, datetime.fromisoformat(value))
+    return record
+
+
+# 스냅샷 읽기
+class SnapshotTable:
+    """mmap된 스냅샷의 테이블 하나 (읽기 전용, IndexedTable의 base로 사용)"""
+
+    def __init__(self, buffer, meta, model):
+        self.model = model
+        self.next_id = meta['next_id']
+        self._count = meta['count']
+        self._buffer = buffer
+
+        def view(section, fmt):
+            offset, length = section
+            return buffer[offset:offset + length].cast(fmt)
+
+        self._ids = view(meta['ids'], 'q')
+        self._fields = []
+        for column in meta['columns']:
+            field, kind = column['field'], column['kind']
+            if 'dictionary' in column:
+                data = (view(column['codes'], 'I'), column['dictionary'])
+                kind = 'coded'
+            elif kind == 'str':
+                offsets, blob = column['offsets'], column['blob']
+                data = (view(offsets, 'Q'), buffer[blob[0]:blob[0] + blob[1]],
+                        view(column['nulls'], 'B') if 'nulls' in column else None)
+            elif kind == 'bool':
+                data = view(column['data'], 'B')
+            else:
+                data = view(column['data'], 'q')
+            self._fields.append((field, kind, data))
+        self._kinds = {field: kind for field, kind, _ in self._fields}
+        self._data = {field: data for field, _, data in self._fields}
+        self._hash = {
+            field: (index['values'], view(index['starts'], 'Q'), view(index['ids'], 'q'))
+            for field, index in meta['hash'].items()
+        }
+        self._sorted = {field: view(section, 'q') for field, section in meta['sorted'].items()}
+        self._lookup = {field: {self._freeze(v): code for code, v in enumerate(values)}
+                        for field, (values, _, _) in self._hash.items()}
+
+    @staticmethod
+    def _freeze(value):
+        # JSON 사전 값과 파이썬 값 비교용 (True == 1 이 같은 키가 되지 않게 타입 포함)
+        return (type(value).__name__, value)
+
+    def __len__(self):
+        return self._count
+
+    def _row(self, record_id):
+        row = bisect_left(self._ids, record_id)
+        if row < len(self._ids) and self._ids[row] == record_id:
+            return row
+        return None
+
+    def __contains__(self, record_id):
+        return self._row(record_id) is not None
+
+    def ids(self):
+        return iter(self._ids)
+
+    def _value(self, field, row):
+        kind = self._kinds[field]
+        data = self._data[field]
+        if kind == 'coded':
+            codes, dictionary = data
+            return dictionary[codes[row]]
+        if kind == 'str':
+            offsets, blob, nulls = data
+            if nulls is not None and nulls[row]:
+                return None
+            return str(blob[offsets[row]:offsets[row + 1]], 'utf-8')
+        if kind == 'bool':
+            return bool(data[row])
+        return _decode_datetime(data[row])
+
+    def value(self, record_id, field):
+        row = self._row(record_id)
+        if row is None:
+            raise KeyError(f"존재하지 않는 id: {record_id}")
+        return self._value(field, row)
+
+    def get(self, record_id):
+        row = self._row(record_id)
+        if row is None:
+            raise KeyError(f"존재하지 않는 id: {record_id}")
+        record = self.model.__new__(self.model)
+        for field, _, _ in self._fields:
+            setattr(record, field, self._value(field, row))
+        record.id = record_id
+        return record
+
+    def hash_ids(self, field, value):
+        index = self._hash.get(field)
+        if index is None:
+            # 스냅샷에 인덱스가 없는 필드: 전체 비교
+            return [rid for row, rid in enumerate(self._ids) if self._value(field, row) == value]
+        _, starts, ids = index
+        code = self._lookup[field].get(self._freeze(value))
+        if code is None:
+            return ()
+        return ids[starts[code]:starts[code + 1]]
+
+    def sorted_ids(self, field, descending=False):
+        """(값, id)를 정렬 순서대로"""
+        rows = self._sorted[field]
+        order = reversed(rows) if descending else iter(rows)
+        ids = self._ids
+        value = self._value
+        return ((value(field, row), ids[row]) for row in order)
+
+
+class Snapshot:
+    """스냅샷 파일 하나 (mmap). 테이블은 SnapshotTable로 노출"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        if bytes(buffer[:len(MAGIC)]) != MAGIC or bytes(buffer[-len(MAGIC):]) != MAGIC:
+            raise ValueError(f'스냅샷 파일이 아니거나 기록이 끝나지 않음: {path}')
+        footer = len(buffer) - len(MAGIC) - struct.calcsize(_FOOTER)
+        meta_offset, meta_length = struct.unpack_from(_FOOTER, buffer, footer)
+        meta = json.loads(bytes(buffer[meta_offset:meta_offset + meta_length]))
+        if meta['version'] != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {meta['version']}")
+        self.generation = meta['generation']
+        self.tables = {
+            name: SnapshotTable(buffer, meta['tables'][name], TABLES[name][1])
+            for name in TABLES
+        }
+        self._buffer = buffer
+
+    def close(self):
+        # 아직 만들어진 memoryview가 있으면 닫을 수 없으므로 GC에 맡김
+        self.tables = {}
+        self._buffer = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+
+# 스냅샷 쓰기
+class _SectionWriter:
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, data):
+        """8바이트 정렬 후 기록, (offset, length) 반환"""
+        data = memoryview(data).cast('B')
+        position = self.f.tell()
+        padding = -position % 8
+        if padding:
+            self.f.write(b'\0' * padding)
+            position += padding
+        self.f.write(data)
+        return [position, len(data)]
+
+
+def _write_table(writer, table, columns):
+    """IndexedTable 하나를 열 단위로 기록하고 메타데이터 반환"""
+    ids = array('q')
+    hash_fields = table.hash_fields
+    for field in hash_fields:
+        if columns[field] == 'datetime':
+            raise ValueError(f'datetime 필드는 해시 인덱스로 저장할 수 없음: {field}')
+    for field in table.sorted_fields:
+        if field in hash_fields or columns[field] not in ('datetime', 'bool'):
+            raise ValueError(f'정렬 인덱스는 datetime/bool 열만 저장 가능: {field}')
+    # 해시 인덱스 필드와 interned 열은 사전 코드로 저장
+    coded = {field for field, kind in columns.items() if field in hash_fields or kind == 'interned'}
+    encoded = {}
+    for field, kind in columns.items():
+        if field in coded:
+            encoded[field] = (array('I'), {})
+        elif kind == 'str':
+            encoded[field] = (array('Q', [0]), bytearray(), bytearray())
+        elif kind == 'bool':
+            encoded[field] = bytearray()
+        else:
+            encoded[field] = array('q')
+
+    for record in table:
+        ids.append(record.id)
+        for field, kind in columns.items():
+            value = getattr(record, field)
+            data = encoded[field]
+            if field in coded:
+                codes, dictionary = data
+                key = (type(value).__name__, value)
+                code = dictionary.get(key)
+                if code is None:
+                    code = dictionary[key] = len(dictionary)
+                codes.append(code)
+            elif kind == 'str':
+                offsets, blob, nulls = data
+                if value is not None:
+                    blob += value.encode('utf-8')
+                offsets.append(len(blob))
+                nulls.append(value is None)
+            elif kind == 'bool':
+                data.append(1 if value else 0)
+            else:
+                data.append(_encode_datetime(value))
+
+    meta = {
+        'count': len(ids),
+        'next_id': table.next_id,
+        'ids': writer.write(ids),
+        'columns': [],
+        'hash': {},
+        'sorted': {},
+    }
+    for field, kind in columns.items():
+        data = encoded[field]
+        column = {'field': field, 'kind': kind}
+        if field in coded:
+            codes, dictionary = data
+            values = [value for _, value in dictionary]
+            column['codes'] = writer.write(codes)
+            column['dictionary'] = values
+            if field not in hash_fields:
+                meta['columns'].append(column)
+                continue
+            # 값별 id 목록 (코드 순, 각 목록은 id 오름차순)
+            buckets = [array('q') for _ in values]
+            for row, code in enumerate(codes):
+                buckets[code].append(ids[row])
+            starts = array('Q', [0])
+            for bucket in buckets:
+                starts.append(starts[-1] + len(bucket))
+            flat = array('q')
+            for bucket in buckets:
+                flat.extend(bucket)
+            meta['hash'][field] = {'values': values, 'starts': writer.write(starts),
+                                   'ids': writer.write(flat)}
+        elif kind == 'str':
+            offsets, blob, nulls = data
+            column['offsets'] = writer.write(offsets)
+            column['blob'] = writer.write(blob)
+            if any(nulls):
+                column['nulls'] = writer.write(nulls)
+        else:
+            column['data'] = writer.write(data)
+        meta['columns'].append(column)
+
+    for field in table.sorted_fields:
+        keys = encoded[field]
+        # None은 최솟값으로 저장되어 있고, 안정 정렬이므로 같은 값은 행(id) 순서 유지
+        rows = array('q', sorted(range(len(ids)), key=keys.__getitem__))
+        meta['sorted'][field] = writer.write(rows)
+    return meta
+
+
+def write_snapshot(cms, path, generation):
+    """AdminCMS 전체를 스냅샷 파일로 기록 (임시 파일에 쓴 뒤 교체)"""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            writer = _SectionWriter(f)
+            tables = {name: _write_table(writer, getattr(cms, attr), columns)
+                      for name, (attr, _, columns) in TABLES.items()}
+            meta = json.dumps({'version': FORMAT_VERSION, 'generation': generation, 'tables': tables},
+                              ensure_ascii=False).encode('utf-8')
+            meta_offset, meta_length = writer.write(meta)
+            f.write(struct.pack(_FOOTER, meta_offset, meta_length))
+            f.write(MAGIC)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# 작업 로그
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'$dt': value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict) and '$dt' in value:
+        return datetime.fromisoformat(value['$dt'])
+    return value
+
+
+def _record_payload(record, columns):
+    return {field: _encode_value(getattr(record, field)) for field in columns}
+
+
+def _record_from_payload(model, columns, payload):
+    record = model.__new__(model)
+    for field in columns:
+        setattr(record, field, _decode_value(payload.get(field)))
+    record.id = None
+    return record
+
+
+class PersistentCMS(AdminCMS):
+    """
+    변경 작업을 로그에 남기고 주기적으로 스냅샷을 만드는 AdminCMS
+
+    sync=True면 작업마다 fsync (느리지만 전원 차단에도 유지).
+    기본값은 flush만 해서 프로세스가 죽어도 OS 버퍼의 내용은 남음.
+    """
+
+    def __init__(self, directory, notifier=None, compact_every=COMPACT_EVERY, sync=False):
+        super().__init__(notifier=notifier)
+        self.directory = directory
+        self.compact_every = compact_every
+        self.sync = sync
+        self._snapshot = None
+        self._log = None
+        self._log_ops = 0
+        self.generation = 0
+        os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    # 열기/닫기
+    def _log_path(self, generation):
+        return os.path.join(self.directory, f'oplog-{generation}.jsonl')
+
+    def _open(self):
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_NAME)
+        if os.path.exists(snapshot_path):
+            self._snapshot = Snapshot(snapshot_path)
+            self.generation = self._snapshot.generation
+            for name, (attr, _, _) in TABLES.items():
+                getattr(self, attr).attach_base(self._snapshot.tables[name])
+        self._log_ops = self._replay(self._log_path(self.generation))
+        # 재생은 테이블을 직접 바꾸므로 피드 순서는 한 번에 다시 만듦
+        self.bulletin.rebuild()
+        self._log = open(self._log_path(self.generation), 'a', encoding='utf-8')
+        # 압축 도중 중단되어 남은 이전 세대 로그 정리
+        for name in os.listdir(self.directory):
+            if name.startswith('oplog-') and name != os.path.basename(self._log_path(self.generation)):
+                os.remove(os.path.join(self.directory, name))
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # 로그
+    def _append(self, entry):
+        self._log.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._log.flush()
+        if self.sync:
+            os.fsync(self._log.fileno())
+        self._log_ops += 1
+        if self.compact_every and self._log_ops >= self.compact_every:
+            self.compact()
+
+    def _replay(self, path):
+        if not os.path.exists(path):
+            return 0
+        applied = 0
+        valid_end = 0
+        with open(path, 'r+b') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                self._apply(entry)
+                applied += 1
+                valid_end += len(line)
+            # 기록 도중 종료되어 잘린 마지막 줄은 잘라 냄 (이어 쓰는 작업과 붙지 않게)
+            f.truncate(valid_end)
+        return applied
+
+    def _apply(self, entry):
+        op = entry['op']
+        table_name = entry['table']
+        attr, model, columns = TABLES[table_name]
+        table = getattr(self, attr)
+        if op == 'insert':
+            record = _record_from_payload(model, columns, entry['record'])
+            record_id = table.insert(record)
+            if record_id != entry['id']:
+                raise ValueError(f"로그 재생 id 불일치: {record_id} != {entry['id']}")
+        elif op == 'replace':
+            table.replace(entry['id'], _record_from_payload(model, columns, entry['record']))
+        elif op == 'delete':
+            table.delete(entry['id'])
+        elif op == 'set':
+            table.set_field(entry['id'], entry['field'], _decode_value(entry['value']))
+        else:
+            raise ValueError(f'알 수 없는 로그 작업: {op}')
+
+    def _log_insert(self, table_name, record_id, record):
+        columns = TABLES[table_name][2]
+        self._append({'op': 'insert', 'table': table_name, 'id': record_id,
+                      'record': _record_payload(record, columns)})
+
+    # 스냅샷
+    def compact(self):
+        """현재 상태를 새 세대 스냅샷으로 기록하고 로그를 비움"""
+        generation = self.generation + 1
+        write_snapshot(self, os.path.join(self.directory, SNAPSHOT_NAME), generation)
+        old_log_path = self._log_path(self.generation)
+        self._log.close()
+        self.generation = generation
+        self._log = open(self._log_path(generation), 'a', encoding='utf-8')
+        self._log_ops = 0
+        if os.path.exists(old_log_path):
+            os.remove(old_log_path)
+        # 새 스냅샷을 기반으로 다시 연결 (overlay 비움)
+        old_snapshot = self._snapshot
+        self._snapshot = Snapshot(os.path.join(self.directory, SNAPSHOT_NAME))
+        for name, (attr, _, _) in TABLES.items():
+            getattr(self, attr).attach_base(self._snapshot.tables[name])
+        if old_snapshot is not None:
+            old_snapshot.close()
+
+    # 기록되는 작업들
+    def create_job(self, job_post):
+        _coerce_datetimes(job_post, JOB_COLUMNS)
+        job_id = super().create_job(job_post)
+        self._log_insert('jobs', job_id, job_post)
+        return job_id
+
+    def update_job(self, job_id, job_post):
+        _coerce_datetimes(job_post, JOB_COLUMNS)
+        super().update_job(job_id, job_post)
+        self._append({'op': 'replace', 'table': 'jobs', 'id': job_id,
+                      'record': _record_payload(job_post, JOB_COLUMNS)})
+
+    def delete_job(self, job_id):
+        super().delete_job(job_id)
+        self._append({'op': 'delete', 'table': 'jobs', 'id': job_id})
+
+    def create_announcement(self, announcement):
+        _coerce_datetimes(announcement, ANNOUNCEMENT_COLUMNS)
+        announcement_id = super().create_announcement(announcement)
+        self._log_insert('announcements', announcement_id, announcement)
+        return announcement_id
+
+    def update_announcement(self, announcement_id, announcement):
+        _coerce_datetimes(announcement, ANNOUNCEMENT_COLUMNS)
+        super().update_announcement(announcement_id, announcement)
+        self._append({'op': 'replace', 'table': 'announcements', 'id': announcement_id,
+                      'record': _record_payload(announcement, ANNOUNCEMENT_COLUMNS)})
+
+    def delete_announcement(self, announcement_id):
+        super().delete_announcement(announcement_id)
+        self._append({'op': 'delete', 'table': 'announcements', 'id': announcement_id})
+
+    def pin_announcement(self, announcement_id, pinned=True):
+        super().pin_announcement(announcement_id, pinned)
+        self._append({'op': 'set', 'table': 'announcements', 'id': announcement_id,
+                      'field': 'pinned', 'value': pinned})
+
+    def receive_stakeholder_request(self, request):
+        _coerce_datetimes(request, REQUEST_COLUMNS)
+        request_id = self.stakeholder_requests.insert(request)
+        # 알림보다 먼저 기록 (재시작 후 요청이 사라지지 않게)
+        self._log_insert('requests', request_id, request)
+        self.notify_admin(request)
+        return request_id
+
+    def update_request_status(self, request_id, status):
+        super().update_request_status(request_id, status)
+        self._append({'op': 'set', 'table': 'requests', 'id': request_id,
+                      'field': 'status', 'value': status})
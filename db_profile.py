@@ -0,0 +1,112 @@
+"""
+데이터베이스 연결 설정 (SQLite 운영 튜닝 / PostgreSQL 연결 풀)
+
+- SQLite: 연결마다 PRAGMA 적용
+  - journal_mode=WAL: 읽기가 쓰기를 막지 않고 쓰기도 읽기를 기다리지 않음
+  - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음
+    (전원 장애 시 마지막 몇 커밋만 잃을 수 있음)
+  - busy_timeout: 쓰기 잠금이 풀릴 때까지 바로 실패하지 않고 기다림
+  - mmap_size / cache_size: 읽기를 mmap과 페이지 캐시로 처리
+- PostgreSQL(CAPSA_DATABASE_URL=postgresql+psycopg://...): 연결 풀 크기/재활용/사전 확인
+  드라이버(psycopg 등)는 별도로 설치
+
+순서: DatabaseProfile(app) -> SQLAlchemy(app) -> profile.attach(db.engine, app)
+(Flask-SQLAlchemy가 엔진을 만들 때 SQLALCHEMY_ENGINE_OPTIONS를 읽음)
+앱별 설정(PRAGMA 목록)은 app.extensions['database_profile']에 둠
+"""
+
+from flask import current_app
+from sqlalchemy import event
+
+DEFAULT_DATABASE_URI = 'sqlite:///capsa.db'
+
+
+def normalize_database_uri(uri):
+    """'postgres://'(Heroku 등) -> 'postgresql://' (SQLAlchemy 2는 이전 이름을 받지 않음)"""
+    if uri and uri.startswith('postgres://'):
+        return 'postgresql://' + uri[len('postgres://'):]
+    return uri or DEFAULT_DATABASE_URI
+
+
+def is_sqlite(uri):
+    return uri.startswith('sqlite')
+
+
+def sqlite_pragmas(config):
+    """연결마다 실행할 PRAGMA (이름, 값) 목록. DB_SQLITE_TUNING이 꺼져 있으면 busy_timeout만"""
+    pragmas = [('busy_timeout', int(config['DB_SQLITE_BUSY_TIMEOUT_MS']))]
+    if config['DB_SQLITE_TUNING']:
+        pragmas += [
+            ('journal_mode', 'WAL'),
+            ('synchronous', 'NORMAL'),
+            ('mmap_size', int(config['DB_SQLITE_MMAP_SIZE'])),
+            # 음수는 KiB 단위
+            ('cache_size', -int(config['DB_SQLITE_CACHE_KB'])),
+            ('temp_store', 'MEMORY'),
+        ]
+    return pragmas
+
+
+def engine_options(config):
+    """SQLALCHEMY_ENGINE_OPTIONS 기본값"""
+    uri = config['SQLALCHEMY_DATABASE_URI']
+    if is_sqlite(uri):
+        if ':memory:' in uri or uri in ('sqlite://', 'sqlite:///'):
+            # 메모리 DB는 연결마다 별개이므로 SQLAlchemy 기본 풀 사용
+            return {}
+        return {
+            'pool_size': config['DB_POOL_SIZE'],
+            'max_overflow': config['DB_MAX_OVERFLOW'],
+            'pool_timeout': config['DB_POOL_TIMEOUT'],
+            # sqlite3 자체 대기 (초). PRAGMA busy_timeout과 같은 값
+            'connect_args': {'timeout': config['DB_SQLITE_BUSY_TIMEOUT_MS'] / 1000},
+        }
+    return {
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        # 서버/프록시가 끊은 유휴 연결을 쓰기 전에 확인하고 주기적으로 교체
+        'pool_pre_ping': True,
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+    }
+
+
+class DatabaseProfile:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config['SQLALCHEMY_DATABASE_URI'] = normalize_database_uri(
+            app.config.get('SQLALCHEMY_DATABASE_URI'))
+        app.config.setdefault('DB_POOL_SIZE', 5)
+        app.config.setdefault('DB_MAX_OVERFLOW', 10)
+        app.config.setdefault('DB_POOL_TIMEOUT', 30)
+        app.config.setdefault('DB_POOL_RECYCLE', 1800)
+        app.config.setdefault('DB_SQLITE_TUNING', True)
+        app.config.setdefault('DB_SQLITE_BUSY_TIMEOUT_MS', 5000)
+        app.config.setdefault('DB_SQLITE_MMAP_SIZE', 256 * 1024 * 1024)
+        app.config.setdefault('DB_SQLITE_CACHE_KB', 64 * 1024)
+
+        options = engine_options(app.config)
+        # 직접 지정한 값이 우선
+        options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+        pragmas = sqlite_pragmas(app.config) if is_sqlite(app.config['SQLALCHEMY_DATABASE_URI']) else []
+        app.extensions['database_profile'] = {'pragmas': pragmas}
+
+    def attach(self, engine, app=None):
+        """엔진의 새 연결마다 app의 PRAGMA 적용 (SQLite가 아니면 아무것도 하지 않음)"""
+        app = app or current_app
+        pragmas = app.extensions['database_profile']['pragmas']
+        if engine.dialect.name != 'sqlite' or not pragmas:
+            return
+
+        @event.listens_for(engine, 'connect')
+        def _apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas:
+                    cursor.execute(f'PRAGMA {name}={value}')
+            finally:
+                cursor.close()
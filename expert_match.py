@@ -0,0 +1,382 @@
+"""
+전문가 추천 (전문가 요청 -> 등록된 전문가 top-k, TF-IDF 코사인 유사도)
+
+- 문서 = 텍스트 토큰(job_search.tokenize: 한글 2-gram, 그 외 단어)
+  + 도움 유형 'h:<유형>', 직책 단어 'r:<단어>' 특성 토큰 (가중치 HELP_TYPE_WEIGHT, ROLE_WEIGHT)
+  전문가는 전문 분야 소개(expertise) + 가능한 도움 유형 목록 + 직책,
+  요청은 상세 설명(description) + 도움 유형 + 요청자 직책
+- 전문가 문서로 역색인(용어 -> 전문가 행 배열, 가중 tf 배열)을 만들고, 요청 하나의 점수는
+  요청 용어들의 posting을 이어 붙여 np.bincount 한 번으로 계산 -> argpartition으로 top-k
+- IDF는 전문가 + 요청 전체 기준. 문서가 바뀔 때마다 전체를 다시 계산하지 않고
+  다음 조회 때 IDF와 전문가 벡터 노름만 한 번에 다시 계산 (nnz 크기 벡터 연산)
+- 전문가 추가/수정/비활성화와 새 요청은 증분 반영. 빠진 전문가 행은 자리만 비워 두고
+  절반을 넘으면 압축
+- numpy가 없으면 AVAILABLE이 False이고 추천 기능만 꺼짐 (나머지 앱은 그대로 동작)
+
+Flask 쪽(ExpertMatching)은 앱(DB)마다 색인을 하나 두고, 조회할 때
+updated_at/id 워터마크 근처 이후 바뀐 전문가/요청만 DB에서 읽어 반영
+(다른 워커 프로세스에서 등록한 것도 다음 조회 때 반영됨)
+- updated_at은 앱 서버 시계, id는 커밋 순서가 아니므로 늦게 커밋된 트랜잭션을 놓치지 않게
+  워터마크 앞 구간(EXPERT_MATCH_SYNC_OVERLAP초 / EXPERT_MATCH_REQUEST_OVERLAP개 id)을
+  다시 읽고, 이미 반영한 행(전문가는 (id, updated_at), 요청은 id)은 건너뜀
+"""
+
+import math
+import threading
+from array import array
+from collections import Counter
+from datetime import timedelta
+
+from flask import current_app
+
+from job_search import tokenize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AVAILABLE = np is not None
+
+HELP_TYPE_WEIGHT = 3.0
+ROLE_WEIGHT = 1.5
+DEFAULT_TOP_K = 5
+MAX_TOP_K = 20
+# 빈 행이 이 비율을 넘으면 압축
+COMPACT_RATIO = 0.5
+
+
+def split_help_types(value):
+    """'Mentoring, Technical' -> ['Mentoring', 'Technical']"""
+    return [part.strip() for part in (value or '').split(',') if part.strip()]
+
+
+def _document(text, help_types, role):
+    """용어 -> 가중 tf. 텍스트는 1 + log(횟수), 특성 토큰은 고정 가중치"""
+    weights = {term: 1.0 + math.log(count) for term, count in Counter(tokenize(text)).items()}
+    for help_type in help_types:
+        weights['h:' + help_type.lower()] = HELP_TYPE_WEIGHT
+    for term in set(tokenize(role)):
+        weights['r:' + term] = ROLE_WEIGHT
+    return weights
+
+
+def expert_document(expert):
+    """expertise/help_types/role 속성을 가진 전문가 (모델 객체 또는 행)"""
+    return _document(expert.expertise, split_help_types(expert.help_types), expert.role)
+
+
+def request_document(request):
+    """description/help_type/role 속성을 가진 전문가 요청"""
+    return _document(request.description, [request.help_type] if request.help_type else [], request.role)
+
+
+class MatchIndex:
+    """전문가 역색인 + 요청 벡터 (스레드 안전하지 않음, 호출하는 쪽에서 잠금)"""
+
+    def __init__(self):
+        if np is None:
+            raise RuntimeError('전문가 추천에는 numpy가 필요합니다 (pip install numpy)')
+        self._term_ids = {}
+        self._df = array('i')
+        self._documents = 0
+        # 전문가 행
+        self._expert_rows = {}
+        self._row_experts = []
+        self._row_vectors = []
+        self._free_rows = 0
+        # 용어 -> (행 목록, 가중 tf 목록), numpy 배열 사본은 조회 때 만들고 변경 시 버림
+        self._postings = {}
+        self._posting_arrays = {}
+        # 노름 계산용 (행, 용어, 가중 tf) 평면 배열
+        self._nnz_rows = array('i')
+        self._nnz_terms = array('i')
+        self._nnz_weights = array('d')
+        # 요청 id -> {용어 id: 가중 tf}
+        self._requests = {}
+        self._idf = None
+        self._norms = None
+        self._active = None
+
+    def __len__(self):
+        return len(self._expert_rows)
+
+    @property
+    def request_count(self):
+        return len(self._requests)
+
+    def has_request(self, request_id):
+        return request_id in self._requests
+
+    # 문서 빈도
+    def _vector(self, weights, count=True):
+        """용어 -> 가중치를 용어 id 기준으로 변환. count면 문서 빈도에 반영 (새 용어는 등록)"""
+        vector = {}
+        for term, weight in weights.items():
+            term_id = self._term_ids.get(term)
+            if not count and (term_id is None or not self._df[term_id]):
+                continue  # 색인에 없는 용어(빠진 전문가에만 있던 용어 포함)는 점수에 영향 없음
+            if term_id is None:
+                term_id = self._term_ids[term] = len(self._df)
+                self._df.append(0)
+            vector[term_id] = weight
+        if count:
+            for term_id in vector:
+                self._df[term_id] += 1
+            self._documents += 1
+            self._idf = None
+        return vector
+
+    def _forget(self, vector):
+        for term_id in vector:
+            self._df[term_id] -= 1
+        self._documents -= 1
+        self._idf = None
+
+    # 전문가
+    def add_expert(self, expert_id, weights):
+        """전문가 추가 (이미 있으면 교체)"""
+        self.remove_expert(expert_id)
+        vector = self._vector(weights)
+        row = len(self._row_experts)
+        self._expert_rows[expert_id] = row
+        self._row_experts.append(expert_id)
+        self._row_vectors.append(vector)
+        for term_id, weight in vector.items():
+            posting = self._postings.get(term_id)
+            if posting is None:
+                posting = self._postings[term_id] = (array('i'), array('d'))
+            posting[0].append(row)
+            posting[1].append(weight)
+            self._posting_arrays.pop(term_id, None)
+            self._nnz_rows.append(row)
+            self._nnz_terms.append(term_id)
+            self._nnz_weights.append(weight)
+        self._norms = None
+
+    def remove_expert(self, expert_id):
+        row = self._expert_rows.pop(expert_id, None)
+        if row is None:
+            return False
+        # posting에는 남겨 두고 점수 계산 때 제외 (압축할 때 정리)
+        self._forget(self._row_vectors[row])
+        self._row_experts[row] = None
+        self._row_vectors[row] = None
+        self._free_rows += 1
+        self._norms = None
+        if self._free_rows > len(self._row_experts) * COMPACT_RATIO:
+            self._compact()
+        return True
+
+    def _compact(self):
+        """빈 행을 없애고 역색인을 다시 만듦 (문서 빈도는 그대로)"""
+        experts = [(expert_id, vector) for expert_id, vector in zip(self._row_experts, self._row_vectors)
+                   if expert_id is not None]
+        self._expert_rows = {}
+        self._row_experts = []
+        self._row_vectors = []
+        self._free_rows = 0
+        self._postings = {}
+        self._posting_arrays = {}
+        self._nnz_rows = array('i')
+        self._nnz_terms = array('i')
+        self._nnz_weights = array('d')
+        for expert_id, vector in experts:
+            row = len(self._row_experts)
+            self._expert_rows[expert_id] = row
+            self._row_experts.append(expert_id)
+            self._row_vectors.append(vector)
+            for term_id, weight in vector.items():
+                posting = self._postings.get(term_id)
+                if posting is None:
+                    posting = self._postings[term_id] = (array('i'), array('d'))
+                posting[0].append(row)
+                posting[1].append(weight)
+                self._nnz_rows.append(row)
+                self._nnz_terms.append(term_id)
+                self._nnz_weights.append(weight)
+        self._norms = None
+
+    # 요청 (IDF에 반영하고 벡터를 보관해서 같은 요청은 다시 토큰화하지 않음)
+    def add_request(self, request_id, weights):
+        self.remove_request(request_id)
+        self._requests[request_id] = self._vector(weights)
+
+    def remove_request(self, request_id):
+        vector = self._requests.pop(request_id, None)
+        if vector is None:
+            return False
+        self._forget(vector)
+        return True
+
+    # 점수 계산
+    def _prepare(self):
+        if self._idf is None:
+            df = np.frombuffer(self._df, dtype=np.int32) if len(self._df) else np.zeros(0, np.int32)
+            # 평활화한 IDF (모든 문서에 있는 용어도 0이 되지 않음)
+            self._idf = np.log((1.0 + self._documents) / (1.0 + df)) + 1.0
+            self._norms = None
+        if self._norms is None:
+            rows = len(self._row_experts)
+            if len(self._nnz_rows):
+                nnz_rows = np.frombuffer(self._nnz_rows, dtype=np.int32)
+                values = np.frombuffer(self._nnz_weights) * self._idf[np.frombuffer(self._nnz_terms, dtype=np.int32)]
+                norms = np.sqrt(np.bincount(nnz_rows, weights=values * values, minlength=rows))
+            else:
+                norms = np.zeros(rows)
+            active = np.fromiter((expert_id is not None for expert_id in self._row_experts), bool, rows)
+            # 빈 행/빈 문서는 나눗셈에서 제외
+            self._active = active & (norms > 0)
+            norms[~self._active] = 1.0
+            self._norms = norms
+
+    def _posting_array(self, term_id):
+        arrays = self._posting_arrays.get(term_id)
+        if arrays is None:
+            rows, weights = self._postings[term_id]
+            arrays = self._posting_arrays[term_id] = (np.frombuffer(rows, dtype=np.int32).copy(),
+                                                      np.frombuffer(weights).copy())
+        return arrays
+
+    def top_experts(self, request_id=None, weights=None, k=DEFAULT_TOP_K, exclude=()):
+        """
+        요청과 가장 비슷한 전문가 [(전문가 id, 점수)] (점수 내림차순, 0점은 제외)
+        request_id: add_request로 넣은 요청, 또는 weights: request_document() 결과를 바로 사용
+        """
+        if request_id is not None and request_id in self._requests:
+            vector = self._requests[request_id]
+        else:
+            vector = self._vector(weights or {}, count=False)
+        if not vector or not self._expert_rows:
+            return []
+        self._prepare()
+
+        rows, values = [], []
+        query_norm = 0.0
+        for term_id, weight in vector.items():
+            query_weight = weight * self._idf[term_id]
+            query_norm += query_weight * query_weight
+            if term_id not in self._postings:
+                continue
+            posting_rows, posting_weights = self._posting_array(term_id)
+            rows.append(posting_rows)
+            values.append(posting_weights * (query_weight * self._idf[term_id]))
+        if not rows:
+            return []
+        scores = np.bincount(np.concatenate(rows), weights=np.concatenate(values),
+                             minlength=len(self._row_experts))
+        scores /= self._norms * math.sqrt(query_norm)
+        scores[~self._active] = 0.0
+        for expert_id in exclude:
+            row = self._expert_rows.get(expert_id)
+            if row is not None:
+                scores[row] = 0.0
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self._row_experts[row], float(scores[row])) for row in top if scores[row] > 0]
+
+
+class ExpertMatching:
+    """
+    DB의 전문가/요청과 앱별 MatchIndex 동기화
+
+    expert_model: id, expertise, help_types, role, active, updated_at 컬럼
+    request_model: id, description, help_type, role 컬럼
+    """
+
+    def __init__(self, db, expert_model, request_model, app=None):
+        self.db = db
+        self.expert_model = expert_model
+        self.request_model = request_model
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('EXPERT_MATCH_TOP_K', DEFAULT_TOP_K)
+        # 워터마크 앞에서 다시 읽을 구간 (서버 간 시계 차이 + 가장 긴 쓰기 트랜잭션보다 길게)
+        app.config.setdefault('EXPERT_MATCH_SYNC_OVERLAP', 60)
+        app.config.setdefault('EXPERT_MATCH_REQUEST_OVERLAP', 1000)
+        app.extensions['expert_matching'] = {
+            'index': None, 'lock': threading.Lock(),
+            # 반영한 가장 늦은 updated_at과, 그 앞 구간에서 반영한 전문가 id -> updated_at
+            'expert_mark': None, 'expert_seen': {},
+            'request_mark': 0,
+        }
+
+    @property
+    def available(self):
+        return AVAILABLE
+
+    def sync(self):
+        """마지막 동기화 이후 바뀐 전문가/새 요청을 색인에 반영하고 색인 반환"""
+        state = current_app.extensions['expert_matching']
+        with state['lock']:
+            if state['index'] is None:
+                state['index'] = MatchIndex()
+            self._sync_experts(state)
+            self._sync_requests(state)
+            return state['index']
+
+    def _sync_experts(self, state):
+        model = self.expert_model
+        overlap = timedelta(seconds=current_app.config['EXPERT_MATCH_SYNC_OVERLAP'])
+        stmt = (
+            self.db.select(model.id, model.expertise, model.help_types, model.role, model.active,
+                           model.updated_at)
+            .order_by(model.updated_at, model.id)
+        )
+        if state['expert_mark'] is not None:
+            stmt = stmt.where(model.updated_at >= state['expert_mark'] - overlap)
+        index = state['index']
+        seen = state['expert_seen']
+        for row in self.db.session.execute(stmt):
+            if seen.get(row.id) == row.updated_at:
+                continue
+            if row.active:
+                index.add_expert(row.id, expert_document(row))
+            else:
+                index.remove_expert(row.id)
+            seen[row.id] = row.updated_at
+            if state['expert_mark'] is None or row.updated_at > state['expert_mark']:
+                state['expert_mark'] = row.updated_at
+        if state['expert_mark'] is not None:
+            # 구간을 벗어난 행은 updated_at이 바뀌어야 다시 읽히므로 기록할 필요 없음
+            horizon = state['expert_mark'] - overlap
+            for expert_id in [e for e, updated_at in seen.items() if updated_at < horizon]:
+                del seen[expert_id]
+
+    def _sync_requests(self, state):
+        model = self.request_model
+        # 구간 안의 id만 먼저 읽고, 색인에 없는 첫 요청부터 본문까지 읽음
+        low = max(state['request_mark'] - current_app.config['EXPERT_MATCH_REQUEST_OVERLAP'], 0)
+        ids = self.db.session.execute(
+            self.db.select(model.id).where(model.id > low).order_by(model.id)
+        ).scalars().all()
+        index = state['index']
+        first = next((request_id for request_id in ids if not index.has_request(request_id)), None)
+        if first is None:
+            return
+        stmt = (
+            self.db.select(model.id, model.description, model.help_type, model.role)
+            .where(model.id >= first)
+            .order_by(model.id)
+        )
+        for row in self.db.session.execute(stmt):
+            if not index.has_request(row.id):
+                index.add_request(row.id, request_document(row))
+            state['request_mark'] = max(state['request_mark'], row.id)
+
+    def candidates(self, request_id, k=None):
+        """요청 하나에 대한 추천 [(전문가 객체, 점수)] (전문가는 쿼리 한 번으로 읽음)"""
+        k = k or current_app.config['EXPERT_MATCH_TOP_K']
+        index = self.sync()
+        state = current_app.extensions['expert_matching']
+        with state['lock']:
+            ranked = index.top_experts(request_id, k=k)
+        if not ranked:
+            return []
+        experts = {expert.id: expert for expert in
+                   self.expert_model.query.filter(self.expert_model.id.in_([e for e, _ in ranked]))}
+        return [(experts[expert_id], score) for expert_id, score in ranked if expert_id in experts]
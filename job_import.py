@@ -0,0 +1,196 @@
+"""
+채용공고 일괄 등록 (파트너 피드 CSV/JSONL)
+
+- 입력은 스트림으로 한 줄씩 읽어서 BATCH_SIZE개씩 처리 (파일 전체를 메모리에 올리지 않음)
+- 행 검증 실패는 건너뛰고 줄 번호와 사유를 보고서에 남김
+- (company, title, apply_url)이 같은 공고는 중복으로 보고 건너뜀
+  (이미 DB에 있는 것과 같은 입력 안에서 반복된 것 모두)
+- 배치마다 트랜잭션 하나, INSERT는 executemany로 한 번에 실행하고
+  돌려받은 id로 전문 검색 색인(job_search.index_rows)도 같은 트랜잭션에서 갱신
+  (Core INSERT는 ORM after_insert 이벤트를 거치지 않음)
+- UTF-8이 아닌 줄을 만나면 거기서 멈추고, 그 앞까지 등록한 건수와 실패한 줄 번호를
+  보고서('aborted')에 남김 (이전 배치는 이미 커밋됨. 같은 파일을 고쳐 다시 올리면 중복으로 건너뜀)
+"""
+
+import csv
+import json
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, select
+
+import job_search
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+FORMATS = ('csv', 'jsonl')
+REQUIRED_FIELDS = ('title', 'company', 'location', 'apply_url', 'description')
+# JobPost 컬럼 길이 제한
+MAX_LENGTHS = {'title': 100, 'company': 100, 'location': 100, 'apply_url': 500}
+
+
+def detect_format(filename='', content_type=''):
+    """파일 이름/Content-Type으로 형식 추정 (모르면 None)"""
+    filename = (filename or '').lower()
+    content_type = (content_type or '').lower()
+    if filename.endswith('.csv') or 'csv' in content_type:
+        return 'csv'
+    if filename.endswith(('.jsonl', '.ndjson')) or 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'jsonl'
+    return None
+
+
+def read_rows(stream, fmt):
+    """(줄 번호, dict 또는 파싱 오류 메시지) 를 차례로 생성. stream은 텍스트 스트림"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == 'jsonl':
+        for line_no, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_no, f'JSON 파싱 실패: {e}'
+                continue
+            yield line_no, row if isinstance(row, dict) else '객체가 아닌 JSON 값'
+    else:
+        raise ValueError(f'지원하지 않는 형식: {fmt}')
+
+
+def validate_row(row):
+    """INSERT할 값 dict 반환. 잘못된 행이면 ValueError"""
+    if not isinstance(row, dict):
+        raise ValueError(row)
+    values = {}
+    for field in REQUIRED_FIELDS:
+        value = row.get(field)
+        value = '' if value is None else str(value).strip()
+        if not value:
+            raise ValueError(f'{field} 누락')
+        limit = MAX_LENGTHS.get(field)
+        if limit and len(value) > limit:
+            raise ValueError(f'{field} 길이 초과 ({len(value)} > {limit})')
+        values[field] = value
+    if not values['apply_url'].startswith(('http://', 'https://')):
+        raise ValueError('apply_url은 http(s) 주소여야 함')
+
+    posted_at = row.get('posted_at')
+    if posted_at:
+        try:
+            values['posted_at'] = datetime.fromisoformat(str(posted_at).strip().replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError(f'posted_at 형식 오류: {posted_at}') from None
+        if values['posted_at'].tzinfo is not None:
+            # DB에는 UTC naive 값으로 저장 (datetime.utcnow 기본값과 맞춤)
+            values['posted_at'] = values['posted_at'].astimezone(timezone.utc).replace(tzinfo=None)
+    return values
+
+
+def _dedupe_key(values):
+    return values['company'], values['title'], values['apply_url']
+
+
+class JobImporter:
+    """
+    job_post 테이블에 배치 INSERT
+
+    engine: SQLAlchemy 엔진, table: JobPost.__table__,
+    location_key: 위치 -> 필터 키 함수 (app.normalize_location)
+    """
+
+    def __init__(self, engine, table, location_key, batch_size=BATCH_SIZE):
+        self.engine = engine
+        self.table = table
+        self.location_key = location_key
+        self.batch_size = batch_size
+
+    def run(self, stream, fmt):
+        """스트림 전체를 등록하고 보고서 dict 반환"""
+        report = {'format': fmt, 'read': 0, 'inserted': 0, 'duplicates': 0, 'invalid': 0, 'errors': []}
+        started = time.perf_counter()
+        seen = set()
+        batch = []
+        try:
+            for line_no, row in read_rows(stream, fmt):
+                report['read'] += 1
+                try:
+                    values = validate_row(row)
+                except ValueError as e:
+                    report['invalid'] += 1
+                    if len(report['errors']) < MAX_REPORTED_ERRORS:
+                        report['errors'].append({'line': line_no, 'error': str(e)})
+                    continue
+                key = _dedupe_key(values)
+                if key in seen:
+                    report['duplicates'] += 1
+                    continue
+                seen.add(key)
+                batch.append(values)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, report)
+                    batch = []
+        except UnicodeDecodeError as e:
+            # 앞에서 읽은 행은 정상이므로 아래에서 마저 등록
+            report['aborted'] = {'line': getattr(stream, 'line_no', None),
+                                 'error': f'UTF-8 디코딩 실패 ({e.reason})'}
+        if batch:
+            self._flush(batch, report)
+
+        elapsed = time.perf_counter() - started
+        report['seconds'] = round(elapsed, 3)
+        report['rows_per_sec'] = round(report['read'] / elapsed, 1) if elapsed > 0 else None
+        return report
+
+    def _existing_keys(self, connection, batch):
+        table = self.table
+        query = select(table.c.company, table.c.title, table.c.apply_url) \
+            .where(table.c.apply_url.in_(bindparam('urls', expanding=True)))
+        urls = sorted({values['apply_url'] for values in batch})
+        return {tuple(row) for row in connection.execute(query, {'urls': urls})}
+
+    def _flush(self, batch, report):
+        table = self.table
+        with self.engine.begin() as connection:
+            existing = self._existing_keys(connection, batch)
+            params = []
+            now = datetime.utcnow()
+            for values in batch:
+                if _dedupe_key(values) in existing:
+                    report['duplicates'] += 1
+                    continue
+                params.append(dict(values, location_key=self.location_key(values['location']),
+                                   posted_at=values.get('posted_at') or now))
+            if not params:
+                return
+            columns = [table.c.id] + [table.c[column] for column in job_search.FTS_COLUMNS]
+            # executemany + RETURNING (insertmanyvalues): 배치 전체가 INSERT 몇 번으로 끝남
+            rows = connection.execute(
+                table.insert().returning(*columns, sort_by_parameter_order=True), params
+            ).all()
+            if job_search.is_supported(connection):
+                job_search.index_rows(connection, rows, replace=False)
+            report['inserted'] += len(rows)
+
+
+class Utf8Lines:
+    """바이트 스트림을 줄 단위로 UTF-8 디코딩. 디코딩에 실패하면 line_no가 그 줄 번호"""
+
+    def __init__(self, binary):
+        self.binary = binary
+        self.line_no = 0
+
+    def __iter__(self):
+        for raw in self.binary:
+            self.line_no += 1
+            yield raw.decode('utf-8-sig' if self.line_no == 1 else 'utf-8')
+
+
+def text_stream(binary):
+    """
+    업로드/요청 본문(바이트 스트림)을 UTF-8 텍스트 줄로 (BOM 허용, 줄바꿈은 그대로)
+    csv 모듈과 JSONL 읽기 모두 줄 iterable이면 됨
+    """
+    return Utf8Lines(binary)
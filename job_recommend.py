@@ -0,0 +1,493 @@
+"""
+채용공고 추천 (비슷한 공고 / 본·저장한 공고 기반 추천)
+
+- 배치 (flask build-recommendations): 전체 공고의 TF-IDF 벡터(제목 가중 + 설명,
+  job_search.tokenize)로 공고마다 유사도 top-k 이웃을 계산
+  점수 = (1 - LOCATION_WEIGHT) * 코사인 + LOCATION_WEIGHT * (location_key가 같으면 1)
+  공고의 MAX_DF 비율보다 많이 나오는 흔한 용어('engineer' 등)는 불용어로 보고 어휘에서 뺌
+- 저장: 디렉터리 아래 버전별 폴더에 .npy 배열 + meta.json, CURRENT 파일이 현재 버전을 가리킴
+  새 배치는 새 폴더에 다 쓴 뒤 CURRENT를 원자적으로 교체. 배열은 np.load(mmap_mode='r')로 열어서
+  워커 프로세스들이 같은 페이지 캐시를 공유하고 시작 시 읽기 비용이 거의 없음
+- 조회: 공고 id -> 행(row_of 배열) -> 미리 계산한 이웃 k개. 공고 수와 무관한 상수 시간
+  추천은 본 공고(최대 MAX_SEEN개) 이웃 점수의 합
+- 증분: 배치 이후 등록된 공고는 저장된 어휘/IDF로 벡터를 만들어 이웃을 계산하고, 기존 공고의
+  이웃 목록에 들어갈 점수면 그 목록도 메모리에서 교체 (다음 배치 전까지 유지)
+  add_job은 등록 즉시 반영하고, 다른 워커/일괄 등록분은 JOB_RECOMMEND_SYNC_SECONDS마다
+  DB 동기화 워터마크(synced_job_id, 이 프로세스의 add_job은 올리지 않음) 이후 공고를 읽어 반영
+  id는 커밋 순서가 아니므로 워터마크 앞 JOB_RECOMMEND_SYNC_OVERLAP개 id도 다시 확인하고
+  이미 반영한 공고는 건너뜀
+- numpy가 없으면 AVAILABLE이 False (추천 기능만 꺼짐)
+"""
+
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+from array import array
+from collections import Counter
+from datetime import datetime
+
+from flask import current_app
+
+from job_search import tokenize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AVAILABLE = np is not None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+DEFAULT_K = 20
+TITLE_WEIGHT = 3.0
+LOCATION_WEIGHT = 0.15
+# 공고의 MAX_DF 비율보다 많이 나오는 용어는 불용어로 보고 어휘에서 뺌
+# (공고 수가 적을 때는 MIN_STOP_DF개 이하로 나오는 용어는 항상 유지)
+MAX_DF = 0.1
+MIN_STOP_DF = 50
+# 배치에서 한 번에 계산하는 내적 행렬 크기 (공고 수 x 묶음 크기, float64 기준 약 32MB)
+BLOCK_CELLS = 4_000_000
+MAX_SEEN = 20
+# 오래된 배치 폴더는 이 개수만 남김 (이전 버전을 열고 있는 워커가 있을 수 있음)
+KEEP_VERSIONS = 2
+# 한 번의 동기화에서 증분 반영할 최대 공고 수 (넘으면 배치를 다시 돌리라고 로그)
+SYNC_LIMIT = 500
+ARRAYS = ('job_ids', 'row_of', 'locations', 'neighbors', 'scores', 'idf', 'term_ptr', 'post_rows',
+          'post_weights')
+
+
+def job_terms(title, description):
+    """용어 -> 가중 tf (1 + log 횟수, 제목은 TITLE_WEIGHT배)"""
+    weights = {term: 1.0 + math.log(count) for term, count in Counter(tokenize(description)).items()}
+    for term, count in Counter(tokenize(title)).items():
+        weights[term] = weights.get(term, 0.0) + TITLE_WEIGHT * (1.0 + math.log(count))
+    return weights
+
+
+def _gather(terms, query_weights, term_ptr, post_rows, post_weights):
+    """용어별 posting을 이어 붙여 (후보 행, 내적) 반환"""
+    starts = term_ptr[terms]
+    ends = term_ptr[terms + 1]
+    if not len(terms) or not (ends - starts).any():
+        return np.zeros(0, np.int32), np.zeros(0)
+    index = np.concatenate([np.arange(start, end) for start, end in zip(starts, ends)])
+    weights = post_weights[index] * np.repeat(query_weights, ends - starts)
+    candidates, inverse = np.unique(post_rows[index], return_inverse=True)
+    return candidates, np.bincount(inverse.ravel(), weights=weights)
+
+
+def _top(candidates, scores, k):
+    """점수 내림차순 상위 k개 (동점은 후보 순서 유지)"""
+    if len(scores) > k:
+        part = np.argpartition(-scores, k - 1)[:k]
+        candidates, scores = candidates[part], scores[part]
+    order = np.argsort(-scores, kind='stable')
+    return candidates[order], scores[order]
+
+
+def build(rows, k=DEFAULT_K):
+    """
+    rows: (id, title, description, location_key) 반복 가능 객체
+    반환: (배열 dict, meta dict) -> save()로 저장
+    """
+    if np is None:
+        raise RuntimeError('채용공고 추천에는 numpy가 필요합니다 (pip install numpy)')
+    started = time.perf_counter()
+    vocabulary = {}
+    location_keys = {}
+    job_ids = array('q')
+    locations = array('i')
+    doc_ptr = array('q', [0])
+    term_ids = array('q')
+    term_weights = array('d')
+    for job_id, title, description, location_key in rows:
+        for term, weight in job_terms(title, description).items():
+            term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+            term_weights.append(weight)
+        doc_ptr.append(len(term_ids))
+        job_ids.append(job_id)
+        locations.append(location_keys.setdefault(location_key or '', len(location_keys)))
+
+    n = len(job_ids)
+    job_ids = np.array(job_ids, dtype=np.int64)
+    locations = np.array(locations, dtype=np.int32)
+    term_ids = np.array(term_ids, dtype=np.int64)
+    values = np.array(term_weights, dtype=np.float64)
+    doc_of = np.repeat(np.arange(n, dtype=np.int64), np.diff(np.array(doc_ptr, dtype=np.int64)))
+
+    # 흔한 용어를 어휘에서 빼고 용어 번호를 다시 매김
+    df = np.bincount(term_ids, minlength=len(vocabulary))
+    kept = df <= max(int(MAX_DF * n), MIN_STOP_DF)
+    terms = [term for term, term_id in sorted(vocabulary.items(), key=lambda item: item[1]) if kept[term_id]]
+    entries = kept[term_ids]
+    term_ids = (np.cumsum(kept) - 1)[term_ids[entries]]
+    values = values[entries]
+    doc_of = doc_of[entries]
+    df = df[kept]
+    doc_ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(doc_of, minlength=n), out=doc_ptr[1:])
+
+    # TF-IDF + 문서별 L2 정규화 (내적 = 코사인)
+    idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+    values *= idf[term_ids]
+    norms = np.sqrt(np.bincount(doc_of, weights=values * values, minlength=n))
+    norms[norms == 0] = 1.0
+    values /= norms[doc_of]
+
+    # 용어 -> 문서 역색인 (CSC)
+    order = np.argsort(term_ids, kind='stable')
+    post_rows = doc_of[order]
+    post_weights = values[order]
+    term_ptr = np.zeros(len(terms) + 1, dtype=np.int64)
+    np.cumsum(df, out=term_ptr[1:])
+
+    # 공고 block개씩 (block x n 내적 행렬) 역색인으로 내적을 모으고 행별 top-k
+    width = min(k, n)
+    neighbors = np.full((n, k), -1, dtype=np.int64)
+    scores = np.zeros((n, k), dtype=np.float32)
+    block = max(1, BLOCK_CELLS // max(n, 1))
+    for first in range(0, n, block):
+        last = min(first + block, n)
+        lo, hi = doc_ptr[first], doc_ptr[last]
+        lengths = df[term_ids[lo:hi]]
+        offsets = np.repeat(term_ptr[term_ids[lo:hi]] - (np.cumsum(lengths) - lengths), lengths) \
+            + np.arange(lengths.sum())
+        keys = np.repeat(doc_of[lo:hi] - first, lengths) * n + post_rows[offsets]
+        dots = np.bincount(keys, weights=post_weights[offsets] * np.repeat(values[lo:hi], lengths),
+                           minlength=(last - first) * n).reshape(last - first, n)
+        same_location = locations[None, :] == locations[first:last, None]
+        final = np.where(dots > 0, (1 - LOCATION_WEIGHT) * dots + LOCATION_WEIGHT * same_location, 0.0)
+        final[np.arange(last - first), np.arange(first, last)] = 0.0
+        if width < n:
+            top = np.argpartition(-final, width - 1, axis=1)[:, :width]
+        else:
+            top = np.broadcast_to(np.arange(n), final.shape)
+        top_scores = np.take_along_axis(final, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        found = top_scores > 0
+        neighbors[first:last, :width] = np.where(found, job_ids[top], -1)
+        scores[first:last, :width] = np.where(found, top_scores, 0.0)
+
+    max_job_id = int(job_ids.max()) if n else 0
+    row_of = np.full(max_job_id + 1, -1, dtype=np.int32)
+    row_of[job_ids] = np.arange(n, dtype=np.int32)
+    arrays = {
+        'job_ids': job_ids, 'row_of': row_of, 'locations': locations,
+        'neighbors': neighbors, 'scores': scores, 'idf': idf.astype(np.float32),
+        'term_ptr': term_ptr, 'post_rows': post_rows.astype(np.int32),
+        'post_weights': post_weights.astype(np.float32),
+    }
+    meta = {
+        'format': FORMAT_VERSION,
+        'created_at': datetime.utcnow().isoformat(timespec='seconds'),
+        'jobs': n,
+        'k': k,
+        'max_job_id': max_job_id,
+        'vocabulary': terms,
+        'stop_words': int((~kept).sum()),
+        'location_keys': sorted(location_keys, key=location_keys.get),
+        'seconds': round(time.perf_counter() - started, 2),
+    }
+    return arrays, meta
+
+
+def current_version(path):
+    try:
+        with open(os.path.join(path, 'CURRENT'), encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def save(path, arrays, meta):
+    """새 버전 폴더에 쓰고 CURRENT 교체, 오래된 버전 정리. 버전 이름 반환"""
+    os.makedirs(path, exist_ok=True)
+    version = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
+    target = os.path.join(path, version)
+    staging = target + '.tmp'
+    os.makedirs(staging)
+    for name in ARRAYS:
+        np.save(os.path.join(staging, name + '.npy'), arrays[name])
+    with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(staging, target)
+
+    pointer = os.path.join(path, 'CURRENT.tmp')
+    with open(pointer, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(path, 'CURRENT'))
+
+    versions = sorted(name for name in os.listdir(path)
+                      if os.path.isdir(os.path.join(path, name)) and not name.endswith('.tmp'))
+    for name in versions[:-KEEP_VERSIONS]:
+        # 이전 버전을 mmap으로 열고 있는 워커가 있어도 POSIX에서는 삭제해도 계속 읽힘
+        shutil.rmtree(os.path.join(path, name), ignore_errors=True)
+    return version
+
+
+class RecommendationIndex:
+    """저장된 배치 결과(mmap) + 배치 이후 공고의 메모리 반영분 (잠금은 호출하는 쪽에서)"""
+
+    def __init__(self, directory):
+        if np is None:
+            raise RuntimeError('채용공고 추천에는 numpy가 필요합니다 (pip install numpy)')
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['format'] != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 추천 색인 형식: {meta['format']}")
+        self.version = os.path.basename(directory)
+        self.k = meta['k']
+        self.max_job_id = meta['max_job_id']
+        self.vocabulary = {term: i for i, term in enumerate(meta['vocabulary'])}
+        self.location_keys = {key: i for i, key in enumerate(meta['location_keys'])}
+        for name in ARRAYS:
+            setattr(self, name, np.load(os.path.join(directory, name + '.npy'), mmap_mode='r'))
+        # 배치 이후 반영분: 교체된 이웃 목록, 새 공고 (위치 코드), 새 공고의 역색인
+        # DB에서 읽어 반영한 가장 큰 id (JobRecommender._sync만 올림)
+        self.synced_job_id = self.max_job_id
+        self._lists = {}
+        self._extra_locations = {}
+        self._extra_postings = {}
+
+    def __len__(self):
+        return len(self.job_ids) + len(self._extra_locations)
+
+    def has_job(self, job_id):
+        return job_id in self._extra_locations or self._row(job_id) is not None
+
+    def _row(self, job_id):
+        if 0 <= job_id <= self.max_job_id:
+            row = int(self.row_of[job_id])
+            if row >= 0:
+                return row
+        return None
+
+    def _neighbors(self, job_id):
+        entry = self._lists.get(job_id)
+        if entry is not None:
+            return entry
+        row = self._row(job_id)
+        if row is None:
+            return None
+        return self.neighbors[row], self.scores[row]
+
+    def similar(self, job_id, limit=None):
+        """비슷한 공고 [(공고 id, 점수)] (점수 내림차순)"""
+        entry = self._neighbors(job_id)
+        if entry is None:
+            return []
+        ids, scores = entry
+        return [(other, score) for other, score in zip(ids[:limit].tolist(), scores[:limit].tolist())
+                if other >= 0]
+
+    def recommend(self, seen, limit):
+        """본 공고들 이웃 점수의 합이 큰 순 (본 공고는 제외)"""
+        seen = list(dict.fromkeys(seen))[-MAX_SEEN:]
+        totals = Counter()
+        for job_id in seen:
+            for other, score in self.similar(job_id):
+                totals[other] += score
+        for job_id in seen:
+            totals.pop(job_id, None)
+        return sorted(totals.items(), key=lambda item: (-item[1], -item[0]))[:limit]
+
+    def _rows_of(self, job_ids):
+        """배치 행 배열 (배치에 없는 공고는 -1. max_job_id 이하의 빈 id도 배치 이후 공고일 수 있음)"""
+        rows = np.full(len(job_ids), -1, dtype=np.int64)
+        in_range = (job_ids >= 0) & (job_ids <= self.max_job_id)
+        rows[in_range] = self.row_of[job_ids[in_range]]
+        return rows
+
+    def _locations_of(self, job_ids):
+        codes = np.full(len(job_ids), -1, dtype=np.int64)
+        rows = self._rows_of(job_ids)
+        base = rows >= 0
+        codes[base] = self.locations[rows[base]]
+        for i in np.flatnonzero(~base):
+            codes[i] = self._extra_locations.get(int(job_ids[i]), -1)
+        return codes
+
+    def add_job(self, job_id, title, description, location_key):
+        """배치 이후 등록된 공고 반영 (이미 있으면 무시)"""
+        if self.has_job(job_id):
+            return False
+        terms, weights = [], []
+        for term, weight in job_terms(title, description).items():
+            term_id = self.vocabulary.get(term)
+            if term_id is not None:  # 배치에 없던 용어는 IDF를 몰라서 다음 배치까지 무시
+                terms.append(term_id)
+                weights.append(weight * float(self.idf[term_id]))
+        location = self.location_keys.setdefault(location_key or '', len(self.location_keys))
+        self._extra_locations[job_id] = location
+        if not terms:
+            return True
+        terms = np.array(terms, dtype=np.int64)
+        weights = np.array(weights)
+        weights /= np.sqrt((weights * weights).sum())
+
+        # 배치 공고 후보 (행 -> 공고 id) + 배치 이후 공고 후보
+        rows, dots = _gather(terms, weights, self.term_ptr, self.post_rows, self.post_weights)
+        candidate_ids = [np.asarray(self.job_ids[rows])]
+        candidate_dots = [dots]
+        for term_id, weight in zip(terms.tolist(), weights.tolist()):
+            posting = self._extra_postings.get(term_id)
+            if posting:
+                candidate_ids.append(np.array(posting[0], dtype=np.int64))
+                candidate_dots.append(np.array(posting[1]) * weight)
+        candidates, inverse = np.unique(np.concatenate(candidate_ids), return_inverse=True)
+        dots = np.bincount(inverse.ravel(), weights=np.concatenate(candidate_dots))
+        for term_id, weight in zip(terms.tolist(), weights.tolist()):
+            posting = self._extra_postings.setdefault(term_id, (array('q'), array('d')))
+            posting[0].append(job_id)
+            posting[1].append(weight)
+        if not len(candidates):
+            self._lists[job_id] = (np.zeros(0, np.int64), np.zeros(0, np.float32))
+            return True
+
+        final = (1 - LOCATION_WEIGHT) * dots + LOCATION_WEIGHT * (self._locations_of(candidates) == location)
+        top_ids, top_scores = _top(candidates, final, self.k)
+        self._lists[job_id] = (top_ids, top_scores.astype(np.float32))
+
+        # 기존 공고 중 이웃 목록이 덜 찼거나 마지막 점수보다 높은 공고만 목록 교체
+        thresholds = np.full(len(candidates), -1.0)
+        rows = self._rows_of(candidates)
+        base = rows >= 0
+        rows = rows[base]
+        full = self.neighbors[rows, -1] >= 0
+        thresholds[base] = np.where(full, self.scores[rows, -1], -1.0)
+        for i, other in enumerate(candidates.tolist()):
+            entry = self._lists.get(other)
+            if entry is not None:
+                ids, scores = entry
+                thresholds[i] = scores[-1] if len(ids) >= self.k else -1.0
+        for other, score in zip(candidates[final > thresholds].tolist(), final[final > thresholds].tolist()):
+            ids, scores = self._neighbors(other)
+            ids = np.append(np.asarray(ids)[np.asarray(ids) >= 0], job_id)
+            scores = np.append(np.asarray(scores)[:len(ids) - 1], np.float32(score))
+            self._lists[other] = _top(ids, scores, self.k)
+        return True
+
+
+class JobRecommender:
+    """
+    앱(DB)별 RecommendationIndex 관리
+
+    model: id, title, description, location_key 컬럼을 가진 채용공고 모델
+    """
+
+    def __init__(self, db, model, app=None):
+        self.db = db
+        self.model = model
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('JOB_RECOMMEND_PATH', 'job_recommendations')
+        app.config.setdefault('JOB_RECOMMEND_K', DEFAULT_K)
+        # 새 배치(CURRENT)와 다른 워커가 등록한 공고를 확인하는 간격 (초)
+        app.config.setdefault('JOB_RECOMMEND_SYNC_SECONDS', 10)
+        # 늦게 커밋된 공고를 찾으려고 워터마크 앞에서 다시 확인할 id 수
+        app.config.setdefault('JOB_RECOMMEND_SYNC_OVERLAP', 1000)
+        app.extensions['job_recommender'] = {'index': None, 'checked_at': None, 'lock': threading.Lock()}
+
+    @property
+    def available(self):
+        return AVAILABLE
+
+    def build(self, k=None):
+        """DB 전체로 배치 실행 후 저장. meta 반환"""
+        model = self.model
+        stmt = (
+            self.db.select(model.id, model.title, model.description, model.location_key)
+            .execution_options(yield_per=1000)
+        )
+        rows = ((row.id, row.title, row.description, row.location_key)
+                for row in self.db.session.execute(stmt))
+        arrays, meta = build(rows, k or current_app.config['JOB_RECOMMEND_K'])
+        meta['version'] = save(current_app.config['JOB_RECOMMEND_PATH'], arrays, meta)
+        # 이 프로세스는 다음 조회 때 바로 새 버전을 읽음
+        current_app.extensions['job_recommender']['checked_at'] = None
+        return meta
+
+    def _index(self, state):
+        """잠금 안에서 호출. 간격마다 CURRENT와 새 공고 확인"""
+        now = time.monotonic()
+        if state['checked_at'] is not None and now - state['checked_at'] < \
+                current_app.config['JOB_RECOMMEND_SYNC_SECONDS']:
+            return state['index']
+        state['checked_at'] = now
+        path = current_app.config['JOB_RECOMMEND_PATH']
+        version = current_version(path)
+        if version is None:
+            state['index'] = None
+            return None
+        index = state['index']
+        if index is None or index.version != version:
+            index = state['index'] = RecommendationIndex(os.path.join(path, version))
+        self._sync(index)
+        return index
+
+    def _sync(self, index):
+        model = self.model
+        overlap = current_app.config['JOB_RECOMMEND_SYNC_OVERLAP']
+        # 구간 안의 id만 먼저 읽고, 색인에 없는 첫 공고부터 본문까지 읽음
+        ids = self.db.session.execute(
+            self.db.select(model.id)
+            .where(model.id > max(index.synced_job_id - overlap, 0))
+            .order_by(model.id)
+            .limit(overlap + SYNC_LIMIT)
+        ).scalars().all()
+        first = next((job_id for job_id in ids if not index.has_job(job_id)), None)
+        if first is None:
+            if ids:
+                index.synced_job_id = max(index.synced_job_id, ids[-1])
+            return
+        stmt = (
+            self.db.select(model.id, model.title, model.description, model.location_key)
+            .where(model.id >= first)
+            .order_by(model.id)
+            .limit(SYNC_LIMIT)
+        )
+        rows = self.db.session.execute(stmt).all()
+        for row in rows:
+            index.add_job(row.id, row.title, row.description, row.location_key)
+            index.synced_job_id = max(index.synced_job_id, row.id)
+        if len(rows) == SYNC_LIMIT:
+            logger.warning('추천 색인 이후 등록된 공고가 많습니다. flask build-recommendations를 다시 실행하세요')
+
+    def add(self, job):
+        """방금 등록한 공고를 이 프로세스의 색인에 바로 반영 (색인이 없으면 무시)"""
+        state = current_app.extensions['job_recommender']
+        with state['lock']:
+            index = self._index(state)
+            if index is not None:
+                index.add_job(job.id, job.title, job.description, job.location_key)
+
+    def _load(self, ranked):
+        if not ranked:
+            return []
+        jobs = {job.id: job for job in self.model.query.filter(self.model.id.in_([i for i, _ in ranked]))}
+        return [(jobs[job_id], score) for job_id, score in ranked if job_id in jobs]
+
+    def similar(self, job_id, limit):
+        """[(채용공고, 점수)]"""
+        state = current_app.extensions['job_recommender']
+        with state['lock']:
+            index = self._index(state)
+            ranked = index.similar(job_id, limit) if index is not None else []
+        return self._load(ranked)
+
+    def recommend(self, seen, limit):
+        state = current_app.extensions['job_recommender']
+        with state['lock']:
+            index = self._index(state)
+            ranked = index.recommend(seen, limit) if index is not None else []
+        return self._load(ranked)
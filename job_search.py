@@ -0,0 +1,217 @@
+"""
+채용공고 전문 검색 (SQLite FTS5)
+
+- job_post_fts 가상 테이블에 title/company/location/description을 색인
+- 한글은 2-gram, 그 외 단어는 소문자 단어 단위로 미리 토큰화해서 저장
+  (unicode61 토크나이저는 공백 기준이므로 한글 부분 문자열 검색이 가능해짐)
+- 검색은 BM25 가중치 순위, 영문/숫자 단어는 접두 검색 (2/3글자 접두 색인 사용)
+- 위치 필터는 location 컬럼 필터로 같은 MATCH에 넣음: 'Korea'가 'Seoul, Korea'에,
+  '서울'이 '대한민국 서울'에 맞음 (단어/2-gram 단위 부분 일치, 대소문자 무시)
+- FTS5를 쓸 수 없는 DB(예: PostgreSQL)에서는 LIKE 검색으로 대체
+"""
+
+import re
+import weakref
+
+from sqlalchemy import Integer, text
+
+FTS_TABLE = 'job_post_fts'
+FTS_COLUMNS = ('title', 'company', 'location', 'description')
+# bm25 컬럼 가중치 (제목 > 회사 > 위치 > 설명)
+BM25_WEIGHTS = (10.0, 5.0, 3.0, 1.0)
+REBUILD_BATCH_SIZE = 1000
+
+_HANGUL = '가-힣ㄱ-ㆎ'
+_TOKEN_RE = re.compile(rf'[{_HANGUL}]+|[^\W_{_HANGUL}]+')
+
+
+# 엔진별 FTS5 지원 여부 (엔진이 살아 있는 동안 바뀌지 않으므로 한 번만 확인)
+_supported = weakref.WeakKeyDictionary()
+
+
+def is_supported(connection):
+    """현재 DB에서 FTS5 검색을 쓸 수 있는지 확인"""
+    if connection.dialect.name != 'sqlite':
+        return False
+    engine = connection.engine
+    supported = _supported.get(engine)
+    if supported is None:
+        try:
+            supported = bool(connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar())
+        except Exception:
+            supported = False
+        _supported[engine] = supported
+    return supported
+
+
+def _runs(value):
+    return _TOKEN_RE.findall((value or '').lower())
+
+
+def _is_hangul(run):
+    return '가' <= run[0] <= '힣' or 'ㄱ' <= run[0] <= 'ㆎ'
+
+
+def _bigrams(run):
+    if len(run) < 2:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(value):
+    """색인용 토큰 목록 (한글 run은 2-gram, 나머지는 단어)"""
+    tokens = []
+    for run in _runs(value):
+        if _is_hangul(run):
+            tokens.extend(_bigrams(run))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def build_match_expression(query):
+    """사용자 검색어를 FTS5 MATCH 식으로 변환 (모든 항목 AND)"""
+    terms = []
+    for run in _runs(query):
+        if _is_hangul(run) and len(run) > 1:
+            # 연속된 2-gram 구문 = 부분 문자열 일치
+            terms.append('"' + ' '.join(_bigrams(run)) + '"')
+        else:
+            terms.append(f'"{run}"*')
+    return ' '.join(terms)
+
+
+def _document(job, memo=None):
+    if memo is None:
+        return {column: ' '.join(tokenize(getattr(job, column))) for column in FTS_COLUMNS}
+    doc = {}
+    for column in FTS_COLUMNS:
+        value = getattr(job, column)
+        tokens = memo.get(value)
+        if tokens is None:
+            tokens = memo[value] = ' '.join(tokenize(value))
+        doc[column] = tokens
+    return doc
+
+
+def ensure_index(connection):
+    """FTS 테이블 생성, 원본 테이블과 건수가 다르면 재색인"""
+    if not is_supported(connection):
+        return False
+    connection.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{', '.join(FTS_COLUMNS)}, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    ))
+    indexed = connection.execute(text(f'SELECT count(*) FROM {FTS_TABLE}')).scalar()
+    total = connection.execute(text('SELECT count(*) FROM job_post')).scalar()
+    if indexed != total:
+        rebuild_index(connection)
+    return True
+
+
+def rebuild_index(connection):
+    """job_post 전체를 배치 단위로 다시 색인"""
+    connection.execute(text(f'DELETE FROM {FTS_TABLE}'))
+    columns = ', '.join(FTS_COLUMNS)
+    result = connection.execute(text(f'SELECT id, {columns} FROM job_post ORDER BY id'))
+    while True:
+        rows = result.fetchmany(REBUILD_BATCH_SIZE)
+        if not rows:
+            break
+        index_rows(connection, rows, replace=False)
+
+
+def index_rows(connection, rows, replace=True):
+    """
+    id와 FTS_COLUMNS 속성을 가진 행들을 한 번에 색인 (executemany)
+
+    replace=False: 방금 INSERT한 행처럼 기존 색인이 없는 것이 확실할 때 DELETE 생략
+    """
+    params = []
+    # 같은 배치 안에서 반복되는 값(회사, 위치 등)은 한 번만 토큰화
+    memo = {}
+    for row in rows:
+        doc = _document(row, memo)
+        doc['rowid'] = row.id
+        params.append(doc)
+    if not params:
+        return
+    if replace:
+        connection.execute(text(f'DELETE FROM {FTS_TABLE} WHERE rowid = :rowid'),
+                           [{'rowid': p['rowid']} for p in params])
+    placeholders = ', '.join(f':{column}' for column in FTS_COLUMNS)
+    connection.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FTS_COLUMNS)}) VALUES (:rowid, {placeholders})"),
+        params
+    )
+
+
+def index_job(connection, job):
+    index_rows(connection, [job])
+
+
+def remove_job(connection, job_id):
+    connection.execute(text(f'DELETE FROM {FTS_TABLE} WHERE rowid = :rowid'), {'rowid': job_id})
+
+
+def _location_match(location):
+    """위치 검색어의 MATCH 식 (location 컬럼만). 단어가 없으면 ''"""
+    expression = build_match_expression(location)
+    return f'location : ({expression})' if expression else ''
+
+
+def _like_pattern(value):
+    escaped = value.strip().lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def location_condition(connection, id_column, location_column, location):
+    """
+    위치에 location이 들어 있는 공고만 남기는 SQLAlchemy 조건 (location이 비었으면 None)
+    FTS5: 위치 컬럼 MATCH (단어 단위), 그 외 DB: 대소문자 무시 부분 문자열
+    """
+    if not (location or '').strip():
+        return None
+    if is_supported(connection):
+        expression = _location_match(location)
+        if not expression:
+            return None
+        matched = text(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :location_expr') \
+            .bindparams(location_expr=expression).columns(rowid=Integer)
+        return id_column.in_(matched)
+    return location_column.icontains(location.strip(), autoescape=True)
+
+
+def search_job_ids(connection, query, location='', limit=20, offset=0):
+    """검색어(와 위치)에 맞는 채용공고 id를 관련도 순으로 반환"""
+    expression = build_match_expression(query)
+    if not expression:
+        return []
+    params = {'limit': limit, 'offset': offset}
+
+    if is_supported(connection):
+        location_expression = _location_match(location)
+        params['expr'] = f'{expression} AND {location_expression}' if location_expression else expression
+        weights = ', '.join(str(w) for w in BM25_WEIGHTS)
+        sql = (
+            f'SELECT j.id FROM {FTS_TABLE} f JOIN job_post j ON j.id = f.rowid '
+            f'WHERE {FTS_TABLE} MATCH :expr '
+            f'ORDER BY bm25({FTS_TABLE}, {weights}), j.posted_at DESC '
+            f'LIMIT :limit OFFSET :offset'
+        )
+    else:
+        # FTS5 미지원 DB: 단어별 LIKE 검색 (최신순)
+        conditions = []
+        for i, run in enumerate(_runs(query)):
+            params[f'term{i}'] = f'%{run}%'
+            conditions.append(
+                '(' + ' OR '.join(f'lower(j.{column}) LIKE :term{i}' for column in FTS_COLUMNS) + ')'
+            )
+        if (location or '').strip():
+            params['location'] = _like_pattern(location)
+            conditions.append("lower(j.location) LIKE :location ESCAPE '\\'")
+        sql = (
+            f"SELECT j.id FROM job_post j WHERE {' AND '.join(conditions)} "
+            f'ORDER BY j.posted_at DESC, j.id DESC LIMIT :limit OFFSET :offset'
+        )
+    return [row[0] for row in connection.execute(text(sql), params)]
@@ -0,0 +1,122 @@
+"""
+요청 단위 지연 로딩(N+1) 감지 (개발/테스트용)
+
+- ORM이 객체를 읽은 뒤 속성에 접근해서 추가로 실행한 SELECT를 요청마다 셈
+  - 관계 지연 로딩: 'JobPost.company' 등 관계별
+  - 컬럼 재조회: 커밋 후 만료된 객체나 deferred 컬럼을 읽을 때 '<모델> (컬럼)'
+- 같은 관계를 LAZY_LOAD_THRESHOLD번 이상 읽으면 목록을 돌며 하나씩 읽는 것(N+1)으로 보고
+  경고 로그를 남기고, LAZY_LOAD_RAISE면 LazyLoadError (테스트가 실패하도록)
+- 기본값: 디버그/테스트 모드에서만 켜짐. 꺼져 있으면 훅을 등록하지 않음
+  설정은 앱마다 (app.extensions['lazy_load_detector'])
+
+해결은 app.py의 화면별 조회 함수(list_query/list_select)에 즉시 로딩할 관계를 등록
+"""
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+
+from flask import current_app, g, has_app_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+class LazyLoadError(RuntimeError):
+    """요청 중 같은 관계를 기준 횟수 이상 지연 로딩함"""
+
+
+def _load_key(orm_execute_state):
+    """지연 로딩 SELECT면 집계 키, 아니면 None"""
+    if orm_execute_state.lazy_loaded_from is not None:
+        path = orm_execute_state.loader_strategy_path
+        return str(path[-1]) if path else orm_execute_state.lazy_loaded_from.class_.__name__
+    if orm_execute_state.is_column_load:
+        mappers = orm_execute_state.all_mappers
+        return f'{mappers[0].class_.__name__} (컬럼)' if mappers else '(컬럼)'
+    return None
+
+
+class LazyLoadDetector:
+    def __init__(self, app=None):
+        # 감시를 등록한 세션 팩토리 (프로세스 전체에서 한 번씩)
+        self._attached = set()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        # None이면 디버그/테스트 모드에서만 사용
+        app.config.setdefault('LAZY_LOAD_DETECTOR', None)
+        app.config.setdefault('LAZY_LOAD_THRESHOLD', 5)
+        app.config.setdefault('LAZY_LOAD_RAISE', None)
+        enabled = app.config['LAZY_LOAD_DETECTOR']
+        raise_errors = app.config['LAZY_LOAD_RAISE']
+        state = app.extensions['lazy_load_detector'] = {
+            'enabled': bool(app.debug or app.testing) if enabled is None else bool(enabled),
+            'threshold': app.config['LAZY_LOAD_THRESHOLD'],
+            'raise_errors': app.testing if raise_errors is None else bool(raise_errors),
+        }
+        if not state['enabled']:
+            return
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    @staticmethod
+    def _state():
+        return current_app.extensions['lazy_load_detector']
+
+    @property
+    def enabled(self):
+        return self._state()['enabled']
+
+    def attach(self, session_factory, app=None):
+        """세션(sessionmaker)의 ORM 실행 감시 (app에서 비활성화 상태면 등록하지 않음)"""
+        app = app or current_app
+        if not app.extensions['lazy_load_detector']['enabled'] or id(session_factory) in self._attached:
+            return
+        self._attached.add(id(session_factory))
+        event.listen(session_factory, 'do_orm_execute', self._executed)
+
+    @staticmethod
+    def _executed(orm_execute_state):
+        # 요청 밖(CLI, 워커 등)이나 감시 중이 아닐 때(감지기가 꺼진 앱 포함)는 세지 않음
+        if not has_app_context():
+            return
+        counts = g.get('_lazy_loads')
+        if counts is None:
+            return
+        key = _load_key(orm_execute_state)
+        if key is not None:
+            counts[key] += 1
+
+    @contextmanager
+    def track(self):
+        """with 블록 안의 지연 로딩 횟수 (Counter). 앱 컨텍스트 필요"""
+        previous = g.get('_lazy_loads')
+        counts = g._lazy_loads = Counter()
+        try:
+            yield counts
+        finally:
+            g._lazy_loads = previous
+
+    def offenders(self, counts):
+        """기준 횟수 이상 읽은 관계 {키: 횟수}"""
+        threshold = self._state()['threshold']
+        return {key: n for key, n in counts.items() if n >= threshold}
+
+    # 요청 훅
+    @staticmethod
+    def _start():
+        g._lazy_loads = Counter()
+
+    def _finish(self, response):
+        counts = g.pop('_lazy_loads', None)
+        offenders = self.offenders(counts or {})
+        if not offenders:
+            return response
+        detail = ', '.join(f'{key} {n}회' for key, n in sorted(offenders.items()))
+        message = f'N+1 의심 {request.method} {request.path}: {detail}'
+        if self._state()['raise_errors']:
+            raise LazyLoadError(message)
+        logger.warning(message)
+        return response
@@ -0,0 +1,278 @@
+"""
+요청 단위 성능 계측
+
+- 라우트(엔드포인트)별 응답 시간 히스토그램, 상태 코드별 요청 수
+- 요청마다 SQL 실행 횟수/시간 (SQLAlchemy before/after_cursor_execute 이벤트)
+- 템플릿 렌더링 시간 (Flask before_render_template/template_rendered 시그널)
+  나머지(JSON 직렬화, 파이썬 코드 등)는 전체 - SQL - 템플릿
+- SLOW_REQUEST_MS를 넘는 요청은 느린 쿼리와 함께 로그로 남기고 최근 목록에 보관
+- Prometheus 텍스트 형식 출력 (render_prometheus)
+
+METRICS_ENABLED가 꺼져 있으면 훅을 하나도 등록하지 않음 (요청당 비용 없음).
+값은 워커 프로세스마다, 앱마다 따로 집계됨 (app.extensions['request_metrics']).
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+
+from flask import before_render_template, current_app, g, has_request_context, request, template_rendered
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# 응답 시간 히스토그램 구간 상한 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 느린 요청 기록에 남길 쿼리 수 (오래 걸린 순)
+SLOW_QUERIES_KEPT = 10
+STATEMENT_PREVIEW = 500
+
+
+class RouteStats:
+    __slots__ = ('buckets', 'count', 'total', 'sql_count', 'sql_time', 'template_time', 'statuses')
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.statuses = {}
+
+    def observe(self, elapsed, sql_count, sql_time, template_time, status):
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self.count += 1
+        self.total += elapsed
+        self.sql_count += sql_count
+        self.sql_time += sql_time
+        self.template_time += template_time
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def quantile(self, q):
+        """히스토그램으로 추정한 분위수 (해당 구간 상한)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for upper, n in zip(LATENCY_BUCKETS + (float('inf'),), self.buckets):
+            seen += n
+            if seen >= rank:
+                return upper
+        return float('inf')
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + '}'
+
+
+class RequestMetrics:
+    def __init__(self, app=None):
+        # 수집 함수는 코드에서 한 번 등록하고 모든 앱이 함께 사용
+        self._collectors = []
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('METRICS_ENABLED', True)
+        app.config.setdefault('SLOW_REQUEST_MS', 500)
+        app.config.setdefault('SLOW_REQUESTS_KEPT', 50)
+        # 설정하면 /metrics는 'Authorization: Bearer <토큰>'으로도 접근 가능 (Prometheus 수집용)
+        app.config.setdefault('METRICS_TOKEN', None)
+        enabled = bool(app.config['METRICS_ENABLED'])
+        app.extensions['request_metrics'] = {
+            'enabled': enabled,
+            'slow_request_seconds': app.config['SLOW_REQUEST_MS'] / 1000,
+            'routes': {},
+            'slow_requests': deque(maxlen=app.config['SLOW_REQUESTS_KEPT']),
+            'lock': threading.Lock(),
+        }
+        if not enabled:
+            return
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        before_render_template.connect(self._template_started, app)
+        template_rendered.connect(self._template_finished, app)
+
+    @staticmethod
+    def _state():
+        return current_app.extensions['request_metrics']
+
+    @property
+    def enabled(self):
+        return self._state()['enabled']
+
+    def attach(self, engine, app=None):
+        """엔진의 SQL 실행 시간 집계 (app에서 비활성화 상태면 등록하지 않음)"""
+        app = app or current_app
+        if not app.extensions['request_metrics']['enabled'] \
+                or event.contains(engine, 'before_cursor_execute', self._query_started):
+            return
+        event.listen(engine, 'before_cursor_execute', self._query_started)
+        event.listen(engine, 'after_cursor_execute', self._query_finished)
+
+    def add_collector(self, collector):
+        """collector() -> [(이름, 종류, 도움말, [(라벨 dict, 값)])] : /metrics에 함께 출력"""
+        self._collectors.append(collector)
+
+    # 요청 훅
+    @staticmethod
+    def _start():
+        g._metrics = {'started': time.perf_counter(), 'sql_count': 0, 'sql_time': 0.0,
+                      'queries': [], 'template_time': 0.0, 'template_started': None}
+
+    def _finish(self, response):
+        state = g.pop('_metrics', None)
+        if state is None:
+            return response
+        elapsed = time.perf_counter() - state['started']
+        endpoint = request.endpoint or '<unmatched>'
+        app_state = self._state()
+        with app_state['lock']:
+            routes = app_state['routes']
+            stats = routes.get((endpoint, request.method))
+            if stats is None:
+                stats = routes[(endpoint, request.method)] = RouteStats()
+            stats.observe(elapsed, state['sql_count'], state['sql_time'], state['template_time'],
+                          response.status_code)
+        if elapsed >= app_state['slow_request_seconds']:
+            self._record_slow(endpoint, elapsed, state, response.status_code)
+        return response
+
+    def _record_slow(self, endpoint, elapsed, state, status):
+        queries = sorted(state['queries'], key=lambda q: q[1], reverse=True)[:SLOW_QUERIES_KEPT]
+        entry = {
+            'at': time.time(),
+            'endpoint': endpoint,
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'status': status,
+            'seconds': elapsed,
+            'sql_count': state['sql_count'],
+            'sql_seconds': state['sql_time'],
+            'template_seconds': state['template_time'],
+            # 공백 정리와 자르기는 느린 요청일 때만
+            'queries': [{'statement': ' '.join(statement.split())[:STATEMENT_PREVIEW], 'seconds': seconds}
+                        for statement, seconds in queries],
+        }
+        app_state = self._state()
+        with app_state['lock']:
+            app_state['slow_requests'].append(entry)
+        logger.warning(
+            '느린 요청 %s %s %.0fms (SQL %d건 %.0fms, 템플릿 %.0fms)%s',
+            entry['method'], entry['path'], elapsed * 1000, state['sql_count'], state['sql_time'] * 1000,
+            state['template_time'] * 1000,
+            ''.join(f'\n  {q["seconds"] * 1000:.1f}ms {q["statement"]}' for q in entry['queries'])
+        )
+
+    # SQL 이벤트 (요청 밖에서 실행된 쿼리는 세지 않음)
+    @staticmethod
+    def _query_started(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            conn.info.setdefault('_metrics_started', []).append(time.perf_counter())
+
+    @staticmethod
+    def _query_finished(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get('_metrics_started')
+        if not started or not has_request_context():
+            return
+        elapsed = time.perf_counter() - started.pop()
+        state = g.get('_metrics')
+        if state is None:
+            return
+        state['sql_count'] += 1
+        state['sql_time'] += elapsed
+        state['queries'].append((statement, elapsed))
+
+    # 템플릿 시그널
+    @staticmethod
+    def _template_started(sender, template, context, **extra):
+        state = g.get('_metrics')
+        if state is not None and state['template_started'] is None:
+            state['template_started'] = time.perf_counter()
+
+    @staticmethod
+    def _template_finished(sender, template, context, **extra):
+        state = g.get('_metrics')
+        if state is not None and state['template_started'] is not None:
+            state['template_time'] += time.perf_counter() - state['template_started']
+            state['template_started'] = None
+
+    # 조회
+    def route_summary(self):
+        """관리자 화면용 라우트별 요약 (평균/분위수는 ms)"""
+        state = self._state()
+        with state['lock']:
+            items = [(key, stats) for key, stats in state['routes'].items()]
+            rows = []
+            for (endpoint, method), stats in items:
+                count = stats.count or 1
+                rows.append({
+                    'endpoint': endpoint,
+                    'method': method,
+                    'count': stats.count,
+                    'avg_ms': stats.total / count * 1000,
+                    'p50_ms': stats.quantile(0.5) * 1000,
+                    'p95_ms': stats.quantile(0.95) * 1000,
+                    'sql_per_request': stats.sql_count / count,
+                    'sql_ms': stats.sql_time / count * 1000,
+                    'template_ms': stats.template_time / count * 1000,
+                    'other_ms': max(stats.total - stats.sql_time - stats.template_time, 0) / count * 1000,
+                    'errors': sum(n for status, n in stats.statuses.items() if status >= 500),
+                })
+        rows.sort(key=lambda row: row['avg_ms'] * row['count'], reverse=True)
+        return rows
+
+    def recent_slow_requests(self):
+        state = self._state()
+        with state['lock']:
+            return list(reversed(state['slow_requests']))
+
+    def render_prometheus(self):
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+
+        state = self._state()
+        with state['lock']:
+            routes = sorted(state['routes'].items())
+            family('capsa_request_duration_seconds', 'histogram', '라우트별 응답 시간')
+            for (endpoint, method), stats in routes:
+                cumulative = 0
+                for upper, n in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += n
+                    lines.append('capsa_request_duration_seconds_bucket'
+                                 f'{_labels(endpoint=endpoint, method=method, le=upper)} {cumulative}')
+                lines.append('capsa_request_duration_seconds_bucket'
+                             f'{_labels(endpoint=endpoint, method=method, le="+Inf")} {stats.count}')
+                lines.append(f'capsa_request_duration_seconds_sum{_labels(endpoint=endpoint, method=method)} '
+                             f'{stats.total:.6f}')
+                lines.append(f'capsa_request_duration_seconds_count{_labels(endpoint=endpoint, method=method)} '
+                             f'{stats.count}')
+            family('capsa_requests_total', 'counter', '라우트/상태 코드별 요청 수')
+            for (endpoint, method), stats in routes:
+                for status, n in sorted(stats.statuses.items()):
+                    lines.append(f'capsa_requests_total{_labels(endpoint=endpoint, method=method, status=status)} {n}')
+            for name, attr, help_text in (
+                ('capsa_request_sql_queries_total', 'sql_count', '요청 중 실행한 SQL 수'),
+                ('capsa_request_sql_seconds_total', 'sql_time', '요청 중 SQL 실행 시간'),
+                ('capsa_request_template_seconds_total', 'template_time', '템플릿 렌더링 시간'),
+            ):
+                family(name, 'counter', help_text)
+                for (endpoint, method), stats in routes:
+                    lines.append(f'{name}{_labels(endpoint=endpoint, method=method)} {getattr(stats, attr)}')
+
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                family(name, kind, help_text)
+                for labels, value in samples:
+                    lines.append(f'{name}{_labels(**labels) if labels else ""} {value}')
+        return '\n'.join(lines) + '\n'
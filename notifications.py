@@ -0,0 +1,302 @@
+"""
+관리자 알림 발송 파이프라인 (outbox 패턴)
+
+- 요청 처리 중에는 outbox 테이블에 메시지를 같은 트랜잭션으로 적재만 함
+- 백그라운드 워커가 발송 시각이 된 메시지를 임대(lease) 방식으로 가져가
+  수신자별로 묶어(다이제스트) 스레드 풀에서 발송
+- 실패 시 지수 백오프로 재시도, 최대 횟수를 넘기면 failed로 남김
+- 메일 백엔드: SMTPMailer(실서버), MemoryMailer(테스트용 로컬 대체), LogMailer(기본)
+- 메일 백엔드와 워커 스레드는 앱마다 (app.extensions['notifications'])
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = 'pending'
+STATUS_SENDING = 'sending'
+STATUS_SENT = 'sent'
+STATUS_FAILED = 'failed'
+
+
+# 메일 백엔드
+class SMTPMailer:
+    def __init__(self, host, port=587, username=None, password=None, use_tls=True,
+                 sender='noreply@capsa.local', timeout=10):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.sender = sender
+        self.timeout = timeout
+
+    def send(self, recipient, subject, body):
+        message = EmailMessage()
+        message['From'] = self.sender
+        message['To'] = recipient
+        message['Subject'] = subject
+        message.set_content(body)
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            smtp.send_message(message)
+
+
+class MemoryMailer:
+    """발송 내용을 메모리에 기록하는 로컬 SMTP 대체 (테스트용)"""
+
+    def __init__(self, delay=0.0, fail_times=0):
+        self.delay = delay
+        self.fail_times = fail_times
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def send(self, recipient, subject, body):
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise smtplib.SMTPServerDisconnected('simulated failure')
+            self.sent.append({'recipient': recipient, 'subject': subject, 'body': body})
+
+
+class LogMailer:
+    """메일 서버 설정이 없을 때 로그로만 남김"""
+
+    def send(self, recipient, subject, body):
+        logger.info('[알림] %s -> %s', subject, recipient)
+
+
+def mailer_from_config(config):
+    if config.get('MAIL_BACKEND') == 'memory':
+        return MemoryMailer()
+    if config.get('SMTP_HOST'):
+        return SMTPMailer(
+            config['SMTP_HOST'],
+            port=int(config.get('SMTP_PORT', 587)),
+            username=config.get('SMTP_USERNAME'),
+            password=config.get('SMTP_PASSWORD'),
+            use_tls=config.get('SMTP_USE_TLS', True),
+            sender=config.get('MAIL_SENDER', 'noreply@capsa.local'),
+        )
+    return LogMailer()
+
+
+def stakeholder_request_message(request_obj):
+    """새 전문가 연결 요청 알림 (subject, body)"""
+    # 제목은 메일 헤더이므로 사용자가 입력한 이름의 줄바꿈/연속 공백을 한 칸으로
+    name = ' '.join(str(request_obj.name or '').split())
+    subject = f'[CAPSA] 새로운 전문가 연결 요청: {name}'
+    body = (
+        f'이름: {request_obj.name}\n'
+        f'이메일: {request_obj.email}\n'
+        f'회사/직책: {request_obj.company} / {request_obj.role}\n'
+        f'도움 유형: {request_obj.help_type}\n\n'
+        f'{request_obj.description}\n'
+    )
+    return subject, body
+
+
+def digest_message(messages):
+    """같은 수신자에게 갈 여러 메시지를 한 통의 다이제스트로 합침"""
+    if len(messages) == 1:
+        return messages[0].subject, messages[0].body
+    subject = f'[CAPSA] 새 알림 {len(messages)}건'
+    sections = [f'■ {message.subject}\n{message.body}' for message in messages]
+    return subject, ('\n' + '-' * 40 + '\n').join(sections)
+
+
+class NotificationQueue:
+    """
+    outbox 적재와 백그라운드 발송 워커
+
+    model은 recipient/subject/body/status/attempts/next_attempt_at/
+    last_error/sent_at 컬럼을 가진 SQLAlchemy 모델.
+    """
+
+    def __init__(self, db, model, app=None):
+        self.db = db
+        self.model = model
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('NOTIFY_ADMIN_EMAIL', 'admin@capsa.local')
+        # 'thread': 웹 프로세스 안에서 발송, 'off': 적재만 하고 별도 워커(flask notifications-worker)가 발송
+        app.config.setdefault('NOTIFY_WORKER', 'thread')
+        app.config.setdefault('NOTIFY_POOL_SIZE', 4)
+        app.config.setdefault('NOTIFY_BATCH_SIZE', 50)
+        app.config.setdefault('NOTIFY_POLL_INTERVAL', 5.0)
+        app.config.setdefault('NOTIFY_MAX_ATTEMPTS', 5)
+        app.config.setdefault('NOTIFY_BACKOFF_BASE', 30)
+        app.config.setdefault('NOTIFY_BACKOFF_MAX', 3600)
+        # 발송 중 상태로 이 시간이 지나면 워커가 죽은 것으로 보고 다시 가져감
+        app.config.setdefault('NOTIFY_LEASE_SECONDS', 300)
+        app.extensions['notifications'] = {
+            'mailer': mailer_from_config(app.config),
+            'wakeup': threading.Event(),
+            'stop': threading.Event(),
+            'thread': None,
+            'thread_lock': threading.Lock(),
+        }
+        if app.config['NOTIFY_WORKER'] == 'thread':
+            # 첫 요청 때 워커 시작 (이전에 쌓인 메시지도 발송).
+            # fork된 워커 프로세스에서는 부모의 스레드가 없으므로 그 프로세스의 첫 요청에서 다시 시작
+            app.before_request(self._ensure_worker)
+
+    @staticmethod
+    def _app(app=None):
+        """워커 스레드에 넘길 실제 앱 객체 (없으면 현재 앱)"""
+        return app or current_app._get_current_object()
+
+    def mailer(self, app=None):
+        return self._app(app).extensions['notifications']['mailer']
+
+    # 적재
+    def enqueue(self, recipient, subject, body):
+        """현재 세션에 outbox 메시지 추가 (커밋은 호출한 쪽 트랜잭션에서)"""
+        message = self.model(recipient=recipient, subject=subject, body=body,
+                             status=STATUS_PENDING, attempts=0,
+                             next_attempt_at=datetime.utcnow())
+        self.db.session.add(message)
+        return message
+
+    def notify_admin(self, subject, body):
+        return self.enqueue(current_app.config['NOTIFY_ADMIN_EMAIL'], subject, body)
+
+    def wake(self):
+        """커밋 후 호출: 워커를 깨움 (필요하면 스레드 시작)"""
+        if current_app.config['NOTIFY_WORKER'] != 'thread':
+            return
+        self.start()
+        current_app.extensions['notifications']['wakeup'].set()
+
+    # 워커
+    def _ensure_worker(self):
+        thread = current_app.extensions['notifications']['thread']
+        if thread is None or not thread.is_alive():
+            self.start()
+
+    def start(self, app=None):
+        app = self._app(app)
+        state = app.extensions['notifications']
+        with state['thread_lock']:
+            if state['thread'] is not None and state['thread'].is_alive():
+                return
+            state['stop'].clear()
+            state['thread'] = threading.Thread(target=self.run_forever, args=(app,), name='notification-worker',
+                                               daemon=True)
+            state['thread'].start()
+
+    def stop(self, timeout=5, app=None):
+        state = self._app(app).extensions['notifications']
+        state['stop'].set()
+        state['wakeup'].set()
+        if state['thread'] is not None:
+            state['thread'].join(timeout)
+
+    def run_forever(self, app=None):
+        app = self._app(app)
+        state = app.extensions['notifications']
+        interval = app.config['NOTIFY_POLL_INTERVAL']
+        with ThreadPoolExecutor(max_workers=app.config['NOTIFY_POOL_SIZE']) as pool:
+            while not state['stop'].is_set():
+                try:
+                    processed = self.process_due(pool, app)
+                except Exception:
+                    logger.exception('알림 발송 처리 중 오류')
+                    processed = 0
+                if not processed:
+                    state['wakeup'].wait(interval)
+                    state['wakeup'].clear()
+
+    def drain(self, app=None):
+        """발송 가능한 메시지를 모두 동기적으로 처리 (테스트/CLI용)"""
+        app = self._app(app)
+        total = 0
+        with ThreadPoolExecutor(max_workers=app.config['NOTIFY_POOL_SIZE']) as pool:
+            while True:
+                processed = self.process_due(pool, app)
+                if not processed:
+                    return total
+                total += processed
+
+    def _claim(self):
+        """발송 시각이 된 메시지를 임대 표시 후 반환 (여러 워커가 같은 행을 가져가지 않게)"""
+        model = self.model
+        config = current_app.config
+        now = datetime.utcnow()
+        lease_until = now + timedelta(seconds=config['NOTIFY_LEASE_SECONDS'])
+        candidates = self.db.session.execute(
+            self.db.select(model.id)
+            .where(model.status.in_((STATUS_PENDING, STATUS_SENDING)), model.next_attempt_at <= now)
+            .order_by(model.next_attempt_at, model.id)
+            .limit(config['NOTIFY_BATCH_SIZE'])
+        ).scalars().all()
+        claimed = []
+        for message_id in candidates:
+            result = self.db.session.execute(
+                self.db.update(model)
+                .where(model.id == message_id, model.next_attempt_at <= now,
+                       model.status.in_((STATUS_PENDING, STATUS_SENDING)))
+                .values(status=STATUS_SENDING, next_attempt_at=lease_until)
+            )
+            if result.rowcount:
+                claimed.append(message_id)
+        self.db.session.commit()
+        if not claimed:
+            return []
+        return self.db.session.execute(
+            self.db.select(model).where(model.id.in_(claimed)).order_by(model.id)
+        ).scalars().all()
+
+    def process_due(self, pool, app=None):
+        app = self._app(app)
+        with app.app_context():
+            messages = self._claim()
+            if not messages:
+                return 0
+            by_recipient = {}
+            for message in messages:
+                by_recipient.setdefault(message.recipient, []).append(message)
+
+            futures = {}
+            for recipient, group in by_recipient.items():
+                subject, body = digest_message(group)
+                futures[recipient] = pool.submit(self.mailer(app).send, recipient, subject, body)
+
+            now = datetime.utcnow()
+            config = app.config
+            for recipient, future in futures.items():
+                error = future.exception()
+                for message in by_recipient[recipient]:
+                    message.attempts += 1
+                    if error is None:
+                        message.status = STATUS_SENT
+                        message.sent_at = now
+                        message.last_error = None
+                    elif message.attempts >= config['NOTIFY_MAX_ATTEMPTS']:
+                        message.status = STATUS_FAILED
+                        message.last_error = repr(error)[:500]
+                    else:
+                        delay = min(config['NOTIFY_BACKOFF_BASE'] * 2 ** (message.attempts - 1),
+                                    config['NOTIFY_BACKOFF_MAX'])
+                        message.status = STATUS_PENDING
+                        message.next_attempt_at = now + timedelta(seconds=delay)
+                        message.last_error = repr(error)[:500]
+                if error is not None:
+                    logger.warning('알림 발송 실패 (%s): %r', recipient, error)
+            self.db.session.commit()
+            return len(messages)
@@ -0,0 +1,307 @@
+"""
+공개 페이지 렌더링 결과 캐시
+
+- 키: 라우트 경로 + 뷰가 사용하는 쿼리 인자만 (cached(..., params=)). 모르는 인자를
+  바꿔 가며 요청해도 항목이 늘어나지 않음
+- 백엔드: 디스크(기본, 여러 워커/CLI가 공유) 또는 프로세스 내 LRU. 둘 다 항목 수/바이트 상한
+- 응답에 ETag/Last-Modified를 붙이고 조건부 요청에는 304로 응답
+- 항목마다 태그('jobs', 'announcements')를 달고, 관리자 쓰기 라우트가 해당 태그만 무효화
+- 관리자 세션이나 flash 메시지가 있는 요청은 캐시하지 않음 (사용자별 화면)
+- 백엔드는 앱마다 (app.extensions['page_cache'])
+
+무효화 범위: 디스크 백엔드는 같은 PAGE_CACHE_DIR(기본: 인스턴스 폴더의 page_cache)을 쓰는
+모든 프로세스에 적용됨 (gunicorn 워커, flask import-jobs 등 CLI). 서버가 여러 대면 공유
+디렉터리를 지정해야 함. 'memory' 백엔드는 무효화가 그 프로세스에만 적용되므로 워커가
+하나일 때만 정확하고, 다른 워커는 PAGE_CACHE_MAX_AGE(기본 30초)가 지나야 새 내용을 보여 줌.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import current_app, make_response, request, session
+
+
+class LRUCache:
+    """항목 수와 총 바이트 수로 크기가 제한되는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries=512, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def tag_versions(self, tags):
+        with self._lock:
+            return {tag: self._versions.get(tag, 0) for tag in tags}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, versions):
+        size = len(entry['body'])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            # 렌더링 도중 무효화되었다면 저장하지 않음
+            if any(self._versions.get(tag, 0) != version for tag, version in versions.items()):
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old['body'])
+            self._entries[key] = entry
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted['body'])
+
+    def invalidate(self, tags):
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+            stale = [key for key, entry in self._entries.items() if entry['tags'] & tags]
+            for key in stale:
+                self._size -= len(self._entries.pop(key)['body'])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskCache:
+    """
+    항목별 pickle 파일로 저장하는 캐시 (여러 워커가 공유)
+
+    태그마다 버전 파일(tags/<tag>)을 두고, 항목에는 저장 시점의 태그 버전을 기록.
+    무효화는 버전 파일만 갱신하므로 항목 수와 무관하게 O(태그 수).
+    버전이 지난 항목은 읽을 때 삭제.
+
+    크기 제한: 읽을 때 파일 mtime을 갱신하고, 이 프로세스에서 max_entries / PRUNE_RATIO번
+    저장할 때마다 디렉터리를 훑어 mtime이 오래된 항목부터 지움 (여러 프로세스 사이의 LRU 근사)
+    """
+
+    PRUNE_RATIO = 10
+
+    def __init__(self, directory, max_entries=512, max_bytes=32 * 1024 * 1024):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._tag_dir = os.path.join(directory, 'tags')
+        self._writes = 0
+        self._lock = threading.Lock()
+        os.makedirs(self._tag_dir, exist_ok=True)
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.pickle')
+
+    def _read_version(self, tag):
+        try:
+            with open(os.path.join(self._tag_dir, tag), 'r') as f:
+                return int(f.read() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _atomic_write(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def tag_versions(self, tags):
+        return {tag: self._read_version(tag) for tag in tags}
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def get(self, key):
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if entry['versions'] != self.tag_versions(entry['tags']):
+            # 무효화된 항목. 그 사이 다른 워커가 새로 저장했다면 한 번 더 MISS가 날 뿐
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def set(self, key, entry, versions):
+        if len(entry['body']) > self.max_bytes or versions != self.tag_versions(versions):
+            return
+        entry = dict(entry, versions=versions)
+        self._atomic_write(self._entry_path(key), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._writes += 1
+            due = self._writes >= max(1, self.max_entries // self.PRUNE_RATIO)
+            if due:
+                self._writes = 0
+        if due:
+            self.prune()
+
+    def prune(self):
+        """항목 수/바이트 상한을 넘으면 mtime이 오래된 항목부터 삭제"""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for dir_entry in it:
+                if not dir_entry.name.endswith('.pickle'):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, dir_entry.path))
+        count = len(entries)
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            self._remove(path)
+            count -= 1
+            total -= size
+
+    def invalidate(self, tags):
+        for tag in tags:
+            # 워커 간 경합에도 겹치지 않도록 증가값 대신 시각(ns)을 버전으로 사용
+            self._atomic_write(os.path.join(self._tag_dir, tag), str(time.time_ns()).encode('ascii'))
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.pickle'):
+                self._remove(os.path.join(self.directory, name))
+
+
+class PageCache:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PAGE_CACHE_ENABLED', True)
+        app.config.setdefault('PAGE_CACHE_MAX_ENTRIES', 512)
+        app.config.setdefault('PAGE_CACHE_MAX_BYTES', 32 * 1024 * 1024)
+        # 'disk': 프로세스 간 공유 (무효화가 모든 워커/CLI에 적용), 'memory': 단일 프로세스용
+        app.config.setdefault('PAGE_CACHE_BACKEND', os.environ.get('CAPSA_PAGE_CACHE_BACKEND', 'disk'))
+        app.config.setdefault('PAGE_CACHE_DIR', os.environ.get('CAPSA_PAGE_CACHE_DIR')
+                              or os.path.join(app.instance_path, 'page_cache'))
+        # 0이면 무효화 전까지 유지. memory 백엔드는 다른 워커의 무효화를 모르므로 최대 지연 시간(초)
+        app.config.setdefault('PAGE_CACHE_MAX_AGE', 0 if app.config['PAGE_CACHE_BACKEND'] == 'disk' else 30)
+
+        if not app.config['PAGE_CACHE_ENABLED']:
+            backend = None
+        elif app.config['PAGE_CACHE_BACKEND'] == 'disk':
+            backend = DiskCache(app.config['PAGE_CACHE_DIR'], app.config['PAGE_CACHE_MAX_ENTRIES'],
+                                app.config['PAGE_CACHE_MAX_BYTES'])
+        elif app.config['PAGE_CACHE_BACKEND'] == 'memory':
+            backend = LRUCache(app.config['PAGE_CACHE_MAX_ENTRIES'], app.config['PAGE_CACHE_MAX_BYTES'])
+        else:
+            raise ValueError(f"PAGE_CACHE_BACKEND는 'disk' 또는 'memory': {app.config['PAGE_CACHE_BACKEND']}")
+        app.extensions['page_cache'] = {'backend': backend, 'max_age': app.config['PAGE_CACHE_MAX_AGE']}
+
+    @property
+    def backend(self):
+        """현재 앱의 백엔드 (캐시가 꺼져 있으면 None)"""
+        return current_app.extensions['page_cache']['backend']
+
+    @staticmethod
+    def make_key(params=None):
+        """경로 + 쿼리 인자. params가 주어지면 그 인자의 첫 값만 (뷰가 request.args.get으로 읽는 값)"""
+        if params is None:
+            args = sorted(request.args.items(multi=True))
+        else:
+            args = [(name, request.args[name]) for name in sorted(params) if request.args.get(name)]
+        return request.path + ('?' + urlencode(args) if args else '')
+
+    @staticmethod
+    def _is_cacheable_request():
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        # 관리자 화면/flash 메시지는 사용자마다 다르므로 캐시하지 않음
+        return not session.get('admin') and not session.get('_flashes')
+
+    @staticmethod
+    def _is_fresh(entry):
+        max_age = current_app.extensions['page_cache']['max_age']
+        return not max_age or time.time() - entry['stored_at'] < max_age
+
+    def cached(self, *tags, params=()):
+        """
+        뷰 응답을 태그와 함께 캐시하는 데코레이터
+        params: 뷰가 읽는 쿼리 인자 이름 (나머지 인자는 키에 넣지 않음)
+        """
+        tag_set = frozenset(tags)
+        params = frozenset(params)
+
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                backend = self.backend
+                if backend is None or not self._is_cacheable_request():
+                    return view(*args, **kwargs)
+
+                key = self.make_key(params)
+                entry = backend.get(key)
+                if entry is not None and self._is_fresh(entry):
+                    return self._respond(entry, 'HIT')
+
+                versions = backend.tag_versions(tag_set)
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+                body = response.get_data()
+                entry = {
+                    'body': body,
+                    'content_type': response.content_type,
+                    'etag': hashlib.sha1(body).hexdigest(),
+                    'last_modified': datetime.now(timezone.utc).replace(microsecond=0),
+                    'stored_at': time.time(),
+                    'tags': tag_set,
+                }
+                backend.set(key, entry, versions)
+                return self._respond(entry, 'MISS')
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def _respond(entry, status):
+        response = make_response(entry['body'])
+        response.content_type = entry['content_type']
+        response.set_etag(entry['etag'])
+        response.last_modified = entry['last_modified']
+        # 브라우저는 매번 재검증하고, 변경이 없으면 304만 받음
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Cache'] = status
+        return response.make_conditional(request)
+
+    def invalidate(self, *tags):
+        backend = self.backend
+        if backend is not None:
+            backend.invalidate(set(tags))
+
+    def clear(self):
+        backend = self.backend
+        if backend is not None:
+            backend.clear()
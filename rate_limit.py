@@ -0,0 +1,137 @@
+"""
+관리자 로그인 시도 제한 (프로세스 내 메모리, DB 조회 전에 판단)
+
+- IP별: 모든 로그인 시도를 LOGIN_IP_WINDOW초 동안 LOGIN_IP_LIMIT회까지
+- 사용자 이름별: 실패한 시도를 LOGIN_USER_WINDOW초 동안 LOGIN_USER_LIMIT회까지
+  (성공하면 초기화)
+- 제한은 슬라이딩 윈도우 (키마다 최근 시각 목록, 한도 이상은 저장하지 않음)
+- 키 수는 LOGIN_MAX_KEYS로 상한. 넘치면 가장 오래 안 쓴 키부터 버림
+
+워커 프로세스마다 따로 세므로 실제 한도는 (한도 x 워커 수). 목적은 DB/해시 계산을
+보호하는 것이고, 여러 서버 간 정확한 제한이 필요하면 공유 저장소를 써야 함.
+카운터는 앱마다 따로 (app.extensions['login_rate_limiter'])
+"""
+
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+
+from flask import current_app
+
+
+class SlidingWindowLimiter:
+    def __init__(self, limit, window, max_keys=100000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._hits = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._hits)
+
+    def _prune(self, key, now):
+        hits = self._hits.get(key)
+        if hits is None:
+            return None
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+        if not hits:
+            del self._hits[key]
+            return None
+        return hits
+
+    def retry_after(self, key, now=None):
+        """한도를 넘었으면 다시 시도할 수 있을 때까지 남은 초, 아니면 0"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            hits = self._prune(key, now)
+            if hits is None or len(hits) < self.limit:
+                return 0
+            return max(hits[0] + self.window - now, 0.001)
+
+    def hit(self, key, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            hits = self._prune(key, now)
+            if hits is None:
+                hits = self._hits[key] = deque(maxlen=self.limit)
+                while len(self._hits) > self.max_keys:
+                    self._hits.popitem(last=False)
+            else:
+                self._hits.move_to_end(key)
+            hits.append(now)
+
+    def reset(self, key):
+        with self._lock:
+            self._hits.pop(key, None)
+
+
+class LoginRateLimiter:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('LOGIN_IP_LIMIT', 20)
+        app.config.setdefault('LOGIN_IP_WINDOW', 300)
+        app.config.setdefault('LOGIN_USER_LIMIT', 5)
+        app.config.setdefault('LOGIN_USER_WINDOW', 300)
+        app.config.setdefault('LOGIN_MAX_KEYS', 100000)
+        max_keys = app.config['LOGIN_MAX_KEYS']
+        app.extensions['login_rate_limiter'] = {
+            'by_ip': SlidingWindowLimiter(app.config['LOGIN_IP_LIMIT'], app.config['LOGIN_IP_WINDOW'], max_keys),
+            'by_user': SlidingWindowLimiter(app.config['LOGIN_USER_LIMIT'], app.config['LOGIN_USER_WINDOW'],
+                                            max_keys),
+            'metrics': Counter(),
+            'metrics_lock': threading.Lock(),
+        }
+
+    @staticmethod
+    def _state():
+        return current_app.extensions['login_rate_limiter']
+
+    @staticmethod
+    def _user_key(username):
+        return (username or '').strip().lower()[:80]
+
+    def _count(self, name):
+        state = self._state()
+        with state['metrics_lock']:
+            state['metrics'][name] += 1
+
+    def check(self, ip, username):
+        """
+        시도 허용 여부. 허용이면 0 (IP 시도 횟수에 포함), 거부면 재시도까지 남은 초
+        DB 조회/비밀번호 해시 계산 전에 호출
+        """
+        state = self._state()
+        retry_after = state['by_ip'].retry_after(ip)
+        if retry_after:
+            self._count('rejected_ip')
+            return retry_after
+        retry_after = state['by_user'].retry_after(self._user_key(username))
+        if retry_after:
+            self._count('rejected_user')
+            return retry_after
+        state['by_ip'].hit(ip)
+        return 0
+
+    def record_failure(self, ip, username):
+        self._count('failed')
+        self._state()['by_user'].hit(self._user_key(username))
+
+    def record_success(self, ip, username):
+        self._count('succeeded')
+        self._state()['by_user'].reset(self._user_key(username))
+
+    def snapshot(self):
+        """지표 사본 (관리자 API/모니터링용)"""
+        state = self._state()
+        with state['metrics_lock']:
+            metrics = dict(state['metrics'])
+        for name in ('rejected_ip', 'rejected_user', 'failed', 'succeeded'):
+            metrics.setdefault(name, 0)
+        metrics['tracked_ips'] = len(state['by_ip'])
+        metrics['tracked_users'] = len(state['by_user'])
+        return metrics
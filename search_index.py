@@ -0,0 +1,181 @@
+"""
+정적 사이트(docs/jobs.html)용 채용공고 검색 색인
+
+- 토큰화는 job_search.tokenize와 같음 (한글 2-gram, 그 외 소문자 단어)
+- 용어 -> 문서 번호(목록 순서) 역색인을 용어 접두어 기준으로 샤딩해서
+  search/terms-<접두어>.<해시>.json 으로 저장 (페이지는 검색어에 필요한 샤드만 가져감)
+  첫 글자로 나눈 샤드가 MAX_SHARD_BYTES를 넘으면 한 글자 더 긴 접두어로 다시 나눔
+  (MAX_PREFIX_LENGTH까지). 나눈 접두어와 같은 용어는 그 접두어 샤드에 남음
+- 지역/고용형태 필터는 문서 번호 비트맵(base64)으로 저장해서 AND 연산으로 적용
+- 검색 결과 표시용 문서 요약은 DOCS_PER_CHUNK개씩 나눠 저장
+- search/meta.json 에 샤드/청크 파일 이름과 필터 값 목록을 둠 (이 파일만 매번 재검증)
+
+용어가 들어 있는 샤드는 meta.json의 샤드 접두어 중 그 용어의 가장 긴 접두어.
+static/js/job-search.js의 shardFor()와 반드시 같아야 함.
+"""
+
+import base64
+import json
+import re
+from collections import defaultdict
+
+from job_search import FTS_COLUMNS, tokenize
+
+INDEX_VERSION = 2
+INDEX_DIR = 'search'
+DOCS_PER_CHUNK = 500
+SNIPPET_LENGTH = 120
+# 샤드 하나의 JSON 크기 상한 (자주 나오는 용어 하나가 이보다 크면 그 샤드만 넘을 수 있음)
+MAX_SHARD_BYTES = 64 * 1024
+MAX_PREFIX_LENGTH = 8
+
+_ASCII_ALNUM_RE = re.compile(r'[a-z0-9]')
+_HANGUL_RE = re.compile(r'[가-힣]')
+
+
+def shard_terms(postings, max_bytes=MAX_SHARD_BYTES):
+    """{용어: 값} -> {접두어: {용어: 값}}. 큰 샤드는 한 글자 더 긴 접두어로 나눔"""
+    groups = defaultdict(dict)
+    for term, value in postings.items():
+        groups[term[:1]][term] = value
+    shards = {}
+    pending = list(groups.items())
+    while pending:
+        prefix, terms = pending.pop()
+        if len(prefix) >= MAX_PREFIX_LENGTH or len(terms) < 2 or len(_dumps(terms)) <= max_bytes:
+            shards[prefix] = terms
+            continue
+        children = defaultdict(dict)
+        for term, value in terms.items():
+            if term == prefix:
+                shards[prefix] = {term: value}
+            else:
+                children[term[:len(prefix) + 1]][term] = value
+        pending.extend(children.items())
+    return shards
+
+
+def shard_for(term, prefixes):
+    """term이 들어 있을 샤드 접두어 (term의 가장 긴 접두어, 없으면 None)"""
+    for length in range(min(len(term), MAX_PREFIX_LENGTH), 0, -1):
+        if term[:length] in prefixes:
+            return term[:length]
+    return None
+
+
+def _shard_stem(prefix):
+    """파일 이름용: 영문/숫자는 그대로, 그 외 글자는 '_' + 16진수 코드포인트"""
+    return ''.join(char if _ASCII_ALNUM_RE.match(char) else '_%x' % ord(char) for char in prefix)
+
+
+def location_facet(location):
+    """필터용 지역 값: 쉼표 앞부분, 한국 주소는 첫 단어 ('서울 강남구' -> '서울')"""
+    head = (location or '').split(',')[0].strip()
+    if _HANGUL_RE.search(head):
+        head = head.split()[0]
+    return ' '.join(head.split())
+
+
+def encode_postings(ordinals):
+    """정렬된 문서 번호 목록을 차이값으로 저장 (JSON 크기 절감)"""
+    previous = 0
+    deltas = []
+    for ordinal in ordinals:
+        deltas.append(ordinal - previous)
+        previous = ordinal
+    return deltas
+
+
+def encode_bitmap(ordinals, size):
+    bitmap = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        bitmap[ordinal >> 3] |= 1 << (ordinal & 7)
+    return base64.b64encode(bytes(bitmap)).decode('ascii')
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+class SearchIndexBuilder:
+    """
+    목록 순서대로 add()한 채용공고로 색인 파일을 만듦
+
+    job은 build_static.py의 dict (id, title, company, location, description,
+    job_type, created_at). detail_path는 docs/ 기준 상세 페이지 경로.
+    """
+
+    def __init__(self):
+        self._postings = defaultdict(list)
+        self._facets = {'location': defaultdict(list), 'type': defaultdict(list)}
+        self._docs = []
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, job, detail_path):
+        ordinal = len(self._docs)
+        terms = set()
+        for column in FTS_COLUMNS:
+            terms.update(tokenize(job.get(column)))
+        for term in terms:
+            self._postings[term].append(ordinal)
+
+        location = location_facet(job.get('location'))
+        if location:
+            self._facets['location'][location].append(ordinal)
+        job_type = job.get('job_type') or ''
+        if job_type:
+            self._facets['type'][job_type].append(ordinal)
+
+        description = ' '.join((job.get('description') or '').split())
+        if len(description) > SNIPPET_LENGTH:
+            description = description[:SNIPPET_LENGTH].rstrip() + '…'
+        self._docs.append([detail_path, job['title'], job['company'], job.get('location') or '',
+                           job_type, job.get('created_at') or '', description])
+
+    def files(self, name_for):
+        """
+        {docs 기준 경로: bytes} 반환
+
+        name_for(stem, data) -> 파일 이름. 내용 해시를 넣어 두면 meta.json 외의
+        파일은 브라우저가 재검증 없이 캐시할 수 있음.
+        """
+        output = {}
+
+        def emit(stem, value):
+            data = _dumps(value)
+            name = name_for(stem, data)
+            output[f'{INDEX_DIR}/{name}'] = data
+            return name
+
+        shards = shard_terms({term: encode_postings(ordinals) for term, ordinals in self._postings.items()})
+        shard_files = {prefix: emit(f'terms-{_shard_stem(prefix)}', terms)
+                       for prefix, terms in sorted(shards.items())}
+
+        size = len(self._docs)
+        facets = {
+            name: {value: encode_bitmap(ordinals, size) for value, ordinals in values.items()}
+            for name, values in self._facets.items()
+        }
+        facet_file = emit('facets', facets)
+
+        doc_files = [
+            emit(f'docs-{start // DOCS_PER_CHUNK}', self._docs[start:start + DOCS_PER_CHUNK])
+            for start in range(0, size, DOCS_PER_CHUNK)
+        ]
+
+        meta = {
+            'version': INDEX_VERSION,
+            'count': size,
+            'docsPerChunk': DOCS_PER_CHUNK,
+            'shards': shard_files,
+            'facets': facet_file,
+            'facetValues': {
+                name: sorted(values, key=lambda value: (-len(values[value]), value))
+                for name, values in self._facets.items()
+            },
+            'docs': doc_files,
+        }
+        output[f'{INDEX_DIR}/meta.json'] = _dumps(meta)
+        return output
@@ -0,0 +1,281 @@
+// 정적 사이트(docs/jobs.html) 채용공고 검색
+// build_static.py가 만든 search/ 색인(search_index.py)을 필요한 만큼만 가져와서 검색
+
+(function() {
+    const RESULTS_PER_PAGE = 50;
+    // job_search.tokenize와 같은 규칙: 한글 run은 2-gram, 그 외는 소문자 단어
+    const TOKEN_RE = /[가-힣ㄱ-ㆎ]+|(?:(?![가-힣ㄱ-ㆎ])[\p{L}\p{N}])+/gu;
+    const HANGUL_RE = /^[가-힣ㄱ-ㆎ]/;
+    // search_index.MAX_PREFIX_LENGTH
+    const MAX_PREFIX_LENGTH = 8;
+
+    let root = null;
+    let metaPromise = null;
+    const files = {};
+    let original = null;
+    let results = [];
+    let shown = 0;
+    let searchId = 0;
+
+    function fetchJson(name, options) {
+        if (!files[name]) {
+            files[name] = fetch(root + name, options).then(response => {
+                if (!response.ok) {
+                    throw new Error(name + ': ' + response.status);
+                }
+                return response.json();
+            });
+        }
+        return files[name];
+    }
+
+    function loadMeta() {
+        if (!metaPromise) {
+            // meta.json만 매번 재검증, 나머지 파일은 이름에 내용 해시가 들어 있음
+            metaPromise = fetchJson('meta.json', {cache: 'no-cache'});
+        }
+        return metaPromise;
+    }
+
+    // search_index.shard_for와 같아야 함: meta.shards 접두어 중 term의 가장 긴 접두어 (코드포인트 단위)
+    function shardFor(meta, term) {
+        const chars = Array.from(term);
+        for (let length = Math.min(chars.length, MAX_PREFIX_LENGTH); length > 0; length--) {
+            const prefix = chars.slice(0, length).join('');
+            if (meta.shards[prefix]) {
+                return prefix;
+            }
+        }
+        return null;
+    }
+
+    function decodePostings(deltas) {
+        const ordinals = new Array(deltas.length);
+        let previous = 0;
+        for (let i = 0; i < deltas.length; i++) {
+            previous += deltas[i];
+            ordinals[i] = previous;
+        }
+        return ordinals;
+    }
+
+    function decodeBitmap(encoded) {
+        const binary = atob(encoded);
+        const bitmap = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bitmap[i] = binary.charCodeAt(i);
+        }
+        return bitmap;
+    }
+
+    function intersect(a, b) {
+        const out = [];
+        let i = 0;
+        let j = 0;
+        while (i < a.length && j < b.length) {
+            if (a[i] === b[j]) {
+                out.push(a[i]);
+                i++;
+                j++;
+            } else if (a[i] < b[j]) {
+                i++;
+            } else {
+                j++;
+            }
+        }
+        return out;
+    }
+
+    function union(lists) {
+        if (lists.length === 1) {
+            return lists[0];
+        }
+        const merged = new Set();
+        lists.forEach(list => list.forEach(ordinal => merged.add(ordinal)));
+        return Array.from(merged).sort((a, b) => a - b);
+    }
+
+    async function loadShard(meta, key) {
+        const name = key === null ? null : meta.shards[key];
+        return name ? fetchJson(name) : {};
+    }
+
+    // 검색어 한 덩어리(run)에 맞는 문서 번호 목록
+    async function matchRun(meta, run) {
+        if (HANGUL_RE.test(run) && run.length > 1) {
+            // 연속된 2-gram이 모두 있는 문서 (부분 문자열 검색)
+            let matched = null;
+            for (let i = 0; i < run.length - 1; i++) {
+                const term = run.slice(i, i + 2);
+                const shard = await loadShard(meta, shardFor(meta, term));
+                const ordinals = shard[term] ? decodePostings(shard[term]) : [];
+                matched = matched === null ? ordinals : intersect(matched, ordinals);
+                if (!matched.length) {
+                    break;
+                }
+            }
+            return matched;
+        }
+        // 접두 검색: run의 샤드 + run보다 긴 접두어로 나뉜 샤드들
+        const keys = new Set(Object.keys(meta.shards).filter(key => key.startsWith(run)));
+        keys.add(shardFor(meta, run));
+        keys.delete(null);
+        const shards = await Promise.all(Array.from(keys, key => loadShard(meta, key)));
+        const lists = [];
+        shards.forEach(shard => Object.keys(shard)
+            .filter(term => term.startsWith(run))
+            .forEach(term => lists.push(decodePostings(shard[term]))));
+        return lists.length ? union(lists) : [];
+    }
+
+    async function runSearch(query, location, type) {
+        const meta = await loadMeta();
+        const runs = query.toLowerCase().match(TOKEN_RE) || [];
+        let matched = null;
+        for (const run of runs) {
+            const ordinals = await matchRun(meta, run);
+            matched = matched === null ? ordinals : intersect(matched, ordinals);
+            if (!matched.length) {
+                return [];
+            }
+        }
+        if (matched === null) {
+            matched = Array.from({length: meta.count}, (_, i) => i);
+        }
+
+        const filters = [];
+        if (location || type) {
+            const facets = await fetchJson(meta.facets);
+            [['location', location], ['type', type]].forEach(([name, value]) => {
+                if (value) {
+                    const encoded = (facets[name] || {})[value];
+                    filters.push(encoded ? decodeBitmap(encoded) : new Uint8Array(0));
+                }
+            });
+        }
+        return matched.filter(ordinal => filters.every(
+            bitmap => (bitmap[ordinal >> 3] || 0) & (1 << (ordinal & 7))
+        ));
+    }
+
+    function escapeHtml(value) {
+        return String(value).replace(/[&<>"']/g, ch => ({
+            '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+        })[ch]);
+    }
+
+    function renderCard(doc) {
+        const [path, title, company, location, type, createdAt, snippet] = doc;
+        const badge = type
+            ? `<span class="badge bg-${type === '정규직' ? 'success' : 'info'}">${escapeHtml(type)}</span>`
+            : '';
+        return `
+            <div class="col-md-6 job-item">
+                <div class="job-card border rounded-3 p-4 shadow-sm h-100">
+                    <div class="d-flex justify-content-between align-items-start mb-3">
+                        <h5 class="mb-0"><a href="${escapeHtml(path)}" class="text-decoration-none text-dark">${escapeHtml(title)}</a></h5>
+                        ${badge}
+                    </div>
+                    <p class="text-muted mb-3">
+                        <i class="fas fa-building me-1"></i>${escapeHtml(company)}
+                        <span class="mx-2">•</span>
+                        <i class="fas fa-map-marker-alt me-1"></i>${escapeHtml(location)}
+                    </p>
+                    <p class="mb-3">${escapeHtml(snippet)}</p>
+                    <small class="text-muted"><i class="fas fa-calendar me-1"></i>${escapeHtml(createdAt)}</small>
+                </div>
+            </div>`;
+    }
+
+    async function showMore() {
+        const meta = await loadMeta();
+        const page = results.slice(shown, shown + RESULTS_PER_PAGE);
+        const chunks = {};
+        for (const ordinal of page) {
+            const chunk = Math.floor(ordinal / meta.docsPerChunk);
+            if (!chunks[chunk]) {
+                chunks[chunk] = await fetchJson(meta.docs[chunk]);
+            }
+        }
+        const html = page.map(ordinal => {
+            const chunk = Math.floor(ordinal / meta.docsPerChunk);
+            return renderCard(chunks[chunk][ordinal % meta.docsPerChunk]);
+        }).join('');
+        document.getElementById('jobsList').insertAdjacentHTML('beforeend', html);
+        shown += page.length;
+        document.getElementById('jobsMore').classList.toggle('d-none', shown >= results.length);
+    }
+
+    async function filterJobs() {
+        const query = document.getElementById('searchInput').value.trim();
+        const location = document.getElementById('locationFilter').value;
+        const type = document.getElementById('typeFilter').value;
+        const list = document.getElementById('jobsList');
+        const pagination = document.getElementById('jobsPagination');
+        const status = document.getElementById('jobsSearchStatus');
+        if (original === null) {
+            original = list.innerHTML;
+        }
+
+        if (!query && !location && !type) {
+            // 조건이 없으면 원래 목록 페이지로 복원
+            searchId++;
+            list.innerHTML = original;
+            pagination.classList.remove('d-none');
+            status.classList.add('d-none');
+            document.getElementById('jobsMore').classList.add('d-none');
+            return;
+        }
+
+        const current = ++searchId;
+        let matched;
+        try {
+            matched = await runSearch(query, location, type);
+        } catch (error) {
+            console.error(error);
+            status.textContent = '검색 색인을 불러오지 못했습니다.';
+            status.classList.remove('d-none');
+            return;
+        }
+        if (current !== searchId) {
+            return;  // 더 최근 입력의 검색이 진행 중
+        }
+        results = matched;
+        shown = 0;
+        list.innerHTML = '';
+        pagination.classList.add('d-none');
+        status.textContent = `검색 결과 ${results.length}건`;
+        status.classList.remove('d-none');
+        await showMore();
+    }
+
+    function fillOptions(select, values) {
+        const selected = select.value;
+        select.length = 1;  // '전체' 옵션만 남김
+        values.forEach(value => select.add(new Option(value, value)));
+        select.value = selected;
+    }
+
+    document.addEventListener('DOMContentLoaded', function() {
+        const container = document.getElementById('jobSearch');
+        if (!container) {
+            return;
+        }
+        root = container.dataset.index;
+        let timer = null;
+        document.getElementById('searchInput').addEventListener('input', function() {
+            clearTimeout(timer);
+            timer = setTimeout(filterJobs, 150);
+        });
+        document.getElementById('locationFilter').addEventListener('change', filterJobs);
+        document.getElementById('typeFilter').addEventListener('change', filterJobs);
+        document.getElementById('jobsMore').addEventListener('click', showMore);
+        // 필터 선택지는 실제 데이터 기준으로 채움 (meta.json은 작음)
+        loadMeta().then(meta => {
+            fillOptions(document.getElementById('locationFilter'), meta.facetValues.location || []);
+            fillOptions(document.getElementById('typeFilter'), meta.facetValues.type || []);
+        }).catch(error => console.error(error));
+    });
+
+    window.filterJobs = filterJobs;
+})();
@@ -0,0 +1,72 @@
+import shutil
+import subprocess
+
+import pytest
+
+import assets
+
+SOURCE = """const re = /'/g;
+const url = 'https://example.com'; // 주석
+const escape = s => s.replace(/[&<>"']/g, c => '&#' + c.charCodeAt(0) + ';');
+/* 블록 주석 */
+const slash = 10 / 2 / 5;
+const html = `
+    <li>
+        ${url} // 템플릿 안의 문자열
+    </li>`;
+"""
+PRINT = "\nconsole.log(JSON.stringify([re.source, url, escape('<\"&>'), slash, html]));"
+
+
+def run_node(source):
+    result = subprocess.run(
+        ['node', '-e', source + PRINT],
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout
+
+
+def test_minify_js_keeps_regex_and_template_literals():
+    minified = assets.minify_js(SOURCE)
+    assert "/'/g" in minified
+    assert "'https://example.com'" in minified
+    assert """/[&<>"']/g""" in minified
+    assert '\n    <li>\n        ${url} // 템플릿 안의 문자열\n    </li>`' in minified
+
+
+@pytest.mark.skipif(assets.rjsmin is None, reason='rjsmin 없음 (최소화하지 않음)')
+def test_minify_js_removes_comments():
+    minified = assets.minify_js(SOURCE)
+    assert '// 주석' not in minified
+    assert '블록 주석' not in minified
+    assert len(minified) < len(SOURCE)
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node 없음')
+def test_minify_js_same_behaviour():
+    assert run_node(assets.minify_js(SOURCE)) == run_node(SOURCE)
+
+
+def test_minify_js_shipped_script_parses():
+    if shutil.which('node') is None:
+        pytest.skip('node 없음')
+    with open('static/js/job-search.js', encoding='utf-8') as f:
+        minified = assets.minify_js(f.read())
+    subprocess.run(['node', '--check', '-'], input=minified, text=True, check=True)
+
+
+def test_only_current_version_is_immutable(tmp_path):
+    from app import create_app
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                      'PAGE_CACHE_ENABLED': False, 'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False})
+    client = app.test_client()
+    with app.test_request_context():
+        current = assets.StaticAssets().file_hash('js/job-search.js')
+
+    response = client.get(f'/static/js/job-search.js?v={current}')
+    assert 'immutable' in response.headers['Cache-Control']
+    for stale in ('0123456789', 'typo'):
+        response = client.get(f'/static/js/job-search.js?v={stale}')
+        assert response.status_code == 200
+        assert 'immutable' not in response.headers.get('Cache-Control', '')
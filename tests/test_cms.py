@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+from CAPSA import AdminCMS, Announcement, JobPost
+from cms_store import PersistentCMS
+
+START = datetime(2024, 1, 1)
+
+
+def make_cms(count=6, cms=None):
+    cms = cms or AdminCMS()
+    for i in range(count):
+        cms.create_job(JobPost(f'Engineer {i}', f'Company {i % 2}', 'SF', f'https://example.com/{i}',
+                               'desc', START + timedelta(days=i)))
+    return cms
+
+
+def test_update_job_after_mutating_record():
+    cms = make_cms()
+    job = cms.job_posts.get(3)
+    job.location = 'Seoul'
+    job.posted_at = START + timedelta(days=100)
+    cms.update_job(3, job)
+
+    assert 3 not in [j.id for j in cms.find_jobs({'location': 'SF'})]
+    assert [j.id for j in cms.find_jobs({'location': 'Seoul'})] == [3]
+    ids = [j.id for j in cms.find_jobs()]
+    assert ids == [3, 6, 5, 4, 2, 1]
+
+
+def test_update_job_after_mutating_record_on_snapshot(tmp_path):
+    # 스냅샷(기반 테이블)에 있던 레코드 -> overlay로 옮겨진 뒤 다시 수정
+    cms = make_cms(cms=PersistentCMS(str(tmp_path)))
+    cms.compact()
+    job = cms.job_posts.get(2)
+    job.location = 'Seoul'
+    cms.update_job(2, job)
+    job = cms.job_posts.get(2)
+    job.location = 'Busan'
+    job.posted_at = START - timedelta(days=1)
+    cms.update_job(2, job)
+
+    assert 2 not in [j.id for j in cms.find_jobs({'location': ['SF', 'Seoul']})]
+    assert [j.id for j in cms.find_jobs({'location': 'Busan'})] == [2]
+    ids = [j.id for j in cms.find_jobs()]
+    assert ids == [6, 5, 4, 3, 1, 2]
+    cms.close()
+
+
+def test_update_announcement_after_mutating_record():
+    cms = AdminCMS()
+    for i in range(4):
+        cms.create_announcement(Announcement(f'공지 {i}', '내용', posted_at=START + timedelta(days=i)))
+    announcement = cms.announcements.get(1)
+    announcement.pinned = True
+    announcement.posted_at = START + timedelta(days=10)
+    cms.update_announcement(1, announcement)
+
+    assert [a.id for a in cms.announcements.query({'pinned': False})] == [2, 3, 4]
+    assert [a.id for a in cms.announcements.query(order_by='posted_at')] == [2, 3, 4, 1]
+    assert [a.id for a in cms.bulletin.top()] == [1, 4, 3, 2]
@@ -0,0 +1,121 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from expert_match import MatchIndex, _document  # noqa: E402
+
+WORDS = ['python', 'django', 'react', 'sales', 'marketing', 'design', 'data', 'ml', 'cloud', 'startup',
+         '투자', '마케팅', '개발', '디자인']
+HELP_TYPES = ['Mentoring', 'Technical', 'Funding', 'Networking']
+
+
+def random_document(rng):
+    text = ' '.join(rng.choice(WORDS) for _ in range(rng.randrange(1, 12)))
+    return _document(text, rng.sample(HELP_TYPES, rng.randrange(0, 3)), rng.choice(['CTO', 'Founder', '']))
+
+
+def brute_force(experts, query, k):
+    """전문가 문서만으로 IDF를 계산한 코사인 top-k (MatchIndex와 같은 평활화)"""
+    df = {}
+    for weights in experts.values():
+        for term in weights:
+            df[term] = df.get(term, 0) + 1
+    idf = {term: math.log((1.0 + len(experts)) / (1.0 + n)) + 1.0 for term, n in df.items()}
+    query = {term: weight * idf[term] for term, weight in query.items() if term in idf}
+    query_norm = math.sqrt(sum(weight * weight for weight in query.values()))
+    scores = {}
+    for expert_id, weights in experts.items():
+        vector = {term: weight * idf[term] for term, weight in weights.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        dot = sum(weight * vector.get(term, 0.0) for term, weight in query.items())
+        if norm and query_norm and dot > 0:
+            scores[expert_id] = dot / (norm * query_norm)
+    return sorted(scores.items(), key=lambda item: -item[1])[:k]
+
+
+def assert_same_top(index, experts, query, k=5):
+    ranked = index.top_experts(weights=query, k=k)
+    expected = brute_force(experts, query, k)
+    assert [score for _, score in ranked] == pytest.approx([score for _, score in expected])
+    # 동점은 순서가 다를 수 있으므로 점수로 비교하고, 각 전문가의 점수도 확인
+    scores = dict(brute_force(experts, query, len(experts)))
+    for expert_id, score in ranked:
+        assert scores[expert_id] == pytest.approx(score)
+
+
+def test_top_k_matches_brute_force_cosine():
+    rng = random.Random(0)
+    index = MatchIndex()
+    experts = {expert_id: random_document(rng) for expert_id in range(1, 60)}
+    for expert_id, weights in experts.items():
+        index.add_expert(expert_id, weights)
+    # 같은 전문가를 다시 넣으면 교체
+    experts[7] = random_document(rng)
+    index.add_expert(7, experts[7])
+
+    assert len(index) == len(experts)
+    for _ in range(20):
+        assert_same_top(index, experts, random_document(rng))
+    assert index.top_experts(weights={'없는용어': 1.0}) == []
+
+
+def test_deactivated_experts_are_dropped_and_rows_compacted():
+    rng = random.Random(1)
+    index = MatchIndex()
+    experts = {expert_id: random_document(rng) for expert_id in range(1, 21)}
+    for expert_id, weights in experts.items():
+        index.add_expert(expert_id, weights)
+
+    for expert_id in range(1, 11):
+        assert index.remove_expert(expert_id)
+        del experts[expert_id]
+    assert not index.remove_expert(1)
+    assert len(index._row_experts) == 20  # 아직 절반 이하는 빈 자리로 둠
+    for _ in range(10):
+        query = random_document(rng)
+        assert all(expert_id > 10 for expert_id, _ in index.top_experts(weights=query, k=20))
+        assert_same_top(index, experts, query)
+
+    assert index.remove_expert(11)
+    del experts[11]
+    assert len(index._row_experts) == len(experts) == 9
+    for _ in range(10):
+        assert_same_top(index, experts, random_document(rng))
+
+
+def test_late_committed_expert_below_watermark_is_picked_up(tmp_path):
+    from app import Expert, StakeholderRequest, create_app, db, ensure_schema, expert_matching
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                      'PAGE_CACHE_ENABLED': False, 'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False})
+    now = datetime.utcnow()
+
+    def expert(i, expertise, updated_at):
+        return Expert(id=i, name=f'Expert {i}', email=f'e{i}@example.com', company='Acme', role='CTO',
+                      expertise=expertise, help_types='Technical', active=True, updated_at=updated_at)
+
+    with app.test_request_context():
+        ensure_schema()
+        db.session.add_all([expert(1, 'react frontend design', now), expert(3, 'sales marketing', now)])
+        db.session.add(StakeholderRequest(id=1, name='Kim', email='k@example.com', company='c', role='CEO',
+                                          help_type='Technical', description='python django backend'))
+        db.session.commit()
+        assert 2 not in [e.id for e, _ in expert_matching.candidates(1)]
+        mark = app.extensions['expert_matching']['expert_mark']
+
+        # 다른 워커의 트랜잭션이 워터마크보다 이른 updated_at, 더 작은 id로 늦게 커밋됨
+        db.session.add(expert(2, 'python django backend', mark - timedelta(seconds=10)))
+        db.session.commit()
+
+        ranked = expert_matching.candidates(1)
+        assert ranked[0][0].id == 2
+        assert app.extensions['expert_matching']['expert_mark'] == mark
+
+        # 비활성화도 다음 조회 때 반영
+        db.session.get(Expert, 2).active = False
+        db.session.commit()
+        assert 2 not in [e.id for e, _ in expert_matching.candidates(1)]
@@ -0,0 +1,67 @@
+import json
+
+from app import JobPost, create_app, db
+
+
+def make_client(tmp_path):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                      'PAGE_CACHE_DIR': str(tmp_path / 'page_cache'),
+                      'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False})
+    client = app.test_client()
+    client.get('/')
+    with client.session_transaction() as session:
+        session['admin'] = True
+    return app, client
+
+
+def job_line(i):
+    return json.dumps({'title': f'Engineer {i}', 'company': 'Acme', 'location': 'Seoul',
+                       'apply_url': f'https://example.com/{i}', 'description': 'desc'}).encode() + b'\n'
+
+
+def test_import_reports_committed_rows_on_decode_error(tmp_path):
+    app, client = make_client(tmp_path)
+    body = b''.join(job_line(i) for i in range(5)) + b'{"title": "\xff"}\n' + job_line(99)
+
+    response = client.post('/admin/api/jobs/import?format=jsonl', data=body,
+                           content_type='application/x-ndjson')
+
+    assert response.status_code == 400
+    report = response.get_json()
+    assert report['inserted'] == 5
+    assert report['aborted']['line'] == 6
+    with app.app_context():
+        assert db.session.query(JobPost).count() == 5
+
+
+def test_import_csv_with_bom(tmp_path):
+    app, client = make_client(tmp_path)
+    body = ('﻿title,company,location,apply_url,description\r\n'
+            '개발자,Acme,Seoul,https://example.com/1,"여러 줄\r\n설명"\r\n').encode()
+
+    response = client.post('/admin/api/jobs/import?format=csv', data=body, content_type='text/csv')
+
+    assert response.status_code == 200
+    assert response.get_json()['inserted'] == 1
+    with app.app_context():
+        assert db.session.query(JobPost).one().description == '여러 줄\r\n설명'
+
+
+def test_cli_import_invalidates_running_server_cache(tmp_path):
+    from app import create_app
+
+    config = {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+              'PAGE_CACHE_DIR': str(tmp_path / 'page_cache'), 'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False}
+    web = create_app(config).test_client()
+    web.get('/jobs')
+    assert web.get('/jobs').headers['X-Cache'] == 'HIT'
+
+    path = tmp_path / 'jobs.jsonl'
+    path.write_bytes(job_line(1))
+    result = create_app(config).test_cli_runner().invoke(args=['import-jobs', str(path)])
+    assert result.exit_code == 0, result.output
+    assert '페이지 캐시 무효화' in result.output
+
+    response = web.get('/jobs')
+    assert response.headers['X-Cache'] == 'MISS'
+    assert 'Engineer 1' in response.get_data(as_text=True)
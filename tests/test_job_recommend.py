@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from job_recommend import RecommendationIndex, build, current_version, save  # noqa: E402
+
+
+def test_added_job_in_batch_id_gap(tmp_path):
+    rows = [
+        (1, 'python backend', 'python django backend engineer', 'remote'),
+        (2, 'react frontend', 'react typescript frontend', 'seoul'),
+        (4, 'sales manager', 'enterprise sales manager', 'busan'),
+    ]
+    arrays, meta = build(rows, k=3)
+    save(str(tmp_path), arrays, meta)
+    index = RecommendationIndex(os.path.join(str(tmp_path), current_version(str(tmp_path))))
+
+    # 배치 이후 커밋된 공고가 배치의 빈 id(3)를 받은 경우
+    assert index.add_job(3, 'python backend', 'python django backend engineer', 'seoul')
+    assert index.add_job(5, 'python backend', 'python django backend engineer', 'seoul')
+
+    similar = dict(index.similar(5))
+    # 3은 내용과 위치가 모두 같음 (4의 위치로 잘못 읽으면 위치가 다른 1과 같은 점수)
+    assert similar[3] == pytest.approx(1.0)
+    assert similar[1] < 0.9
+    assert 5 in dict(index.similar(3))
+
+
+def test_sync_picks_up_jobs_committed_below_a_local_add(tmp_path):
+    from app import JobPost, create_app, db, ensure_schema, job_recommender
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                      'PAGE_CACHE_DIR': str(tmp_path / 'page_cache'),
+                      'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False,
+                      'JOB_RECOMMEND_PATH': str(tmp_path / 'recommend')})
+
+    def job(i, text):
+        return JobPost(id=i, title=text, company='Acme', location='Seoul', apply_url=f'https://example.com/{i}',
+                       description=f'{text} {text} engineer')
+
+    with app.test_request_context():
+        ensure_schema()
+        words = ['python backend', 'react frontend', 'sales manager', 'data analyst', 'product designer']
+        db.session.add_all([job(i, words[i % len(words)]) for i in range(1, 31)])
+        db.session.commit()
+        job_recommender.build(k=5)
+        assert job_recommender.similar(1, 5)
+
+        # 다른 워커/import-jobs가 31~33을 커밋하기 전에 이 워커가 34를 등록하고 바로 반영
+        db.session.add(job(34, 'python backend'))
+        db.session.commit()
+        job_recommender.add(db.session.get(JobPost, 34))
+        db.session.add_all([job(31, 'python backend'), job(32, 'react frontend'), job(33, 'sales manager')])
+        db.session.commit()
+
+        app.extensions['job_recommender']['checked_at'] = None
+        assert 34 in [other.id for other, _ in job_recommender.similar(31, 5)]
+        assert job_recommender.similar(33, 5)
+        index = app.extensions['job_recommender']['index']
+        assert index.synced_job_id == 34
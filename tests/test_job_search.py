@@ -0,0 +1,69 @@
+import pytest
+
+import job_search
+from app import JobPost, create_app, db
+
+LOCATIONS = ['Seoul, Korea', 'San Francisco, CA', 'Remote', '대한민국 서울 강남구']
+
+
+@pytest.fixture(params=[True, False], ids=['fts5', 'like'])
+def client(request, tmp_path, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(job_search, 'is_supported', lambda connection: False)
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                      'PAGE_CACHE_ENABLED': False, 'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False})
+    client = app.test_client()
+    client.get('/')
+    with app.app_context():
+        db.session.add_all([
+            JobPost(title=f'Backend Engineer {i}', company='Acme', location=location,
+                    apply_url=f'https://example.com/{i}', description='python')
+            for i, location in enumerate(LOCATIONS)
+        ])
+        db.session.commit()
+    return client
+
+
+def api_locations(client, **params):
+    response = client.get('/api/jobs', query_string=dict(params, fields='location'))
+    return sorted(job['location'] for job in response.get_json()['items'])
+
+
+@pytest.mark.parametrize('location, expected', [
+    ('Korea', ['Seoul, Korea']),
+    ('seoul', ['Seoul, Korea']),
+    ('Francisco', ['San Francisco, CA']),
+    ('san francisco', ['San Francisco, CA']),
+    ('서울', ['대한민국 서울 강남구']),
+    ('', sorted(LOCATIONS)),
+])
+def test_location_filter_matches_inside_location(client, location, expected):
+    assert api_locations(client, location=location) == expected
+
+
+def test_location_filter_with_query(client):
+    body = client.get('/jobs', query_string={'q': 'backend', 'location': 'Korea'}).get_data(as_text=True)
+    assert 'Seoul, Korea' in body
+    assert 'San Francisco, CA' not in body
+    body = client.get('/jobs', query_string={'location': 'Francisco'}).get_data(as_text=True)
+    assert 'San Francisco, CA' in body
+    assert 'Seoul, Korea' not in body
+
+
+def test_fts5_support_checked_once_per_engine(tmp_path):
+    from sqlalchemy import create_engine, event
+
+    engine = create_engine(f'sqlite:///{tmp_path}/fts.db')
+    checks = []
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if 'sqlite_compileoption_used' in statement:
+            checks.append(statement)
+
+    with engine.connect() as connection:
+        results = [job_search.is_supported(connection) for _ in range(5)]
+    with engine.connect() as connection:
+        results.append(job_search.is_supported(connection))
+    assert len(set(results)) == 1
+    assert len(checks) == 1
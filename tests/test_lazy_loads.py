@@ -0,0 +1,51 @@
+import pytest
+
+from app import JobPost, create_app, db, ensure_schema, lazy_loads
+from lazy_loads import LazyLoadError
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                      'PAGE_CACHE_ENABLED': False, 'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False})
+
+    @app.route('/_expired_titles')
+    def expired_titles():
+        jobs = JobPost.query.all()
+        db.session.commit()  # 커밋하면 읽은 객체가 모두 만료됨
+        return ', '.join(job.title for job in jobs)
+
+    with app.app_context():
+        ensure_schema()
+        db.session.add_all([JobPost(title=f'Engineer {i}', company='Acme', location='Seoul',
+                                    apply_url=f'https://example.com/{i}', description='desc') for i in range(10)])
+        db.session.commit()
+    return app
+
+
+def test_track_counts_expired_column_reloads(app):
+    with app.app_context():
+        jobs = JobPost.query.all()
+        with lazy_loads.track() as counts:
+            assert all(job.title for job in jobs)
+        assert counts == {}
+
+        db.session.commit()
+        with lazy_loads.track() as counts:
+            assert all(job.title for job in jobs)
+        assert counts == {'JobPost (컬럼)': 10}
+        assert lazy_loads.offenders(counts) == {'JobPost (컬럼)': 10}
+        assert lazy_loads.offenders({'JobPost (컬럼)': 4}) == {}
+
+
+def test_request_raises_under_testing(app):
+    assert app.extensions['lazy_load_detector']['raise_errors']
+    with pytest.raises(LazyLoadError, match='JobPost \\(컬럼\\) 10회'):
+        app.test_client().get('/_expired_titles')
+
+
+def test_request_only_logs_when_raise_is_off(app, caplog):
+    app.extensions['lazy_load_detector']['raise_errors'] = False
+    response = app.test_client().get('/_expired_titles')
+    assert response.status_code == 200
+    assert 'N+1 의심 GET /_expired_titles: JobPost (컬럼) 10회' in caplog.text
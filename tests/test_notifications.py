@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+
+import pytest
+
+from app import NotificationOutbox, StakeholderRequest, create_app, db, notifications
+from notifications import STATUS_FAILED, STATUS_PENDING, STATUS_SENDING, STATUS_SENT, stakeholder_request_message
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                      'PAGE_CACHE_ENABLED': False, 'NOTIFY_WORKER': 'off', 'METRICS_ENABLED': False,
+                      'MAIL_BACKEND': 'memory', 'NOTIFY_MAX_ATTEMPTS': 2})
+    app.test_client().get('/')
+    with app.app_context():
+        yield app
+
+
+def outbox():
+    db.session.expire_all()
+    return db.session.execute(db.select(NotificationOutbox).order_by(NotificationOutbox.id)).scalars().all()
+
+
+def test_subject_collapses_newlines_in_name():
+    request_obj = StakeholderRequest(name='Kim\r\nBcc: x@example.com  Lee', email='a@example.com', company='c',
+                                     role='r', help_type='Other', description='d')
+    subject, _ = stakeholder_request_message(request_obj)
+    assert subject == '[CAPSA] 새로운 전문가 연결 요청: Kim Bcc: x@example.com Lee'
+    EmailMessage()['Subject'] = subject
+
+
+def test_delivery_digests_messages_per_recipient(app):
+    notifications.notify_admin('first', 'body 1')
+    notifications.notify_admin('second', 'body 2')
+    notifications.enqueue('other@example.com', 'third', 'body 3')
+    db.session.commit()
+
+    assert notifications.drain() == 3
+    sent = notifications.mailer().sent
+    assert sorted(mail['recipient'] for mail in sent) == ['admin@capsa.local', 'other@example.com']
+    digest = next(mail for mail in sent if mail['recipient'] == 'admin@capsa.local')
+    assert digest['subject'] == '[CAPSA] 새 알림 2건'
+    assert 'body 1' in digest['body'] and 'body 2' in digest['body']
+    assert {message.status for message in outbox()} == {STATUS_SENT}
+
+
+def test_retry_with_backoff_then_fail(app):
+    mailer = notifications.mailer()
+    mailer.fail_times = 1
+    notifications.notify_admin('subject', 'body')
+    db.session.commit()
+
+    assert notifications.drain() == 1
+    message, = outbox()
+    assert (message.status, message.attempts) == (STATUS_PENDING, 1)
+    assert message.next_attempt_at > datetime.utcnow() + timedelta(seconds=20)
+    assert 'simulated failure' in message.last_error
+    # 백오프 중에는 다시 가져가지 않음
+    assert notifications.drain() == 0
+
+    message.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+    assert notifications.drain() == 1
+    message, = outbox()
+    assert (message.status, message.attempts, message.last_error) == (STATUS_SENT, 2, None)
+    assert len(mailer.sent) == 1
+
+    mailer.fail_times = 2
+    notifications.notify_admin('again', 'body')
+    db.session.commit()
+    notifications.drain()
+    failed = outbox()[1]
+    failed.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+    notifications.drain()
+    assert (outbox()[1].status, outbox()[1].attempts) == (STATUS_FAILED, 2)
+
+
+def test_expired_lease_is_claimed_again(app):
+    now = datetime.utcnow()
+    db.session.add_all([
+        # 워커가 발송 중에 죽어서 임대 시간이 지난 메시지
+        NotificationOutbox(recipient='a@example.com', subject='expired', body='b', status=STATUS_SENDING,
+                           attempts=0, next_attempt_at=now - timedelta(seconds=1)),
+        # 다른 워커가 아직 발송 중인 메시지
+        NotificationOutbox(recipient='b@example.com', subject='leased', body='b', status=STATUS_SENDING,
+                           attempts=0, next_attempt_at=now + timedelta(seconds=300)),
+    ])
+    db.session.commit()
+
+    assert notifications.drain() == 1
+    assert [mail['subject'] for mail in notifications.mailer().sent] == ['expired']
+    assert [message.status for message in outbox()] == [STATUS_SENT, STATUS_SENDING]
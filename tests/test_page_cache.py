@@ -0,0 +1,40 @@
+import time
+
+from app import JobPost, create_app, db, page_cache
+
+
+def make_app(tmp_path, **config):
+    return create_app(dict({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/capsa.db', 'TESTING': True,
+                            'PAGE_CACHE_DIR': str(tmp_path / 'page_cache'), 'NOTIFY_WORKER': 'off',
+                            'METRICS_ENABLED': False}, **config))
+
+
+def test_invalidation_reaches_other_processes(tmp_path):
+    # 같은 DB/캐시 디렉터리를 쓰는 두 워커 (또는 웹 서버와 flask import-jobs)
+    web, other = make_app(tmp_path), make_app(tmp_path)
+    client = web.test_client()
+    assert client.get('/jobs').headers['X-Cache'] == 'MISS'
+    assert client.get('/jobs').headers['X-Cache'] == 'HIT'
+
+    with other.app_context():
+        db.session.add(JobPost(title='Backend Engineer', company='Acme', location='Seoul',
+                               apply_url='https://example.com/1', description='desc'))
+        db.session.commit()
+        page_cache.invalidate('jobs')
+
+    response = client.get('/jobs')
+    assert response.headers['X-Cache'] == 'MISS'
+    assert 'Backend Engineer' in response.get_data(as_text=True)
+
+
+def test_memory_backend_entries_expire(tmp_path, monkeypatch):
+    app = make_app(tmp_path, PAGE_CACHE_BACKEND='memory')
+    assert app.config['PAGE_CACHE_MAX_AGE'] == 30
+    client = app.test_client()
+    client.get('/jobs')
+    assert client.get('/jobs').headers['X-Cache'] == 'HIT'
+
+    # 다른 워커의 무효화는 이 프로세스에 닿지 않으므로 PAGE_CACHE_MAX_AGE가 지나면 다시 렌더링
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 31)
+    assert client.get('/jobs').headers['X-Cache'] == 'MISS'
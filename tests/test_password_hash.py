@@ -0,0 +1,28 @@
+import pytest
+from flask import Flask
+
+from app import Admin, is_password_hash
+
+
+@pytest.mark.parametrize('method, same', [
+    ('scrypt', ['scrypt', 'scrypt:32768:8:1']),
+    ('scrypt:16384:8:1', ['scrypt:16384:8:1']),
+    ('pbkdf2:sha256:600000', ['pbkdf2', 'pbkdf2:sha256', 'pbkdf2:sha256:600000']),
+])
+def test_needs_rehash_compares_parameters(method, same):
+    app = Flask(__name__)
+    with app.app_context():
+        app.config['PASSWORD_HASH_METHOD'] = method
+        admin = Admin(username='admin')
+        admin.set_password('secret')
+        assert is_password_hash(admin.password)
+        for configured in same:
+            app.config['PASSWORD_HASH_METHOD'] = configured
+            assert not admin.needs_rehash(), configured
+        app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:700000'
+        assert admin.needs_rehash()
+
+
+def test_plain_password_is_not_a_hash():
+    assert not is_password_hash('scrypt$not-a-hash')
+    assert not is_password_hash('admin123')
@@ -0,0 +1,61 @@
+import json
+import random
+
+import search_index
+from search_index import MAX_PREFIX_LENGTH, SearchIndexBuilder, shard_for, shard_terms
+
+WORDS = ['python', 'pytest', 'pyramid', 'product', 'react', 'remote', 'engineer', 'p', 'py', 'pyt']
+
+
+def make_postings(count=3000, seed=0):
+    rng = random.Random(seed)
+    postings = {}
+    for word in WORDS:
+        postings[word] = list(range(rng.randrange(1, 50)))
+    for i in range(count):
+        term = rng.choice('pqrs') + ''.join(rng.choice('abcdefghij') for _ in range(rng.randrange(0, 6)))
+        postings[term] = list(range(rng.randrange(1, 20)))
+    for first in '개발자디자이너':
+        for second in '가나다라마바사':
+            postings[first + second] = [1, 2, 3]
+    return postings
+
+
+def test_shards_are_bounded_and_every_term_found():
+    postings = make_postings()
+    shards = shard_terms(postings, max_bytes=4096)
+
+    assert len(shards) > len({term[0] for term in postings})
+    for prefix, terms in shards.items():
+        size = len(search_index._dumps(terms))
+        assert size <= 4096 or len(terms) == 1 or len(prefix) == MAX_PREFIX_LENGTH
+        assert all(term.startswith(prefix) for term in terms)
+    placed = {term: prefix for prefix, terms in shards.items() for term in terms}
+    assert len(placed) == len(postings)
+    for term, prefix in placed.items():
+        assert shard_for(term, shards) == prefix
+
+
+def test_prefix_search_covers_split_shards():
+    postings = make_postings()
+    shards = shard_terms(postings, max_bytes=4096)
+    for run in ('p', 'py', 'pyt', 'pytho', 'qab', 'zzz'):
+        # job-search.js matchRun과 같은 방법: run의 샤드 + run으로 시작하는 접두어 샤드
+        keys = {key for key in shards if key.startswith(run)} | {shard_for(run, shards)}
+        found = {term for key in keys - {None} for term in shards[key] if term.startswith(run)}
+        assert found == {term for term in postings if term.startswith(run)}, run
+
+
+def test_meta_lists_shard_prefixes():
+    builder = SearchIndexBuilder()
+    for i in range(20):
+        builder.add({'id': i, 'title': f'Python engineer {i}', 'company': '카카오', 'location': '서울',
+                     'description': '백엔드 개발'}, f'jobs/job-{i}.html')
+    files = builder.files(lambda stem, data: f'{stem}.json')
+    meta = json.loads(files['search/meta.json'])
+
+    assert meta['shards']['p'] == 'terms-p.json'
+    assert meta['shards']['카'] == 'terms-_ce74.json'
+    for prefix, name in meta['shards'].items():
+        terms = json.loads(files[f'search/{name}'])
+        assert all(shard_for(term, meta['shards']) == prefix for term in terms)